@@ -2,14 +2,22 @@
 # 封装pywinauto库的功能，提供统一的接口给上层使用
 
 from typing import Any, Callable, Dict, List, Optional, Tuple
+import atexit
+import ctypes
+import io
+import os
+import queue
+import threading
 import time
 import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_futures
 import psutil
 from ..core.base_application import BaseApplication
 from ..core.base_window import BaseWindow
 from ..core.base_control import BaseControl
 from ..core.base_operation import BaseOperation
 from .backend_factory import Backend
+from .win_input import SEND_KEYS_SPECIAL, parse_combo, send_unicode_text, send_vk_combo
 from ..config.local_config import local_config
 
 # 尝试导入pywinauto，处理导入错误
@@ -17,7 +25,7 @@ try:
     from pywinauto import Application as PywinautoApp
     from pywinauto.findwindows import find_window, find_windows, ElementNotFoundError
     from pywinauto.keyboard import send_keys, press, release
-    from pywinauto.mouse import click, double_click, right_click, move, drag
+    from pywinauto.mouse import click, double_click, right_click, move, drag, press as mouse_press, release as mouse_release
     from pywinauto.base_wrapper import BaseWrapper
     from pywinauto.controls.uiawrapper import UIAWrapper
     from pywinauto.controls.hwndwrapper import HwndWrapper
@@ -25,6 +33,33 @@ try:
 except ImportError:
     PYWINAUTO_AVAILABLE = False
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# 截图编码线程池，截图后的图片压缩在后台完成
+_screenshot_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="rf-win-screenshot")
+# 待写盘的截图队列，元素为(文件路径, 编码后的字节, Future)，由单个写盘线程依次处理
+_screenshot_write_queue: "queue.Queue[Tuple[str, bytes, Future]]" = queue.Queue()
+# PNG压缩级别，1级的CPU开销约为默认级别的一半，文件体积略大
+PNG_COMPRESS_LEVEL = 1
+# 带持续时间的拖拽每秒移动的步数
+DRAG_STEPS_PER_SECOND = 100
+
+def _drag_path(start_x: int, start_y: int, end_x: int, end_y: int, steps: int) -> List[Tuple[int, int]]:
+    """计算拖拽路径上的各个坐标点，包含起点和终点"""
+    if NUMPY_AVAILABLE:
+        xs = np.linspace(start_x, end_x, steps).round().astype(np.int32)
+        ys = np.linspace(start_y, end_y, steps).round().astype(np.int32)
+        return list(zip(xs.tolist(), ys.tolist()))
+    last = steps - 1
+    return [
+        (round(start_x + (end_x - start_x) * i / last), round(start_y + (end_y - start_y) * i / last))
+        for i in range(steps)
+    ]
+
 class PywinautoApplication(BaseApplication):
     """pywinauto应用实现"""
     
@@ -854,9 +889,55 @@ class PywinautoControl(BaseControl):
         
         return info
 
+def _encode_screenshot(image: Any, filename: str, image_format: str, quality: int, future: Future) -> None:
+    """在内存中编码截图并提交给写盘线程（在截图线程池中执行）"""
+    try:
+        buffer = io.BytesIO()
+        if image_format == "JPG":
+            image.save(buffer, "JPEG", quality=quality)
+        elif image_format == "PNG":
+            image.save(buffer, "PNG", optimize=False, compress_level=PNG_COMPRESS_LEVEL)
+        else:
+            image.save(buffer, image_format)
+    except Exception as e:
+        future.set_exception(e)
+        return
+    _screenshot_write_queue.put((filename, buffer.getvalue(), future))
+
+def _screenshot_writer() -> None:
+    """写盘线程：按提交顺序把编码好的截图写入文件"""
+    while True:
+        filename, data, future = _screenshot_write_queue.get()
+        try:
+            with open(filename, "wb") as f:
+                f.write(data)
+            future.set_result(filename)
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            _screenshot_write_queue.task_done()
+
+def _drain_screenshots() -> None:
+    """进程退出前等待已提交的截图全部编码并写入文件"""
+    _screenshot_executor.shutdown(wait=True)
+    _screenshot_write_queue.join()
+
+threading.Thread(target=_screenshot_writer, name="rf-win-screenshot-writer", daemon=True).start()
+# 写盘线程是守护线程，退出时不等待会丢失尚未写入的截图
+atexit.register(_drain_screenshots)
+
 class PywinautoOperation(BaseOperation):
     """pywinauto操作实现"""
     
+    def __init__(self):
+        super().__init__()
+        # 尚未保存完成的截图，键为文件路径
+        self._pending_screenshots: Dict[str, Any] = {}
+        # 上次wait_for_screenshots之后保存失败的截图文件路径
+        self._failed_screenshots: List[str] = []
+        # 保护以上两项，完成回调在写盘线程中执行
+        self._screenshot_lock = threading.Lock()
+    
     def mouse_click(self, x: int, y: int, button: str = "left", count: int = 1) -> bool:
         """鼠标点击指定坐标"""
         try:
@@ -887,10 +968,24 @@ class PywinautoOperation(BaseOperation):
         except Exception as e:
             return False
     
-    def mouse_drag(self, start_x: int, start_y: int, end_x: int, end_y: int, duration: float = 1.0) -> bool:
+    def mouse_drag(self, start_x: int, start_y: int, end_x: int, end_y: int, duration: float = 0) -> bool:
         """鼠标拖拽"""
         try:
-            drag(start=(start_x, start_y), end=(end_x, end_y))
+            if duration <= 0:
+                drag(start=(start_x, start_y), end=(end_x, end_y))
+                return True
+            # 路径一次性算好，循环中只剩移动光标和等待
+            steps = max(2, int(duration * DRAG_STEPS_PER_SECOND))
+            path = _drag_path(start_x, start_y, end_x, end_y, steps)
+            interval = duration / steps
+            set_cursor_pos = ctypes.windll.user32.SetCursorPos
+            mouse_press(coords=(start_x, start_y))
+            try:
+                for x, y in path:
+                    set_cursor_pos(x, y)
+                    time.sleep(interval)
+            finally:
+                mouse_release(coords=(end_x, end_y))
             return True
         except Exception as e:
             return False
@@ -934,9 +1029,18 @@ class PywinautoOperation(BaseOperation):
             return False
     
     def press_keys(self, keys: str) -> bool:
-        """按下并释放组合键"""
+        """按下并释放组合键
+        
+        按键名称都能识别时，所有按下和释放事件打包为一次SendInput调用
+        """
         try:
-            # 转换组合键格式，如Ctrl+C -> ^c
+            try:
+                vks = parse_combo(keys)
+            except KeyError:
+                pass
+            else:
+                return send_vk_combo(vks)
+            # 无法识别的按键名称，转换为send_keys格式，如Ctrl+C -> ^c
             keys = keys.replace("Ctrl+", "^")
             keys = keys.replace("Alt+", "%")
             keys = keys.replace("Shift+", "+")
@@ -962,44 +1066,128 @@ class PywinautoOperation(BaseOperation):
             return False
     
     def type_text(self, text: str, interval: float = 0.05) -> bool:
-        """输入文本"""
+        """输入文本
+        
+        interval为0且文本不含send_keys特殊字符时，整段文本通过一次SendInput调用输入；
+        否则经由send_keys输入，空格、制表符和换行按原样输入，与SendInput路径一致
+        """
         try:
-            send_keys(text, pause=interval)
+            if not interval and not SEND_KEYS_SPECIAL.intersection(text):
+                return send_unicode_text(text)
+            send_keys(text, pause=interval, with_spaces=True, with_tabs=True, with_newlines=True)
             return True
         except Exception as e:
             return False
     
-    def capture_screenshot(self, filename: Optional[str] = None, x: int = 0, y: int = 0, width: int = 0, height: int = 0) -> Optional[str]:
-        """捕获屏幕截图"""
+    def _screenshot_filename(self, prefix: str) -> str:
+        """生成截图文件名"""
+        screenshot_path = local_config.get("screenshot_path", "./screenshots/")
+        if not os.path.exists(screenshot_path):
+            os.makedirs(screenshot_path)
+        return f"{screenshot_path}{prefix}_{int(time.time())}.{local_config.get('screenshot_format', 'png')}"
+    
+    def _save_screenshot(self, image: Any, filename: Optional[str], prefix: str, wait: bool = True) -> str:
+        """提交截图到后台线程编码保存
+        
+        Args:
+            image: 截图图像
+            filename: 截图保存路径，如果为None则自动生成
+            prefix: 自动生成文件名的前缀
+            wait: 是否等待文件写入完成；为False时立即返回，由wait_for_screenshots等待
+        
+        Returns:
+            截图文件路径
+        
+        Raises:
+            Exception: wait为True且编码或写入失败时抛出对应的异常
+        """
+        if filename is None:
+            # 自动生成文件名
+            filename = self._screenshot_filename(prefix)
+        
+        image_format = local_config.get("screenshot_format", "png").upper()
+        quality = local_config.get("screenshot_quality", 90)
+        # Future在写盘线程完成写入后才结束
+        future: Future = Future()
+        if not wait:
+            with self._screenshot_lock:
+                self._pending_screenshots[filename] = future
+            future.add_done_callback(lambda done, name=filename: self._screenshot_done(name, done))
+        _screenshot_executor.submit(_encode_screenshot, image, filename, image_format, quality, future)
+        if wait:
+            future.result()
+        return filename
+    
+    def _screenshot_done(self, filename: str, future: Future) -> None:
+        """不等待的截图保存完成后的回调，记录失败的截图供wait_for_screenshots报告"""
+        failed = future.exception() is not None
+        with self._screenshot_lock:
+            # 同名文件可能已被之后的截图重新登记，只移除本次的Future
+            if self._pending_screenshots.get(filename) is future:
+                del self._pending_screenshots[filename]
+            if failed:
+                self._failed_screenshots.append(filename)
+    
+    def wait_for_screenshots(self, timeout: Optional[float] = None) -> bool:
+        """等待后台截图全部保存完成
+        
+        Args:
+            timeout: 超时时间（秒），None表示一直等待
+        
+        Returns:
+            所有截图是否都保存成功
+        """
+        with self._screenshot_lock:
+            futures = list(self._pending_screenshots.values())
+        done, not_done = wait_futures(futures, timeout=timeout) if futures else ((), ())
+        # 调用前已完成的失败截图由回调记录，报告一次后清空
+        with self._screenshot_lock:
+            failed = self._failed_screenshots
+            self._failed_screenshots = []
+        return not not_done and not failed and all(future.exception() is None for future in done)
+    
+    def capture_screenshot(self, filename: Optional[str] = None, x: int = 0, y: int = 0, width: int = 0, height: int = 0, wait: bool = True) -> Optional[str]:
+        """捕获屏幕截图
+        
+        抓屏在当前线程完成，编码和写盘在后台线程完成；wait为False时返回时文件可能尚未写入
+        """
         try:
             from PIL import ImageGrab
-            import os
             
             if x == 0 and y == 0 and width == 0 and height == 0:
                 # 全屏截图
                 image = ImageGrab.grab()
             else:
-                # 区域截图
+                # 区域截图：bbox交给BitBlt只拷贝目标区域，不先抓全屏再在Python中裁剪
                 image = ImageGrab.grab(bbox=(x, y, x + width, y + height))
+
+            return self._save_screenshot(image, filename, "screenshot", wait)
+        except Exception as e:
+            return None
+    
+    def capture_screenshot_raw(self, x: int = 0, y: int = 0, width: int = 0, height: int = 0) -> Optional[Tuple[memoryview, Tuple[int, int]]]:
+        """捕获屏幕像素数据
+        
+        像素按BGRA顺序每像素4字节排列（RGB截图的第4字节为填充），只做一次从截图到字节串的拷贝，
+        不经过PNG编码和解码，可直接交给numpy.frombuffer(data, "uint8").reshape(height, width, 4)
+        """
+        try:
+            from PIL import ImageGrab
             
-            if filename is None:
-                # 自动生成文件名
-                if not os.path.exists(local_config.get("screenshot_path", "./screenshots/")):
-                    os.makedirs(local_config.get("screenshot_path", "./screenshots/"))
-                filename = f"{local_config.get('screenshot_path', './screenshots/')}screenshot_{int(time.time())}.{local_config.get('screenshot_format', 'png')}"
-            
-            # 保存截图
-            image_format = local_config.get("screenshot_format", "png").upper()
-            if image_format == "JPG":
-                image.save(filename, "JPEG", quality=local_config.get("screenshot_quality", 90))
+            if x == 0 and y == 0 and width == 0 and height == 0:
+                image = ImageGrab.grab()
             else:
-                image.save(filename, image_format)
+                image = ImageGrab.grab(bbox=(x, y, x + width, y + height))
             
-            return filename
+            if image.mode == "RGBA":
+                data = image.tobytes("raw", "BGRA")
+            else:
+                data = image.convert("RGB").tobytes("raw", "BGRX")
+            return memoryview(data), image.size
         except Exception as e:
             return None
     
-    def capture_window_screenshot(self, window: Any, filename: Optional[str] = None) -> Optional[str]:
+    def capture_window_screenshot(self, window: Any, filename: Optional[str] = None, wait: bool = True) -> Optional[str]:
         """捕获窗口截图"""
         try:
             if not window:
@@ -1008,25 +1196,11 @@ class PywinautoOperation(BaseOperation):
             # 使用pywinauto的截图功能
             image = window.capture_as_image()
             
-            if filename is None:
-                # 自动生成文件名
-                import os
-                if not os.path.exists(local_config.get("screenshot_path", "./screenshots/")):
-                    os.makedirs(local_config.get("screenshot_path", "./screenshots/"))
-                filename = f"{local_config.get('screenshot_path', './screenshots/')}window_screenshot_{int(time.time())}.{local_config.get('screenshot_format', 'png')}"
-            
-            # 保存截图
-            image_format = local_config.get("screenshot_format", "png").upper()
-            if image_format == "JPG":
-                image.save(filename, "JPEG", quality=local_config.get("screenshot_quality", 90))
-            else:
-                image.save(filename, image_format)
-            
-            return filename
+            return self._save_screenshot(image, filename, "window_screenshot", wait)
         except Exception as e:
             return None
     
-    def capture_element_screenshot(self, element: Any, filename: Optional[str] = None) -> Optional[str]:
+    def capture_element_screenshot(self, element: Any, filename: Optional[str] = None, wait: bool = True) -> Optional[str]:
         """捕获控件截图"""
         try:
             if not element:
@@ -1035,21 +1209,7 @@ class PywinautoOperation(BaseOperation):
             # 使用pywinauto的截图功能
             image = element.capture_as_image()
             
-            if filename is None:
-                # 自动生成文件名
-                import os
-                if not os.path.exists(local_config.get("screenshot_path", "./screenshots/")):
-                    os.makedirs(local_config.get("screenshot_path", "./screenshots/"))
-                filename = f"{local_config.get('screenshot_path', './screenshots/')}element_screenshot_{int(time.time())}.{local_config.get('screenshot_format', 'png')}"
-            
-            # 保存截图
-            image_format = local_config.get("screenshot_format", "png").upper()
-            if image_format == "JPG":
-                image.save(filename, "JPEG", quality=local_config.get("screenshot_quality", 90))
-            else:
-                image.save(filename, image_format)
-            
-            return filename
+            return self._save_screenshot(image, filename, "element_screenshot", wait)
         except Exception as e:
             return None
     
@@ -0,0 +1,117 @@
+# Win32窗口事件模块
+# 通过SetWinEventHook接收窗口创建、显示、标题变化等事件，供等待操作代替固定间隔轮询
+
+import ctypes
+import threading
+from ctypes import wintypes
+from typing import Optional
+
+EVENT_OBJECT_CREATE = 0x8000
+EVENT_OBJECT_NAMECHANGE = 0x800C
+WINEVENT_OUTOFCONTEXT = 0x0000
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+WM_QUIT = 0x0012
+PM_NOREMOVE = 0x0000
+
+WINEVENTPROC = getattr(ctypes, "WINFUNCTYPE", ctypes.CFUNCTYPE)(
+    None,
+    wintypes.HANDLE,
+    wintypes.DWORD,
+    wintypes.HWND,
+    wintypes.LONG,
+    wintypes.LONG,
+    wintypes.DWORD,
+    wintypes.DWORD,
+)
+
+
+class WindowEventWatcher:
+    """窗口事件监听器
+
+    在独立线程中注册WinEvent钩子并运行消息循环，收到顶层窗口的创建、销毁、
+    显示、隐藏或标题变化事件时唤醒wait()。只负责通知“窗口可能有变化”，
+    具体条件仍由调用方检查
+
+    Example:
+        with WindowEventWatcher() as watcher:
+            while not condition():
+                watcher.wait(0.25)
+    """
+
+    def __init__(self):
+        self._changed = threading.Event()
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_id = 0
+        self._hooked = False
+        # 回调对象需保持引用，否则被回收后系统回调会访问无效内存
+        self._callback = WINEVENTPROC(self._on_event)
+
+    def _on_event(self, hook, event, hwnd, id_object, id_child, thread_id, event_time):
+        if id_object == OBJID_WINDOW and id_child == CHILDID_SELF:
+            self._changed.set()
+
+    def _run(self) -> None:
+        user32 = ctypes.windll.user32
+        msg = wintypes.MSG()
+        # 确保线程消息队列已创建，之后才能接收WM_QUIT
+        user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, PM_NOREMOVE)
+        self._thread_id = ctypes.windll.kernel32.GetCurrentThreadId()
+        hook = user32.SetWinEventHook(
+            EVENT_OBJECT_CREATE, EVENT_OBJECT_NAMECHANGE, None, self._callback, 0, 0, WINEVENT_OUTOFCONTEXT
+        )
+        self._hooked = bool(hook)
+        self._ready.set()
+        if not hook:
+            return
+        try:
+            # 钩子回调通过本线程的消息循环派发
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+        finally:
+            user32.UnhookWinEvent(hook)
+
+    def start(self) -> bool:
+        """启动监听线程并注册钩子
+
+        Returns:
+            钩子是否注册成功，失败时调用方应退回轮询
+        """
+        if not hasattr(ctypes, "windll"):
+            return False
+        self._thread = threading.Thread(target=self._run, name="rf-win-winevent", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if not self._hooked:
+            self._thread.join()
+            self._thread = None
+        return self._hooked
+
+    def stop(self) -> None:
+        """注销钩子并结束监听线程"""
+        if self._thread is None:
+            return
+        ctypes.windll.user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
+        self._thread.join()
+        self._thread = None
+
+    def wait(self, timeout: float) -> bool:
+        """等待下一个窗口事件
+
+        Args:
+            timeout: 最长等待时间（秒）
+
+        Returns:
+            是否收到了窗口事件
+        """
+        changed = self._changed.wait(timeout)
+        self._changed.clear()
+        return changed
+
+    def __enter__(self) -> "WindowEventWatcher":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
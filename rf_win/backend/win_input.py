@@ -0,0 +1,200 @@
+# Win32输入模块
+# 通过SendInput一次性提交多个键盘事件，减少逐个按键调用的系统调用开销
+
+import ctypes
+from ctypes import wintypes
+from functools import lru_cache
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+VK_CONTROL = 0x11
+VK_DELETE = 0x2E
+
+# 组合键名称到虚拟键码的映射（名称不区分大小写）
+_VK_MAP: Dict[str, int] = {
+    'ctrl': 0x11, 'control': 0x11,
+    'alt': 0x12, 'menu': 0x12,
+    'shift': 0x10,
+    'win': 0x5B, 'windows': 0x5B,
+    'enter': 0x0D, 'return': 0x0D,
+    'tab': 0x09,
+    'esc': 0x1B, 'escape': 0x1B,
+    'space': 0x20,
+    'backspace': 0x08, 'bksp': 0x08,
+    'delete': 0x2E, 'del': 0x2E,
+    'insert': 0x2D, 'ins': 0x2D,
+    'home': 0x24, 'end': 0x23,
+    'pageup': 0x21, 'pgup': 0x21,
+    'pagedown': 0x22, 'pgdn': 0x22,
+    'left': 0x25, 'up': 0x26, 'right': 0x27, 'down': 0x28,
+    'capslock': 0x14,
+    'printscreen': 0x2C,
+}
+_VK_MAP.update({f'f{n}': 0x6F + n for n in range(1, 25)})
+_VK_MAP.update({chr(c).lower(): c for c in range(ord('A'), ord('Z') + 1)})
+_VK_MAP.update({chr(c): c for c in range(ord('0'), ord('9') + 1)})
+
+# send_keys语法中有特殊含义的字符，包含这些字符的文本仍交给send_keys解释
+SEND_KEYS_SPECIAL = frozenset("{}()^+%~")
+
+# ULONG_PTR在32位和64位系统上长度不同
+ULONG_PTR = ctypes.c_size_t
+
+# 模块加载时取一次SendInput，非Windows平台上为None
+try:
+    _SendInput = ctypes.windll.user32.SendInput
+except AttributeError:
+    _SendInput = None
+
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ULONG_PTR),
+    ]
+
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ULONG_PTR),
+    ]
+
+
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ("uMsg", wintypes.DWORD),
+        ("wParamL", wintypes.WORD),
+        ("wParamH", wintypes.WORD),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [
+        ("mi", MOUSEINPUT),
+        ("ki", KEYBDINPUT),
+        ("hi", HARDWAREINPUT),
+    ]
+
+
+class INPUT(ctypes.Structure):
+    _anonymous_ = ("u",)
+    _fields_ = [
+        ("type", wintypes.DWORD),
+        ("u", _INPUTUNION),
+    ]
+
+
+_INPUT_SIZE = ctypes.sizeof(INPUT)
+
+
+def _send(events: Iterable[Tuple[int, int, int]]) -> int:
+    """提交键盘事件
+
+    Args:
+        events: (虚拟键码, 扫描码, 标志)元组序列
+
+    Returns:
+        成功插入输入流的事件数
+    """
+    events = list(events)
+    if not events:
+        return 0
+    inputs = (INPUT * len(events))()
+    for item, (vk, scan, flags) in zip(inputs, events):
+        item.type = INPUT_KEYBOARD
+        item.ki.wVk = vk
+        item.ki.wScan = scan
+        item.ki.dwFlags = flags
+    return _SendInput(len(events), inputs, _INPUT_SIZE)
+
+
+def _unicode_events(text: str) -> List[Tuple[int, int, int]]:
+    """生成输入文本的键盘事件
+
+    每个字符按UTF-16编码单元生成按下和释放两个KEYEVENTF_UNICODE事件
+
+    Args:
+        text: 要输入的文本
+
+    Returns:
+        (虚拟键码, 扫描码, 标志)元组列表
+    """
+    units = text.encode("utf-16-le")
+    events = []
+    for i in range(0, len(units), 2):
+        code = units[i] | (units[i + 1] << 8)
+        events.append((0, code, KEYEVENTF_UNICODE))
+        events.append((0, code, KEYEVENTF_UNICODE | KEYEVENTF_KEYUP))
+    return events
+
+
+def _combo_events(vks: Sequence[int]) -> List[Tuple[int, int, int]]:
+    """生成组合键的键盘事件，先按顺序按下所有虚拟键，再按相反顺序释放
+
+    Args:
+        vks: 虚拟键码序列
+
+    Returns:
+        (虚拟键码, 扫描码, 标志)元组列表
+    """
+    events = [(vk, 0, 0) for vk in vks]
+    events.extend((vk, 0, KEYEVENTF_KEYUP) for vk in reversed(vks))
+    return events
+
+
+@lru_cache(maxsize=128)
+def parse_combo(keys: str) -> Tuple[int, ...]:
+    """解析组合键字符串并缓存结果
+
+    Args:
+        keys: 组合键，格式为"Ctrl+C"、"Ctrl+Alt+F4"
+
+    Returns:
+        按顺序排列的虚拟键码元组
+
+    Raises:
+        KeyError: 包含无法识别的按键名称
+    """
+    return tuple(_VK_MAP[token.strip().lower()] for token in keys.split('+'))
+
+
+def send_unicode_text(text: str, clear_first: bool = False) -> bool:
+    """以一次SendInput调用输入整段文本
+
+    不经过键盘布局转换，也不解释send_keys的特殊字符
+
+    Args:
+        text: 要输入的文本
+        clear_first: 是否先发送Ctrl+A和Delete清空当前内容，与文本在同一次调用中提交
+
+    Returns:
+        是否全部事件都被系统接受
+    """
+    events = _combo_events((VK_CONTROL, ord("A"))) + _combo_events((VK_DELETE,)) if clear_first else []
+    events += _unicode_events(text)
+    return _send(events) == len(events)
+
+
+def send_vk_combo(vks: Sequence[int]) -> bool:
+    """以一次SendInput调用发送组合键
+
+    先按顺序按下所有虚拟键，再按相反顺序释放
+
+    Args:
+        vks: 虚拟键码序列，如(VK_CONTROL, ord('C'))
+
+    Returns:
+        是否全部事件都被系统接受
+    """
+    events = _combo_events(vks)
+    return _send(events) == len(events)
@@ -0,0 +1,100 @@
+# Win32进程模块
+# 通过进程句柄判断进程是否存活，只需一次WaitForSingleObject系统调用，无需经过自动化库查询
+
+import ctypes
+import time
+from ctypes import wintypes
+from typing import Optional, Sequence
+
+SYNCHRONIZE = 0x00100000
+WAIT_OBJECT_0 = 0x00000000
+WAIT_TIMEOUT = 0x00000102
+WAIT_FAILED = 0xFFFFFFFF
+INFINITE = 0xFFFFFFFF
+# WaitForMultipleObjects一次最多等待的句柄数
+MAXIMUM_WAIT_OBJECTS = 64
+
+# 模块加载时加载一次kernel32并声明函数签名，非Windows平台上为None；
+# 使用独立的WinDLL实例，避免修改共享的ctypes.windll.kernel32上的签名
+try:
+    _kernel32 = ctypes.WinDLL("kernel32")
+except (AttributeError, OSError):
+    _kernel32 = None
+else:
+    _kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    _kernel32.OpenProcess.restype = wintypes.HANDLE
+    _kernel32.WaitForSingleObject.argtypes = (wintypes.HANDLE, wintypes.DWORD)
+    _kernel32.WaitForSingleObject.restype = wintypes.DWORD
+    _kernel32.WaitForMultipleObjects.argtypes = (wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE), wintypes.BOOL, wintypes.DWORD)
+    _kernel32.WaitForMultipleObjects.restype = wintypes.DWORD
+    _kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    _kernel32.CloseHandle.restype = wintypes.BOOL
+
+
+def open_process_handle(pid: int) -> Optional[int]:
+    """打开只用于等待的进程句柄
+
+    句柄持有期间进程对象不会被系统回收，即使进程ID被复用也不会误判
+
+    Args:
+        pid: 进程ID
+
+    Returns:
+        进程句柄，非Windows平台或打开失败时返回None
+    """
+    if _kernel32 is None or not pid:
+        return None
+    handle = _kernel32.OpenProcess(SYNCHRONIZE, False, int(pid))
+    return handle or None
+
+
+def is_process_alive(handle: int) -> Optional[bool]:
+    """检查句柄对应的进程是否仍在运行
+
+    Args:
+        handle: open_process_handle返回的进程句柄
+
+    Returns:
+        进程正在运行返回True，已退出返回False，无法判断时返回None
+    """
+    result = _kernel32.WaitForSingleObject(handle, 0)
+    if result == WAIT_TIMEOUT:
+        return True
+    if result == WAIT_OBJECT_0:
+        return False
+    return None
+
+
+def wait_for_processes(handles: Sequence[int], timeout: Optional[float] = None) -> bool:
+    """等待所有句柄对应的进程退出
+
+    每MAXIMUM_WAIT_OBJECTS个句柄调用一次WaitForMultipleObjects，由内核一次等待一批进程
+
+    Args:
+        handles: open_process_handle返回的进程句柄序列
+        timeout: 总超时时间（秒），None表示一直等待
+
+    Returns:
+        是否所有进程都在超时内退出
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    for start in range(0, len(handles), MAXIMUM_WAIT_OBJECTS):
+        batch = handles[start:start + MAXIMUM_WAIT_OBJECTS]
+        if deadline is None:
+            milliseconds = INFINITE
+        else:
+            milliseconds = max(0, int((deadline - time.monotonic()) * 1000))
+        array = (wintypes.HANDLE * len(batch))(*batch)
+        result = _kernel32.WaitForMultipleObjects(len(batch), array, True, milliseconds)
+        if result == WAIT_TIMEOUT or result == WAIT_FAILED:
+            return False
+    return True
+
+
+def close_process_handle(handle: int) -> None:
+    """关闭进程句柄
+
+    Args:
+        handle: open_process_handle返回的进程句柄
+    """
+    _kernel32.CloseHandle(handle)
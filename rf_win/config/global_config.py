@@ -27,6 +27,8 @@ class GlobalConfig:
         self.log_level: str = "info"
         # 日志文件路径
         self.log_file: str = "./logs/rf_win.log"
+        # 关键字是否输出INFO级别的执行日志
+        self.verbose_keyword_logs: bool = True
         # 自动捕获失败截图
         self.auto_screenshot_on_fail: bool = True
         # 高DPI适配开关
@@ -59,6 +61,7 @@ CONFIG_KEY_MAP: Dict[str, str] = {
     "RF_WIN_SCREENSHOT_QUALITY": "screenshot_quality",
     "RF_WIN_LOG_LEVEL": "log_level",
     "RF_WIN_LOG_FILE": "log_file",
+    "RF_WIN_VERBOSE_KEYWORD_LOGS": "verbose_keyword_logs",
     "RF_WIN_AUTO_SCREENSHOT": "auto_screenshot_on_fail",
     "RF_WIN_HIGH_DPI": "high_dpi_adapter",
     "RF_WIN_CACHE_EXPIRE": "cache_expire_time",
@@ -37,7 +37,7 @@ class BaseOperation(ABC):
         pass
     
     @abstractmethod
-    def mouse_drag(self, start_x: int, start_y: int, end_x: int, end_y: int, duration: float = 1.0) -> bool:
+    def mouse_drag(self, start_x: int, start_y: int, end_x: int, end_y: int, duration: float = 0) -> bool:
         """鼠标拖拽
         
         Args:
@@ -45,7 +45,7 @@ class BaseOperation(ABC):
             start_y: 起始Y坐标（像素）
             end_x: 结束X坐标（像素）
             end_y: 结束Y坐标（像素）
-            duration: 拖拽时长（秒）
+            duration: 拖拽时长（秒），为0时立即完成
         
         Returns:
             是否拖拽成功
@@ -167,6 +167,20 @@ class BaseOperation(ABC):
         """
         pass
     
+    def capture_screenshot_raw(self, x: int = 0, y: int = 0, width: int = 0, height: int = 0) -> Optional[Tuple[memoryview, Tuple[int, int]]]:
+        """捕获屏幕像素数据，不编码也不保存文件
+        
+        Args:
+            x: 起始X坐标（像素），0表示全屏
+            y: 起始Y坐标（像素），0表示全屏
+            width: 截图宽度（像素），0表示全屏
+            height: 截图高度（像素），0表示全屏
+        
+        Returns:
+            (BGRA像素数据, (宽度, 高度))，不支持或截图失败时返回None
+        """
+        return None
+    
     @abstractmethod
     def capture_window_screenshot(self, window: Any, filename: Optional[str] = None) -> Optional[str]:
         """捕获窗口截图
@@ -4,6 +4,23 @@
 from typing import Any, Dict, List, Optional, Tuple
 from abc import ABC, abstractmethod
 from .version_adapter import version_adapter
+from ..backend.win_input import SEND_KEYS_SPECIAL, send_unicode_text
+from ..utils.locator_helper import ParsedLocator
+
+# 定位器类型 -> pywinauto child_window的查找条件
+PYWINAUTO_CRITERIA = {"id": "auto_id", "name": "name", "class": "class_name", "xpath": "title", "title": "title"}
+# 定位器类型 -> uiautomation Control的查找条件
+UIAUTOMATION_CRITERIA = {"id": "AutomationId", "name": "Name", "class": "ClassName", "xpath": "Name", "title": "Name"}
+# uiautomation驱动查找控件时通过会话级CacheRequest一并读取的静态属性：Control属性名 -> UIA属性ID；
+# 可见、可用等会变化的状态不缓存，仍实时读取
+UIAUTOMATION_CACHED_PROPERTIES = {
+    "ProcessId": 30002,
+    "ControlType": 30003,
+    "AutomationId": 30011,
+    "ClassName": 30012,
+    "FrameworkId": 30024,
+}
+TreeScope_Descendants = 4
 
 class AutomationDriver(ABC):
     """自动化驱动抽象基类，定义统一的自动化接口"""
@@ -112,6 +129,20 @@ class AutomationDriver(ABC):
         """
         pass
     
+    @abstractmethod
+    def double_click_element(self, element: Any) -> bool:
+        """双击控件
+        
+        发送一次系统双击，由系统按双击时间间隔处理
+        
+        Args:
+            element: 控件对象
+        
+        Returns:
+            是否成功
+        """
+        pass
+    
     @abstractmethod
     def type_text(self, element: Any, text: str, clear_first: bool = True, delay: float = 0.0) -> bool:
         """向控件输入文本
@@ -176,6 +207,19 @@ class AutomationDriver(ABC):
         """
         pass
     
+    def get_runtime_id(self, element: Any) -> Optional[Tuple[int, ...]]:
+        """获取已解析控件的UIA RuntimeId
+        
+        只读取已解析出的原生UIA元素，不会为此重新查找控件；控件已失效时读取失败
+        
+        Args:
+            element: 控件对象
+        
+        Returns:
+            RuntimeId，控件未解析、不是UIA控件或已失效时返回None
+        """
+        return None
+    
     @abstractmethod
     def is_element_enabled(self, element: Any) -> bool:
         """检查控件是否可用
@@ -285,20 +329,24 @@ class PywinautoDriver(AutomationDriver):
     
     def connect_to_application(self, identifier: Any, backend: str = "uia") -> Any:
         """连接到已运行的应用"""
-        from pywinauto import Application as PywinautoApp
-        app = PywinautoApp(backend=backend)
-        
         if isinstance(identifier, int):
-            app.connect(process=identifier)
+            return self.connect_by_pid(identifier, backend)
         elif isinstance(identifier, str):
             if identifier.isdigit():
-                app.connect(process=int(identifier))
-            else:
-                app.connect(title=identifier)
+                return self.connect_by_pid(int(identifier), backend)
+            return self.connect_by_title(identifier, backend)
         else:
             raise ValueError(f"Invalid identifier type: {type(identifier)}")
-        
-        return app
+    
+    def connect_by_pid(self, pid: int, backend: str = "uia") -> Any:
+        """通过进程ID连接到已运行的应用"""
+        from pywinauto import Application as PywinautoApp
+        return PywinautoApp(backend=backend).connect(process=pid)
+    
+    def connect_by_title(self, title: str, backend: str = "uia") -> Any:
+        """通过窗口标题连接到已运行的应用"""
+        from pywinauto import Application as PywinautoApp
+        return PywinautoApp(backend=backend).connect(title=title)
     
     def find_window(self, app: Any, window_identifier: Any) -> Any:
         """查找窗口"""
@@ -311,6 +359,9 @@ class PywinautoDriver(AutomationDriver):
     
     def find_element(self, parent: Any, locator: Any, timeout: float = 10.0) -> Any:
         """查找单个控件"""
+        # 已由LocatorHelper.compile解析的定位器直接使用
+        if isinstance(locator, ParsedLocator):
+            return parent.child_window(timeout=timeout, **{PYWINAUTO_CRITERIA[locator.type]: locator.value})
         # 解析定位器
         if isinstance(locator, str):
             if locator.startswith("id="):
@@ -350,19 +401,37 @@ class PywinautoDriver(AutomationDriver):
         except Exception:
             return False
     
+    def double_click_element(self, element: Any) -> bool:
+        """双击控件"""
+        try:
+            element.double_click_input()
+            return True
+        except Exception:
+            return False
+    
     def type_text(self, element: Any, text: str, clear_first: bool = True, delay: float = 0.0) -> bool:
-        """向控件输入文本"""
+        """向控件输入文本
+        
+        经由type_keys输入时空格、制表符和换行按原样输入，与SendInput路径一致
+        """
+        whitespace = {"with_spaces": True, "with_tabs": True, "with_newlines": True}
         try:
-            if clear_first:
-                self.clear_element_text(element)
-            
             if delay > 0:
+                if clear_first:
+                    self.clear_element_text(element)
                 for char in text:
-                    element.type_keys(char)
+                    element.type_keys(char, **whitespace)
                     import time
                     time.sleep(delay)
+            elif not SEND_KEYS_SPECIAL.intersection(text):
+                # 全选删除与文本的所有按键事件通过一次SendInput调用提交
+                element.set_focus()
+                return send_unicode_text(text, clear_first)
+            elif clear_first:
+                # 全选删除与文本合并为一次按键序列，省去单独清空的一次调用
+                element.type_keys("^a{DELETE}" + text, **whitespace)
             else:
-                element.type_keys(text)
+                element.type_keys(text, **whitespace)
             return True
         except Exception:
             return False
@@ -396,6 +465,15 @@ class PywinautoDriver(AutomationDriver):
         except Exception:
             return False
     
+    def get_runtime_id(self, element: Any) -> Optional[Tuple[int, ...]]:
+        """获取已解析控件的UIA RuntimeId"""
+        # 从实例属性读取，避免WindowSpecification通过__getattr__触发查找
+        try:
+            raw = getattr(vars(element).get("element_info"), "element", None)
+            return tuple(raw.GetRuntimeId()) if raw is not None else None
+        except Exception:
+            return None
+    
     def is_element_enabled(self, element: Any) -> bool:
         """检查控件是否可用"""
         try:
@@ -474,6 +552,43 @@ class PywinautoDriver(AutomationDriver):
 class UIAutomationDriver(AutomationDriver):
     """UIAutomation驱动实现"""
     
+    def __init__(self):
+        # 会话级CacheRequest，首次查找时创建，创建失败时为False
+        self._cache_request = None
+    
+    def _get_cache_request(self) -> Any:
+        """获取包含UIAUTOMATION_CACHED_PROPERTIES的CacheRequest
+        
+        Returns:
+            IUIAutomationCacheRequest，无法创建时返回None
+        """
+        if self._cache_request is None:
+            self._cache_request = False
+            try:
+                import uiautomation as auto
+                request = auto._AutomationClient.instance().IUIAutomation.CreateCacheRequest()
+                for property_id in UIAUTOMATION_CACHED_PROPERTIES.values():
+                    request.AddProperty(property_id)
+                self._cache_request = request
+            except Exception:
+                pass
+        return self._cache_request or None
+    
+    def _find_first_cached(self, parent: Any, locator: ParsedLocator) -> Any:
+        """通过一次FindFirstBuildCache查找控件，同时缓存UIAUTOMATION_CACHED_PROPERTIES
+        
+        Args:
+            parent: 父控件
+            locator: 带有property_id的ParsedLocator
+        
+        Returns:
+            uiautomation控件，未找到时返回None
+        """
+        import uiautomation as auto
+        condition = auto._AutomationClient.instance().IUIAutomation.CreatePropertyCondition(locator.property_id, locator.value)
+        found = parent.Element.FindFirstBuildCache(TreeScope_Descendants, condition, self._get_cache_request())
+        return auto.Control.CreateControlFromElement(found) if found else None
+    
     @property
     def name(self) -> str:
         return "uiautomation"
@@ -508,10 +623,29 @@ class UIAutomationDriver(AutomationDriver):
         import uiautomation as auto
         import time
         
+        # 按属性条件查找的定位器直接在父控件下查找一次，并缓存控件的静态属性
+        if isinstance(locator, ParsedLocator) and locator.property_id and self._get_cache_request() is not None:
+            deadline = time.monotonic() + timeout
+            while True:
+                try:
+                    element = self._find_first_cached(parent, locator)
+                    if element is not None:
+                        return element
+                except Exception:
+                    pass
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                time.sleep(min(0.5, remaining))
+        
         start_time = time.time()
         while time.time() - start_time < timeout:
             try:
-                if isinstance(locator, str):
+                if isinstance(locator, ParsedLocator):
+                    if locator.type == "xpath":
+                        return parent.Control(searchDepth=10, Name=locator.value)
+                    return parent.Control(**{UIAUTOMATION_CRITERIA[locator.type]: locator.value})
+                elif isinstance(locator, str):
                     if locator.startswith("id="):
                         return parent.Control(AutomationId=locator[3:])
                     elif locator.startswith("name="):
@@ -553,6 +687,14 @@ class UIAutomationDriver(AutomationDriver):
         except Exception:
             return False
     
+    def double_click_element(self, element: Any) -> bool:
+        """双击控件"""
+        try:
+            element.DoubleClick()
+            return True
+        except Exception:
+            return False
+    
     def type_text(self, element: Any, text: str, clear_first: bool = True, delay: float = 0.0) -> bool:
         """向控件输入文本"""
         try:
@@ -585,7 +727,19 @@ class UIAutomationDriver(AutomationDriver):
             return None
     
     def get_element_attribute(self, element: Any, attribute: str) -> Optional[Any]:
-        """获取控件属性"""
+        """获取控件属性
+        
+        查找时已缓存的静态属性直接从本地缓存读取，不再访问目标进程
+        """
+        property_id = UIAUTOMATION_CACHED_PROPERTIES.get(attribute)
+        if property_id is not None:
+            try:
+                raw = vars(element).get("_element")
+                if raw is not None:
+                    return raw.GetCachedPropertyValue(property_id)
+            except Exception:
+                # 控件不是通过CacheRequest查找到的，没有缓存该属性
+                pass
         try:
             return getattr(element, attribute, None)
         except Exception:
@@ -598,6 +752,15 @@ class UIAutomationDriver(AutomationDriver):
         except Exception:
             return False
     
+    def get_runtime_id(self, element: Any) -> Optional[Tuple[int, ...]]:
+        """获取已解析控件的UIA RuntimeId"""
+        # 从实例属性读取，避免Control.Element在未解析时触发查找
+        try:
+            raw = vars(element).get("_element")
+            return tuple(raw.GetRuntimeId()) if raw is not None else None
+        except Exception:
+            return None
+    
     def is_element_enabled(self, element: Any) -> bool:
         """检查控件是否可用"""
         try:
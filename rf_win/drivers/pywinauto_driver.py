@@ -15,6 +15,7 @@ from pywinauto.controls.uiawrapper import UIAWrapper
 from pywinauto.controls.hwndwrapper import HwndWrapper
 from pywinauto.timings import wait_until_passes
 from pywinauto.application import ProcessNotFoundError
+from ..backend.win_input import parse_combo, send_vk_combo
 from ..utils.logger import logger
 
 class PywinautoDriver:
@@ -744,9 +745,15 @@ class PywinautoDriver:
         logger.info(f"组合按键: {keys}")
         
         try:
-            from pywinauto.keyboard import send_keys as keyboard_send_keys
-            keyboard_send_keys(keys)
-            return True
+            try:
+                vks = parse_combo(keys)
+            except KeyError:
+                # 无法识别的按键名称，按pywinauto的send_keys语法发送
+                from pywinauto.keyboard import send_keys as keyboard_send_keys
+                keyboard_send_keys(keys)
+                return True
+            # 所有按下和释放事件打包为一次SendInput调用
+            return send_vk_combo(vks)
         except Exception as e:
             logger.error(f"组合按键失败: {e}")
             return False
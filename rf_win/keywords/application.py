@@ -7,7 +7,7 @@
 
 from .. import keyword, library
 from ..services.application_service import ApplicationService
-from ..utils.logger import logger
+from ..utils.logger import keyword_info_enabled, logger
 
 @library(scope='GLOBAL', version='1.0.0')
 class ApplicationKeywords:
@@ -18,7 +18,7 @@ class ApplicationKeywords:
     
     def __init__(self):
         """初始化应用服务实例"""
-        self.app_service = ApplicationService()
+        self.app_service = ApplicationService.instance()
     
     @keyword(name='启动应用', tags=['应用管理'])
     def start_application(self, app_path, **kwargs):
@@ -42,7 +42,8 @@ class ApplicationKeywords:
         alias = kwargs.pop('别名', kwargs.pop('alias', None))
         backend = kwargs.pop('后端', kwargs.pop('backend', None))
         
-        logger.info(f"启动应用: {app_path}, 别名: {alias}, 后端: {backend}")
+        if keyword_info_enabled():
+            logger.info("启动应用: %s, 别名: %s, 后端: %s", app_path, alias, backend)
         return self.app_service.start_application(app_path, alias, backend, **kwargs)
     
     @keyword(name='连接应用', tags=['应用管理'])
@@ -71,7 +72,8 @@ class ApplicationKeywords:
         alias = kwargs.pop('别名', kwargs.pop('alias', None))
         backend = kwargs.pop('后端', kwargs.pop('backend', None))
         
-        logger.info(f"连接应用: 进程ID={process_id}, 标题={title}, 别名={alias}, 后端={backend}")
+        if keyword_info_enabled():
+            logger.info("连接应用: 进程ID=%s, 标题=%s, 别名=%s, 后端=%s", process_id, title, alias, backend)
         return self.app_service.connect_application(process_id, title, alias, backend, **kwargs)
     
     @keyword(name='关闭应用', tags=['应用管理'])
@@ -89,7 +91,8 @@ class ApplicationKeywords:
         # 处理中文参数名映射
         app_alias = kwargs.pop('别名', kwargs.pop('app_alias', None))
         
-        logger.info(f"关闭应用: {app_alias}")
+        if keyword_info_enabled():
+            logger.info("关闭应用: %s", app_alias)
         return self.app_service.close_application(app_alias)
     
     @keyword(name='关闭所有应用', tags=['应用管理'])
@@ -101,7 +104,8 @@ class ApplicationKeywords:
         示例:
             | 关闭所有应用 |
         """
-        logger.info("关闭所有应用")
+        if keyword_info_enabled():
+            logger.info("关闭所有应用")
         return self.app_service.close_all_applications()
     
     @keyword(name='获取当前应用', tags=['应用管理'])
@@ -116,7 +120,8 @@ class ApplicationKeywords:
         示例:
             | ${app} | 获取当前应用 |
         """
-        logger.info("获取当前应用")
+        if keyword_info_enabled():
+            logger.info("获取当前应用")
         return self.app_service.get_current_application()
     
     @keyword(name='切换应用', tags=['应用管理'])
@@ -131,7 +136,8 @@ class ApplicationKeywords:
         示例:
             | 切换应用 | 别名=notepad++ |
         """
-        logger.info(f"切换应用: {app_alias}")
+        if keyword_info_enabled():
+            logger.info("切换应用: %s", app_alias)
         return self.app_service.switch_application(app_alias)
     
     @keyword(name='应用是否运行', tags=['应用管理'])
@@ -149,5 +155,6 @@ class ApplicationKeywords:
         示例:
             | ${is_running} | 应用是否运行 | 别名=notepad++ |
         """
-        logger.info(f"检查应用是否运行: {app_alias}")
+        if keyword_info_enabled():
+            logger.info("检查应用是否运行: %s", app_alias)
         return self.app_service.is_application_running(app_alias)
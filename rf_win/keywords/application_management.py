@@ -19,6 +19,16 @@ class ApplicationManagementKeywords:
     - 等待应用主窗口
     """
     
+    __slots__ = (
+        "_library",
+        "_applications",
+        "_get_backend",
+        "_get_application",
+        "_add_application",
+        "_remove_application",
+        "_application_service",
+    )
+    
     def __init__(self, library):
         """初始化应用管理关键字
         
@@ -7,7 +7,7 @@
 
 from .. import keyword, library
 from ..services.control_service import ControlService
-from ..utils.logger import logger
+from ..utils.logger import keyword_info_enabled, logger
 
 @library(scope='GLOBAL', version='1.0.0')
 class ControlKeywords:
@@ -18,7 +18,7 @@ class ControlKeywords:
     
     def __init__(self):
         """初始化控件服务实例"""
-        self.control_service = ControlService()
+        self.control_service = ControlService.instance()
     
     @keyword(name='查找控件', tags=['控件管理'])
     def find_control(self, locator, window_title=None, app_alias=None, timeout=None):
@@ -38,7 +38,8 @@ class ControlKeywords:
         示例:
             | ${button} | 查找控件 | Button:name=确定 | 窗口标题=Untitled - Notepad |
         """
-        logger.info(f"查找控件: 定位器={locator}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}")
+        if keyword_info_enabled():
+            logger.info("查找控件: 定位器=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, window_title, app_alias, timeout)
         return self.control_service.find_control(locator, window_title, app_alias, timeout)
     
     @keyword(name='查找所有控件', tags=['控件管理'])
@@ -59,7 +60,8 @@ class ControlKeywords:
         示例:
             | ${buttons} | 查找所有控件 | Button: | 窗口标题=Untitled - Notepad |
         """
-        logger.info(f"查找所有控件: 定位器={locator}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}")
+        if keyword_info_enabled():
+            logger.info("查找所有控件: 定位器=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, window_title, app_alias, timeout)
         return self.control_service.find_all_controls(locator, window_title, app_alias, timeout)
     
     @keyword(name='点击控件', tags=['控件管理'])
@@ -81,7 +83,8 @@ class ControlKeywords:
             | 点击控件 | Button:name=确定 | 窗口标题=Untitled - Notepad | 按钮=right |
             | 点击控件 | Button:name=确定 | 窗口标题=Untitled - Notepad | 双击=True |
         """
-        logger.info(f"点击控件: 定位器={locator}, 窗口标题={window_title}, 应用别名={app_alias}, 按钮={button}, 双击={double}, 超时={timeout}")
+        if keyword_info_enabled():
+            logger.info("点击控件: 定位器=%s, 窗口标题=%s, 应用别名=%s, 按钮=%s, 双击=%s, 超时=%s", locator, window_title, app_alias, button, double, timeout)
         return self.control_service.click_control(locator, window_title, app_alias, button, double, timeout)
     
     @keyword(name='右键点击控件', tags=['控件管理'])
@@ -99,7 +102,8 @@ class ControlKeywords:
         示例:
             | 右键点击控件 | Button:name=确定 | 窗口标题=Untitled - Notepad |
         """
-        logger.info(f"右键点击控件: 定位器={locator}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}")
+        if keyword_info_enabled():
+            logger.info("右键点击控件: 定位器=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, window_title, app_alias, timeout)
         return self.control_service.click_control(locator, window_title, app_alias, 'right', False, timeout)
     
     @keyword(name='双击控件', tags=['控件管理'])
@@ -117,7 +121,8 @@ class ControlKeywords:
         示例:
             | 双击控件 | Button:name=确定 | 窗口标题=Untitled - Notepad |
         """
-        logger.info(f"双击控件: 定位器={locator}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}")
+        if keyword_info_enabled():
+            logger.info("双击控件: 定位器=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, window_title, app_alias, timeout)
         return self.control_service.click_control(locator, window_title, app_alias, 'left', True, timeout)
     
     @keyword(name='控件输入文本', tags=['控件管理'])
@@ -138,7 +143,8 @@ class ControlKeywords:
             | 控件输入文本 | Edit:name=文本编辑框 | Hello World | 窗口标题=Untitled - Notepad |
             | 控件输入文本 | Edit:name=文本编辑框 | Hello | 窗口标题=Untitled - Notepad | 清空=False |
         """
-        logger.info(f"控件输入文本: 定位器={locator}, 文本={text}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}, 清空={clear_first}")
+        if keyword_info_enabled():
+            logger.info("控件输入文本: 定位器=%s, 文本=%s, 窗口标题=%s, 应用别名=%s, 超时=%s, 清空=%s", locator, text, window_title, app_alias, timeout, clear_first)
         return self.control_service.set_control_text(locator, text, window_title, app_alias, timeout, clear_first)
     
     @keyword(name='获取控件文本', tags=['控件管理'])
@@ -159,7 +165,8 @@ class ControlKeywords:
         示例:
             | ${text} | 获取控件文本 | Edit:name=文本编辑框 | 窗口标题=Untitled - Notepad |
         """
-        logger.info(f"获取控件文本: 定位器={locator}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}")
+        if keyword_info_enabled():
+            logger.info("获取控件文本: 定位器=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, window_title, app_alias, timeout)
         return self.control_service.get_control_text(locator, window_title, app_alias, timeout)
     
     @keyword(name='清空控件文本', tags=['控件管理'])
@@ -177,7 +184,8 @@ class ControlKeywords:
         示例:
             | 清空控件文本 | Edit:name=文本编辑框 | 窗口标题=Untitled - Notepad |
         """
-        logger.info(f"清空控件文本: 定位器={locator}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}")
+        if keyword_info_enabled():
+            logger.info("清空控件文本: 定位器=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, window_title, app_alias, timeout)
         return self.control_service.clear_control_text(locator, window_title, app_alias, timeout)
     
     @keyword(name='选择控件项', tags=['控件管理'])
@@ -197,7 +205,8 @@ class ControlKeywords:
             | 选择控件项 | ComboBox:name=下拉列表 | 选项1 | 窗口标题=Untitled - Notepad |
             | 选择控件项 | ListBox:name=列表框 | 0 | 窗口标题=Untitled - Notepad |
         """
-        logger.info(f"选择控件项: 定位器={locator}, 项={item}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}")
+        if keyword_info_enabled():
+            logger.info("选择控件项: 定位器=%s, 项=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, item, window_title, app_alias, timeout)
         return self.control_service.select_control_item(locator, item, window_title, app_alias, timeout)
     
     @keyword(name='获取控件项', tags=['控件管理'])
@@ -218,7 +227,8 @@ class ControlKeywords:
         示例:
             | ${items} | 获取控件项 | ComboBox:name=下拉列表 | 窗口标题=Untitled - Notepad |
         """
-        logger.info(f"获取控件项: 定位器={locator}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}")
+        if keyword_info_enabled():
+            logger.info("获取控件项: 定位器=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, window_title, app_alias, timeout)
         return self.control_service.get_control_items(locator, window_title, app_alias, timeout)
     
     @keyword(name='控件是否存在', tags=['控件管理'])
@@ -239,7 +249,8 @@ class ControlKeywords:
         示例:
             | ${exists} | 控件是否存在 | Button:name=确定 | 窗口标题=Untitled - Notepad |
         """
-        logger.info(f"检查控件是否存在: 定位器={locator}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}")
+        if keyword_info_enabled():
+            logger.info("检查控件是否存在: 定位器=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, window_title, app_alias, timeout)
         return self.control_service.is_control_exists(locator, window_title, app_alias, timeout)
     
     @keyword(name='控件是否可见', tags=['控件管理'])
@@ -260,7 +271,8 @@ class ControlKeywords:
         示例:
             | ${visible} | 控件是否可见 | Button:name=确定 | 窗口标题=Untitled - Notepad |
         """
-        logger.info(f"检查控件是否可见: 定位器={locator}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}")
+        if keyword_info_enabled():
+            logger.info("检查控件是否可见: 定位器=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, window_title, app_alias, timeout)
         return self.control_service.is_control_visible(locator, window_title, app_alias, timeout)
     
     @keyword(name='控件是否启用', tags=['控件管理'])
@@ -281,7 +293,8 @@ class ControlKeywords:
         示例:
             | ${enabled} | 控件是否启用 | Button:name=确定 | 窗口标题=Untitled - Notepad |
         """
-        logger.info(f"检查控件是否启用: 定位器={locator}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}")
+        if keyword_info_enabled():
+            logger.info("检查控件是否启用: 定位器=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, window_title, app_alias, timeout)
         return self.control_service.is_control_enabled(locator, window_title, app_alias, timeout)
     
     @keyword(name='获取控件属性', tags=['控件管理'])
@@ -303,7 +316,8 @@ class ControlKeywords:
         示例:
             | ${value} | 获取控件属性 | Edit:name=文本编辑框 | value | 窗口标题=Untitled - Notepad |
         """
-        logger.info(f"获取控件属性: 定位器={locator}, 属性名={property_name}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}")
+        if keyword_info_enabled():
+            logger.info("获取控件属性: 定位器=%s, 属性名=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, property_name, window_title, app_alias, timeout)
         return self.control_service.get_control_property(locator, property_name, window_title, app_alias, timeout)
     
     @keyword(name='设置控件属性', tags=['控件管理'])
@@ -323,5 +337,6 @@ class ControlKeywords:
         示例:
             | 设置控件属性 | Edit:name=文本编辑框 | value | New Value | 窗口标题=Untitled - Notepad |
         """
-        logger.info(f"设置控件属性: 定位器={locator}, 属性名={property_name}, 值={value}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}")
+        if keyword_info_enabled():
+            logger.info("设置控件属性: 定位器=%s, 属性名=%s, 值=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, property_name, value, window_title, app_alias, timeout)
         return self.control_service.set_control_property(locator, property_name, value, window_title, app_alias, timeout)
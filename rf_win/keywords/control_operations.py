@@ -1,11 +1,16 @@
 # 控件操作关键字模块
 # 实现控件相关的Robot Framework关键字
 
+import sys
 from typing import Any, List, Optional
 from robot.api import logger
 
 from ..core.base_control import BaseControl
 
+def _intern(value: Any) -> Any:
+    """驻留字符串参数；数字等非字符串参数和str子类无法驻留，原样返回"""
+    return sys.intern(value) if type(value) is str else value
+
 class ControlOperationsKeywords:
     """控件操作关键字类
     
@@ -23,6 +28,18 @@ class ControlOperationsKeywords:
     - 拖拽控件
     """
     
+    __slots__ = (
+        "_library",
+        "_windows",
+        "_controls",
+        "_get_backend",
+        "_get_window",
+        "_get_control",
+        "_add_control",
+        "_remove_control",
+        "_control_service",
+    )
+    
     def __init__(self, library):
         """初始化控件操作关键字
         
@@ -62,6 +79,9 @@ class ControlOperationsKeywords:
         import time
         from ..config.global_config import global_config
         
+        # 驻留定位器和控件ID字符串，后续作为字典键时可直接按指针比较
+        locator = _intern(locator)
+        
         window = self._get_window(window_id)
         if not window:
             raise ValueError(f"Window not found: {window_id}")
@@ -73,6 +93,7 @@ class ControlOperationsKeywords:
         
         if control_id is None:
             control_id = f"control_{int(time.time())}"
+        control_id = _intern(control_id)
         
         backend_instance = self._get_backend()
         control = backend_instance.create_control(element, window)
@@ -100,6 +121,7 @@ class ControlOperationsKeywords:
             | Click Element | open_button | count=2 |
             | Click Element | btn | x_offset=10 | y_offset=10 |
         """
+        control_id = _intern(control_id)
         control = self._get_control(control_id)
         if not control:
             raise ValueError(f"Control not found: {control_id}")
@@ -158,6 +180,7 @@ class ControlOperationsKeywords:
             | Type Text | password_edit | 123456 | clear_first=False |
             | Type Text | search_edit | hello world | slow=True | interval=0.1 |
         """
+        control_id = _intern(control_id)
         control = self._get_control(control_id)
         if not control:
             raise ValueError(f"Control not found: {control_id}")
@@ -179,6 +202,7 @@ class ControlOperationsKeywords:
         Example:
             | Clear Element Text | username_edit |
         """
+        control_id = _intern(control_id)
         control = self._get_control(control_id)
         if not control:
             raise ValueError(f"Control not found: {control_id}")
@@ -199,6 +223,7 @@ class ControlOperationsKeywords:
         Example:
             | ${text} | Get Element Text | title_label |
         """
+        control_id = _intern(control_id)
         control = self._get_control(control_id)
         if not control:
             raise ValueError(f"Control not found: {control_id}")
@@ -218,6 +243,7 @@ class ControlOperationsKeywords:
         Example:
             | Set Element Text | username_edit | new_user |
         """
+        control_id = _intern(control_id)
         control = self._get_control(control_id)
         if not control:
             raise ValueError(f"Control not found: {control_id}")
@@ -238,6 +264,7 @@ class ControlOperationsKeywords:
         Example:
             | Select Element | checkbox_remember |
         """
+        control_id = _intern(control_id)
         control = self._get_control(control_id)
         if not control:
             raise ValueError(f"Control not found: {control_id}")
@@ -258,6 +285,7 @@ class ControlOperationsKeywords:
         Example:
             | Deselect Element | checkbox_remember |
         """
+        control_id = _intern(control_id)
         control = self._get_control(control_id)
         if not control:
             raise ValueError(f"Control not found: {control_id}")
@@ -278,6 +306,7 @@ class ControlOperationsKeywords:
         Example:
             | ${is_selected} | Is Element Selected | checkbox_remember |
         """
+        control_id = _intern(control_id)
         control = self._get_control(control_id)
         if not control:
             raise ValueError(f"Control not found: {control_id}")
@@ -296,6 +325,7 @@ class ControlOperationsKeywords:
         Example:
             | ${is_enabled} | Is Element Enabled | btn_login |
         """
+        control_id = _intern(control_id)
         control = self._get_control(control_id)
         if not control:
             raise ValueError(f"Control not found: {control_id}")
@@ -314,6 +344,7 @@ class ControlOperationsKeywords:
         Example:
             | ${is_visible} | Is Element Visible | loading_panel |
         """
+        control_id = _intern(control_id)
         control = self._get_control(control_id)
         if not control:
             raise ValueError(f"Control not found: {control_id}")
@@ -334,6 +365,7 @@ class ControlOperationsKeywords:
             | ${value} | Get Element Attribute | btn_login | enabled |
             | ${text} | Get Element Attribute | label_title | text |
         """
+        control_id = _intern(control_id)
         control = self._get_control(control_id)
         if not control:
             raise ValueError(f"Control not found: {control_id}")
@@ -354,6 +386,7 @@ class ControlOperationsKeywords:
         Example:
             | Set Element Attribute | btn_login | enabled | True |
         """
+        control_id = _intern(control_id)
         control = self._get_control(control_id)
         if not control:
             raise ValueError(f"Control not found: {control_id}")
@@ -377,6 +410,7 @@ class ControlOperationsKeywords:
         Example:
             | Hover Element | menu_item | duration=1 |
         """
+        control_id = _intern(control_id)
         control = self._get_control(control_id)
         if not control:
             raise ValueError(f"Control not found: {control_id}")
@@ -400,6 +434,7 @@ class ControlOperationsKeywords:
             | Drag Element To | slider | [500, 300] | duration=0.5 |
             | Drag Element To | source_item | target_item |
         """
+        source_control_id = _intern(source_control_id)
         source_control = self._get_control(source_control_id)
         if not source_control:
             raise ValueError(f"Source control not found: {source_control_id}")
@@ -407,6 +442,7 @@ class ControlOperationsKeywords:
         # 处理目标
         if isinstance(target, str):
             # 目标是控件ID
+            target = _intern(target)
             target_control = self._get_control(target)
             if not target_control:
                 raise ValueError(f"Target control not found: {target}")
@@ -7,7 +7,7 @@
 
 from .. import keyword, library
 from ..modules.data_io import DataIO
-from ..utils.logger import logger
+from ..utils.logger import keyword_info_enabled, logger
 
 @library(scope='GLOBAL', version='1.0.0')
 class DataIOKeywords:
@@ -37,7 +37,8 @@ class DataIOKeywords:
             | ${content} | 读取文本文件 | C:/test.txt |
             | ${content} | 读取文本文件 | C:/test.txt | 编码=gbk |
         """
-        logger.info(f"读取文本文件: {file_path}, 编码: {encoding}")
+        if keyword_info_enabled():
+            logger.info("读取文本文件: %s, 编码: %s", file_path, encoding)
         return self.data_io.read_text_file(file_path, encoding)
     
     @keyword(name='写入文本文件', tags=['数据IO'])
@@ -56,7 +57,8 @@ class DataIOKeywords:
             | 写入文本文件 | C:/test.txt | Hello World |
             | 写入文本文件 | C:/test.txt | Append Text | 追加=True |
         """
-        logger.info(f"写入文本文件: {file_path}, 编码: {encoding}, 追加: {append}")
+        if keyword_info_enabled():
+            logger.info("写入文本文件: %s, 编码: %s, 追加: %s", file_path, encoding, append)
         return self.data_io.write_text_file(file_path, content, encoding, append)
     
     @keyword(name='读取 JSON 文件', tags=['数据IO'])
@@ -75,7 +77,8 @@ class DataIOKeywords:
         示例:
             | ${data} | 读取 JSON 文件 | C:/test.json |
         """
-        logger.info(f"读取JSON文件: {file_path}, 编码: {encoding}")
+        if keyword_info_enabled():
+            logger.info("读取JSON文件: %s, 编码: %s", file_path, encoding)
         return self.data_io.read_json_file(file_path, encoding)
     
     @keyword(name='写入 JSON 文件', tags=['数据IO'])
@@ -93,7 +96,8 @@ class DataIOKeywords:
         示例:
             | 写入 JSON 文件 | C:/test.json | ${data} | 缩进=2 |
         """
-        logger.info(f"写入JSON文件: {file_path}, 编码: {encoding}, 缩进: {indent}")
+        if keyword_info_enabled():
+            logger.info("写入JSON文件: %s, 编码: %s, 缩进: %s", file_path, encoding, indent)
         return self.data_io.write_json_file(file_path, data, encoding, indent)
     
     @keyword(name='读取 CSV 文件', tags=['数据IO'])
@@ -115,7 +119,8 @@ class DataIOKeywords:
             | ${data} | 读取 CSV 文件 | C:/test.csv |
             | ${data} | 读取 CSV 文件 | C:/test.csv | 分隔符=; | 表头=False |
         """
-        logger.info(f"读取CSV文件: {file_path}, 编码: {encoding}, 分隔符: {delimiter}, 表头: {header}")
+        if keyword_info_enabled():
+            logger.info("读取CSV文件: %s, 编码: %s, 分隔符: %s, 表头: %s", file_path, encoding, delimiter, header)
         return self.data_io.read_csv_file(file_path, encoding, delimiter, header)
     
     @keyword(name='写入 CSV 文件', tags=['数据IO'])
@@ -134,7 +139,8 @@ class DataIOKeywords:
         示例:
             | 写入 CSV 文件 | C:/test.csv | ${data} | 分隔符=; |
         """
-        logger.info(f"写入CSV文件: {file_path}, 编码: {encoding}, 分隔符: {delimiter}, 表头: {header}")
+        if keyword_info_enabled():
+            logger.info("写入CSV文件: %s, 编码: %s, 分隔符: %s, 表头: %s", file_path, encoding, delimiter, header)
         return self.data_io.write_csv_file(file_path, data, encoding, delimiter, header)
     
     @keyword(name='读取 Excel 文件', tags=['数据IO'])
@@ -156,7 +162,8 @@ class DataIOKeywords:
             | ${data} | 读取 Excel 文件 | C:/test.xlsx |
             | ${data} | 读取 Excel 文件 | C:/test.xlsx | 工作表名=Sheet2 | 行限制=10 |
         """
-        logger.info(f"读取Excel文件: {file_path}, 工作表名: {sheet_name}, 行限制: {row_limit}, 列限制: {col_limit}")
+        if keyword_info_enabled():
+            logger.info("读取Excel文件: %s, 工作表名: %s, 行限制: %s, 列限制: %s", file_path, sheet_name, row_limit, col_limit)
         return self.data_io.read_excel_file(file_path, sheet_name, row_limit, col_limit)
     
     @keyword(name='写入 Excel 文件', tags=['数据IO'])
@@ -175,5 +182,6 @@ class DataIOKeywords:
             | 写入 Excel 文件 | C:/test.xlsx | ${data} | 工作表名=Sheet2 |
             | 写入 Excel 文件 | C:/test.xlsx | ${data} | 追加=True |
         """
-        logger.info(f"写入Excel文件: {file_path}, 工作表名: {sheet_name}, 追加: {append}")
+        if keyword_info_enabled():
+            logger.info("写入Excel文件: %s, 工作表名: %s, 追加: %s", file_path, sheet_name, append)
         return self.data_io.write_excel_file(file_path, data, sheet_name, append)
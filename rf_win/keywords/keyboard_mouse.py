@@ -1,9 +1,14 @@
 # 鼠标键盘操作关键字模块
 # 实现鼠标键盘相关的Robot Framework关键字
 
+import sys
 from typing import Any, List, Optional
 from robot.api import logger
 
+def _intern(value: Any) -> Any:
+    """驻留字符串参数；数字等非字符串参数和str子类无法驻留，原样返回"""
+    return sys.intern(value) if type(value) is str else value
+
 class KeyboardMouseKeywords:
     """鼠标键盘操作关键字类
     
@@ -19,6 +24,8 @@ class KeyboardMouseKeywords:
     - 键盘输入文本
     """
     
+    __slots__ = ("_library", "_operation")
+    
     def __init__(self, library):
         """初始化鼠标键盘操作关键字
         
@@ -74,7 +81,7 @@ class KeyboardMouseKeywords:
         logger.info(f"Mouse move to ({x}, {y}) with duration {duration}s: {result}")
         return result
     
-    def mouse_drag(self, start_x: int, start_y: int, end_x: int, end_y: int, duration: float = 1.0) -> bool:
+    def mouse_drag(self, start_x: int, start_y: int, end_x: int, end_y: int, duration: float = 0) -> bool:
         """鼠标拖拽
         
         Args:
@@ -82,7 +89,7 @@ class KeyboardMouseKeywords:
             start_y: 起始Y坐标（像素）
             end_x: 结束X坐标（像素）
             end_y: 结束Y坐标（像素）
-            duration: 拖拽时长（秒），默认1.0
+            duration: 拖拽时长（秒），默认0，即立即从起点拖到终点；大于0时按该时长平滑移动
         
         Returns:
             是否拖拽成功
@@ -170,6 +177,7 @@ class KeyboardMouseKeywords:
         if not self._operation:
             raise RuntimeError("Operation object not initialized")
         
+        key = _intern(key)
         result = self._operation.press_key(key)
         logger.info(f"Press key {key}: {result}")
         return result
@@ -190,6 +198,7 @@ class KeyboardMouseKeywords:
         if not self._operation:
             raise RuntimeError("Operation object not initialized")
         
+        keys = _intern(keys)
         result = self._operation.press_keys(keys)
         logger.info(f"Press keys {keys}: {result}")
         return result
@@ -209,6 +218,7 @@ class KeyboardMouseKeywords:
         if not self._operation:
             raise RuntimeError("Operation object not initialized")
         
+        key = _intern(key)
         result = self._operation.key_down(key)
         logger.info(f"Key down {key}: {result}")
         return result
@@ -228,6 +238,7 @@ class KeyboardMouseKeywords:
         if not self._operation:
             raise RuntimeError("Operation object not initialized")
         
+        key = _intern(key)
         result = self._operation.key_up(key)
         logger.info(f"Key up {key}: {result}")
         return result
@@ -1,7 +1,7 @@
 # 截图关键字模块
 # 实现截图相关的Robot Framework关键字
 
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Tuple
 from robot.api import logger
 
 class ScreenshotKeywords:
@@ -13,6 +13,8 @@ class ScreenshotKeywords:
     - 捕获控件截图
     """
     
+    __slots__ = ("_library", "_operation", "_get_window", "_get_control", "_embed_html")
+    
     def __init__(self, library):
         """初始化截图关键字
         
@@ -21,9 +23,65 @@ class ScreenshotKeywords:
         """
         self._library = library
         self._operation = library._operation
+        # 直接绑定主库的注册表查询方法：注册表本身就是按ID索引的字典，
+        # 再加一层按ID的缓存只会多一次查找，并在ID被重新注册时返回过期对象
         self._get_window = library._get_window
         self._get_control = library._get_control
+        # 是否在报告中嵌入截图
+        self._embed_html = getattr(library, 'screenshot_embed', True)
+    
+    def set_screenshot_embed(self, embed: bool = True) -> bool:
+        """设置是否在Robot Framework报告中嵌入截图
+        
+        截图频繁时关闭嵌入可以减小报告体积，截图文件仍会正常保存
+        
+        Args:
+            embed: 是否嵌入截图，默认True
+        
+        Returns:
+            设置前的值
+        
+        Example:
+            | Set Screenshot Embed | ${False} |
+            | Set Screenshot Embed | ${True} |
+        """
+        if isinstance(embed, str):
+            embed = embed.lower() in ["true", "1", "yes"]
+        previous = self._embed_html
+        self._embed_html = bool(embed)
+        logger.info(f"Screenshot embed set to: {self._embed_html}")
+        return previous
+        
+    def flush_screenshots(self, timeout: Optional[float] = None) -> bool:
+        """等待后台截图全部写入磁盘
+        
+        截图关键字默认等待写盘完成；以wait=False保存的截图需要在读取截图文件前调用此关键字
+        
+        Args:
+            timeout: 超时时间（秒），None表示一直等待
+        
+        Returns:
+            所有截图是否都已成功写入
+        
+        Example:
+            | Capture Screenshot |
+            | Flush Screenshots |
+            | ${ok} | Flush Screenshots | timeout=10 |
+        """
+        if not self._operation:
+            raise RuntimeError("Operation object not initialized")
         
+        # 只有异步保存截图的操作实现才需要等待
+        wait_for_screenshots = getattr(self._operation, 'wait_for_screenshots', None)
+        if wait_for_screenshots is None:
+            return True
+        if timeout is not None:
+            timeout = float(timeout)
+        flushed = wait_for_screenshots(timeout)
+        if not flushed:
+            logger.warn("Some screenshots were not written")
+        return flushed
+    
     def capture_screenshot(self, filename: Optional[str] = None, x: int = 0, y: int = 0, width: int = 0, height: int = 0) -> str:
         """捕获屏幕截图
         
@@ -49,12 +107,39 @@ class ScreenshotKeywords:
         if screenshot_path:
             logger.info(f"Captured screenshot: {screenshot_path}")
             # 嵌入到Robot Framework报告
-            logger.info(f"<img src='{screenshot_path}' width='800' />", html=True)
+            if self._embed_html:
+                logger.info("<img src='%s' width='800' />" % screenshot_path, html=True)
         else:
             logger.warn("Failed to capture screenshot")
         
         return screenshot_path
     
+    def capture_screenshot_raw(self, x: int = 0, y: int = 0, width: int = 0, height: int = 0) -> Tuple[memoryview, Tuple[int, int]]:
+        """捕获屏幕像素数据，不保存文件
+        
+        适用于OCR、图像比对等只需要像素的场景，省去PNG编码和再解码
+        
+        Args:
+            x: 起始X坐标（像素），0表示全屏
+            y: 起始Y坐标（像素），0表示全屏
+            width: 截图宽度（像素），0表示全屏
+            height: 截图高度（像素），0表示全屏
+        
+        Returns:
+            (像素数据, (宽度, 高度))，像素数据为按BGRA排列的memoryview
+        
+        Example:
+            | ${pixels} | ${size} | Capture Screenshot Raw | x=100 | y=100 | width=600 | height=400 |
+        """
+        if not self._operation:
+            raise RuntimeError("Operation object not initialized")
+        
+        result = self._operation.capture_screenshot_raw(int(x), int(y), int(width), int(height))
+        if result is None:
+            raise RuntimeError("Failed to capture screenshot pixels")
+        logger.info("Captured screenshot pixels: %dx%d" % result[1])
+        return result
+    
     def capture_window_screenshot(self, window_id: str, filename: Optional[str] = None) -> str:
         """捕获窗口截图
         
@@ -79,7 +164,8 @@ class ScreenshotKeywords:
         if screenshot_path:
             logger.info(f"Captured window {window_id} screenshot: {screenshot_path}")
             # 嵌入到Robot Framework报告
-            logger.info(f"<img src='{screenshot_path}' width='800' />", html=True)
+            if self._embed_html:
+                logger.info("<img src='%s' width='800' />" % screenshot_path, html=True)
         else:
             logger.warn(f"Failed to capture window {window_id} screenshot")
         
@@ -109,7 +195,8 @@ class ScreenshotKeywords:
         if screenshot_path:
             logger.info(f"Captured element {control_id} screenshot: {screenshot_path}")
             # 嵌入到Robot Framework报告
-            logger.info(f"<img src='{screenshot_path}' width='800' />", html=True)
+            if self._embed_html:
+                logger.info("<img src='%s' width='800' />" % screenshot_path, html=True)
         else:
             logger.warn(f"Failed to capture element {control_id} screenshot")
         
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+关键字生成模块
+根据关键字表为只转发到服务层的关键字批量生成方法
+"""
+
+import functools
+import inspect
+
+from .. import keyword
+from ..utils.logger import keyword_info_enabled, logger
+
+# 参数在日志中显示的名称
+_ARG_LABELS = {
+    'x': 'x',
+    'y': 'y',
+    'start_x': '起始x',
+    'start_y': '起始y',
+    'end_x': '结束x',
+    'end_y': '结束y',
+    'button': '按钮',
+    'double': '双击',
+    'duration': '持续时间',
+    'clicks': '距离',
+    'horizontal': '水平',
+    'text': '文本',
+    'delay': '延迟',
+    'key': '键',
+    'keys': '组合键',
+    'modifier': '修饰键',
+    'seconds': '秒数',
+    'locator': '定位器',
+    'window_title': '窗口标题',
+    'app_alias': '应用别名',
+    'index': '索引',
+    'timeout': '超时',
+    'width': '宽度',
+    'height': '高度',
+    'filename': '文件名',
+    'folder': '文件夹',
+}
+
+
+def _build_shim(service_cls, spec):
+    """根据一行关键字表生成关键字方法
+
+    生成的方法调用实例上预先绑定的服务方法self._<方法名>
+
+    参数:
+        service_cls: 服务类，用于获取方法文档
+        spec: (关键字名称, 服务方法名, 参数名元组, 默认值字典, 标签列表, 示例元组)
+
+    返回:
+        已添加keyword装饰的函数
+    """
+    name, method, args, defaults, tags, examples = spec
+
+    attr = f'_{method}'
+    arity = len(args)
+    labels = ', '.join(f'{_ARG_LABELS.get(arg, arg)}=%s' for arg in args)
+    log_format = f'{name}: {labels}' if args else name
+    # Robot Framework通过inspect.signature读取关键字参数，签名按关键字表构造
+    signature = inspect.Signature([
+        inspect.Parameter('self', inspect.Parameter.POSITIONAL_OR_KEYWORD),
+        *(inspect.Parameter(arg, inspect.Parameter.POSITIONAL_OR_KEYWORD, default=defaults.get(arg, inspect.Parameter.empty))
+          for arg in args),
+    ])
+
+    @functools.wraps(getattr(service_cls, method))
+    def shim(self, *values, **named):
+        # 位置参数齐全时直接转发，否则按签名补齐关键字参数和默认值
+        if named or len(values) != arity:
+            bound = signature.bind(self, *values, **named)
+            bound.apply_defaults()
+            values = bound.args[1:]
+        if keyword_info_enabled():
+            logger.info(log_format, *values)
+        return getattr(self, attr)(*values)
+
+    shim.__signature__ = signature
+
+    # 文档沿用服务方法的说明，并补充关键字示例
+    doc = inspect.getdoc(getattr(service_cls, method)) or name
+    if examples:
+        doc += '\n\n示例:\n' + '\n'.join(f'    {line}' for line in examples)
+    shim.__doc__ = doc
+
+    return keyword(name=name, tags=tags)(shim)
+
+
+def keyword_table(service_cls, specs):
+    """类装饰器，按关键字表为关键字类生成转发方法
+
+    每个生成的方法只做延迟格式化的日志记录和一次服务方法调用，
+    生成工作在导入时完成一次。关键字类需在__init__中调用
+    bind_service_methods绑定服务方法
+
+    参数:
+        service_cls: 服务类
+        specs: 关键字表，每行为(关键字名称, 服务方法名, 参数名元组, 默认值字典, 标签列表, 示例元组)
+
+    返回:
+        类装饰器
+    """
+    def decorator(cls):
+        cls._service_methods = tuple(spec[1] for spec in specs)
+        for spec in specs:
+            shim = _build_shim(service_cls, spec)
+            shim.__qualname__ = f'{cls.__name__}.{shim.__name__}'
+            shim.__module__ = cls.__module__
+            setattr(cls, shim.__name__, shim)
+        return cls
+    return decorator
+
+
+def bind_service_methods(instance, service, extra=()):
+    """将服务的绑定方法缓存为实例属性_<方法名>
+
+    关键字调用时只需一次实例属性查找，不再每次解析服务属性和方法
+
+    参数:
+        instance: 关键字类实例
+        service: 服务实例
+        extra: 手写关键字额外使用的服务方法名
+    """
+    for method in (*getattr(type(instance), '_service_methods', ()), *extra):
+        setattr(instance, f'_{method}', getattr(service, method))
@@ -1,11 +1,24 @@
 # 窗口管理关键字模块
 # 实现窗口相关的Robot Framework关键字
 
-from typing import Any, List, Optional
+from itertools import count
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 from robot.api import logger
 
+from ..config.global_config import global_config
 from ..core.base_application import BaseApplication
 from ..core.base_window import BaseWindow
+from ..utils.logger import keyword_info_enabled
+
+if TYPE_CHECKING:
+    from ..library import RFWinLibrary
+
+# 自动生成窗口ID的序号，同一秒内获取多个窗口时ID也不会重复
+_window_ids: "count[int]" = count()
+
+# 模块级缓存日志函数，关键字中无需每次解析logger属性
+_log_info = logger.info
+_log_warn = logger.warn
 
 class WindowManagementKeywords:
     """窗口管理关键字类
@@ -20,7 +33,19 @@ class WindowManagementKeywords:
     - 窗口等待
     """
     
-    def __init__(self, library):
+    __slots__ = (
+        "_library",
+        "_applications",
+        "_windows",
+        "_get_backend",
+        "_get_application",
+        "_get_window",
+        "_add_window",
+        "_remove_window",
+        "_window_service",
+    )
+    
+    def __init__(self, library: "RFWinLibrary") -> None:
         """初始化窗口管理关键字
         
         Args:
@@ -28,13 +53,46 @@ class WindowManagementKeywords:
         """
         self._library = library
         self._applications = library._applications
-        self._windows = library._windows
+        self._windows: Dict[str, BaseWindow] = library._windows
         self._get_backend = library._get_backend
         self._get_application = library._get_application
-        self._get_window = library._get_window
+        # 查询直接绑定窗口注册表的字典方法，省去主库中转的一层函数调用；
+        # 增删仍经过主库，以便主库清空最近命中的窗口缓存
+        self._get_window = library._windows.get
         self._add_window = library._add_window
         self._remove_window = library._remove_window
         self._window_service = library._window_service
+    
+    def _require_window(self, window_id: str) -> BaseWindow:
+        """获取已注册的窗口对象，不存在时抛出ValueError
+        
+        Args:
+            window_id: 窗口ID
+        
+        Returns:
+            窗口对象
+        """
+        try:
+            return self._windows[window_id]
+        except KeyError:
+            raise ValueError(f"Window not found: {window_id}") from None
+    
+    def _drop_if_closed(self, window_id: str, window: BaseWindow, action: Callable[..., bool], *args: Any) -> bool:
+        """对窗口执行关闭或关闭检查操作，结果为True时从注册表移除窗口
+        
+        Args:
+            window_id: 窗口ID
+            window: 窗口对象
+            action: 窗口服务方法，第一个参数为底层窗口对象
+            *args: 传给action的其他参数
+        
+        Returns:
+            action的返回值
+        """
+        result = action(window._window, *args)
+        if result:
+            self._remove_window(window_id)
+        return result
         
     def get_main_window(self, app_id: str, window_id: Optional[str] = None) -> str:
         """获取应用的主窗口
@@ -58,14 +116,14 @@ class WindowManagementKeywords:
             raise RuntimeError(f"Failed to get main window for application: {app_id}")
         
         if window_id is None:
-            import time
-            window_id = f"window_{int(time.time())}"
+            window_id = f"window_{next(_window_ids)}"
         
         backend_instance = self._get_backend()
         window = backend_instance.create_window(main_window, app)
         self._add_window(window_id, window)
         
-        logger.info(f"Got main window for application {app_id}, window_id: {window_id}")
+        if __debug__ and keyword_info_enabled():
+            _log_info(f"Got main window for application {app_id}, window_id: {window_id}")
         return window_id
     
     def locate_window(self, app_id: str, window_identifier: Any, window_id: Optional[str] = None) -> str:
@@ -88,14 +146,14 @@ class WindowManagementKeywords:
             raise ValueError(f"Application not found: {app_id}")
         
         if window_id is None:
-            import time
-            window_id = f"window_{int(time.time())}"
+            window_id = f"window_{next(_window_ids)}"
         
         backend_instance = self._get_backend()
         window = backend_instance.create_window(window_identifier, app)
         self._add_window(window_id, window)
         
-        logger.info(f"Located window for application {app_id}, identifier: {window_identifier}, window_id: {window_id}")
+        if __debug__ and keyword_info_enabled():
+            _log_info(f"Located window for application {app_id}, identifier: {window_identifier}, window_id: {window_id}")
         return window_id
     
     def activate_window(self, window_id: str) -> bool:
@@ -110,12 +168,11 @@ class WindowManagementKeywords:
         Example:
             | Activate Window | notepad_window |
         """
-        window = self._get_window(window_id)
-        if not window:
-            raise ValueError(f"Window not found: {window_id}")
+        window = self._require_window(window_id)
         
         result = self._window_service.activate_window(window._window)
-        logger.info(f"Activate window {window_id}: {result}")
+        if __debug__ and keyword_info_enabled():
+            _log_info(f"Activate window {window_id}: {result}")
         return result
     
     def close_window(self, window_id: str, timeout: Optional[float] = None) -> bool:
@@ -132,21 +189,17 @@ class WindowManagementKeywords:
             | Close Window | notepad_window |
             | Close Window | app_window | timeout=20 |
         """
-        from ..config.global_config import global_config
-        
-        window = self._get_window(window_id)
-        if not window:
-            raise ValueError(f"Window not found: {window_id}")
+        window = self._require_window(window_id)
         
         if timeout is None:
             timeout = global_config.timeout
         
-        result = self._window_service.close_window(window._window, timeout)
+        result = self._drop_if_closed(window_id, window, self._window_service.close_window, timeout)
         if result:
-            self._remove_window(window_id)
-            logger.info(f"Closed window: {window_id}")
+            if __debug__ and keyword_info_enabled():
+                _log_info(f"Closed window: {window_id}")
         else:
-            logger.warn(f"Failed to close window: {window_id}")
+            _log_warn(f"Failed to close window: {window_id}")
         
         return result
     
@@ -162,12 +215,11 @@ class WindowManagementKeywords:
         Example:
             | Maximize Window | notepad_window |
         """
-        window = self._get_window(window_id)
-        if not window:
-            raise ValueError(f"Window not found: {window_id}")
+        window = self._require_window(window_id)
         
         result = self._window_service.maximize_window(window._window)
-        logger.info(f"Maximize window {window_id}: {result}")
+        if __debug__ and keyword_info_enabled():
+            _log_info(f"Maximize window {window_id}: {result}")
         return result
     
     def minimize_window(self, window_id: str) -> bool:
@@ -182,12 +234,11 @@ class WindowManagementKeywords:
         Example:
             | Minimize Window | notepad_window |
         """
-        window = self._get_window(window_id)
-        if not window:
-            raise ValueError(f"Window not found: {window_id}")
+        window = self._require_window(window_id)
         
         result = self._window_service.minimize_window(window._window)
-        logger.info(f"Minimize window {window_id}: {result}")
+        if __debug__ and keyword_info_enabled():
+            _log_info(f"Minimize window {window_id}: {result}")
         return result
     
     def restore_window(self, window_id: str) -> bool:
@@ -202,12 +253,11 @@ class WindowManagementKeywords:
         Example:
             | Restore Window | notepad_window |
         """
-        window = self._get_window(window_id)
-        if not window:
-            raise ValueError(f"Window not found: {window_id}")
+        window = self._require_window(window_id)
         
         result = self._window_service.restore_window(window._window)
-        logger.info(f"Restore window {window_id}: {result}")
+        if __debug__ and keyword_info_enabled():
+            _log_info(f"Restore window {window_id}: {result}")
         return result
     
     def resize_window(self, window_id: str, width: int, height: int) -> bool:
@@ -224,16 +274,15 @@ class WindowManagementKeywords:
         Example:
             | Resize Window | notepad_window | 800 | 600 |
         """
-        window = self._get_window(window_id)
-        if not window:
-            raise ValueError(f"Window not found: {window_id}")
+        window = self._require_window(window_id)
         
         rect = window.get_rect()
         if not rect:
             return False
         
         result = self._window_service.set_window_rect(window._window, rect[0], rect[1], width, height)
-        logger.info(f"Resize window {window_id} to {width}x{height}: {result}")
+        if __debug__ and keyword_info_enabled():
+            _log_info(f"Resize window {window_id} to {width}x{height}: {result}")
         return result
     
     def move_window(self, window_id: str, x: int, y: int) -> bool:
@@ -250,16 +299,15 @@ class WindowManagementKeywords:
         Example:
             | Move Window | notepad_window | 100 | 100 |
         """
-        window = self._get_window(window_id)
-        if not window:
-            raise ValueError(f"Window not found: {window_id}")
+        window = self._require_window(window_id)
         
         rect = window.get_rect()
         if not rect:
             return False
         
         result = self._window_service.set_window_rect(window._window, x, y, rect[2], rect[3])
-        logger.info(f"Move window {window_id} to ({x}, {y}): {result}")
+        if __debug__ and keyword_info_enabled():
+            _log_info(f"Move window {window_id} to ({x}, {y}): {result}")
         return result
     
     def get_window_title(self, window_id: str) -> Optional[str]:
@@ -274,31 +322,27 @@ class WindowManagementKeywords:
         Example:
             | ${title} | Get Window Title | notepad_window |
         """
-        window = self._get_window(window_id)
-        if not window:
-            raise ValueError(f"Window not found: {window_id}")
+        window = self._require_window(window_id)
         
         return self._window_service.get_window_title(window._window)
     
-    def get_window_rect(self, window_id: str) -> Optional[List[int]]:
+    def get_window_rect(self, window_id: str) -> Optional[Tuple[int, int, int, int]]:
         """获取窗口矩形区域
         
         Args:
             window_id: 窗口ID
         
         Returns:
-            窗口矩形 [x, y, width, height]，如果窗口已关闭则返回None
+            窗口矩形 (x, y, width, height)，只读元组，如果窗口已关闭则返回None
         
         Example:
             | ${rect} | Get Window Rect | notepad_window |
         """
-        window = self._get_window(window_id)
-        if not window:
-            raise ValueError(f"Window not found: {window_id}")
+        window = self._require_window(window_id)
         
         rect_dict = self._window_service.get_window_rect(window._window)
         if rect_dict:
-            return [rect_dict["x"], rect_dict["y"], rect_dict["width"], rect_dict["height"]]
+            return (rect_dict["x"], rect_dict["y"], rect_dict["width"], rect_dict["height"])
         return None
     
     def wait_for_window_close(self, window_id: str, timeout: Optional[float] = None) -> bool:
@@ -314,8 +358,6 @@ class WindowManagementKeywords:
         Example:
             | Wait For Window Close | notepad_window | timeout=15 |
         """
-        from ..config.global_config import global_config
-        
         window = self._get_window(window_id)
         if not window:
             return True
@@ -323,10 +365,9 @@ class WindowManagementKeywords:
         if timeout is None:
             timeout = global_config.timeout
         
-        result = self._window_service.wait_for_window_close(window._window, timeout)
-        if result:
-            self._remove_window(window_id)
-        logger.info(f"Wait for window {window_id} close: {result}")
+        result = self._drop_if_closed(window_id, window, self._window_service.wait_for_window_close, timeout)
+        if __debug__ and keyword_info_enabled():
+            _log_info(f"Wait for window {window_id} close: {result}")
         return result
     
     def is_window_active(self, window_id: str) -> bool:
@@ -341,9 +382,7 @@ class WindowManagementKeywords:
         Example:
             | ${is_active} | Is Window Active | notepad_window |
         """
-        window = self._get_window(window_id)
-        if not window:
-            raise ValueError(f"Window not found: {window_id}")
+        window = self._require_window(window_id)
         
         return self._window_service.is_window_active(window._window)
     
@@ -359,9 +398,7 @@ class WindowManagementKeywords:
         Example:
             | ${is_visible} | Is Window Visible | notepad_window |
         """
-        window = self._get_window(window_id)
-        if not window:
-            raise ValueError(f"Window not found: {window_id}")
+        window = self._require_window(window_id)
         
         return self._window_service.is_window_visible(window._window)
     
@@ -381,7 +418,4 @@ class WindowManagementKeywords:
         if not window:
             return True
         
-        result = self._window_service.is_window_closed(window._window)
-        if result:
-            self._remove_window(window_id)
-        return result
+        return self._drop_if_closed(window_id, window, self._window_service.is_window_closed)
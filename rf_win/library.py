@@ -4,7 +4,7 @@
 import os
 import sys
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from robot.api import logger
 from robot.libraries.BuiltIn import BuiltIn
 
@@ -16,6 +16,13 @@ from .core.base_window import BaseWindow
 from .core.base_control import BaseControl
 from .core.base_operation import BaseOperation
 
+# 按配置类型把字符串配置值转换为对应类型的函数，未列出的类型保持字符串
+_STR_CONVERTERS: Dict[type, Callable[[str], Any]] = {
+    int: int,
+    float: float,
+    bool: lambda value: value.lower() in ("true", "1", "yes"),
+}
+
 class RFWinLibrary:
     """Windows桌面自动化Robot Framework库
     
@@ -35,6 +42,84 @@ class RFWinLibrary:
     ROBOT_LIBRARY_VERSION = "1.0.0"
     ROBOT_LIBRARY_SCOPE = "GLOBAL"
     
+    # 关键字绑定表：关键字实例属性名 -> 绑定到主类的关键字方法名
+    _KEYWORD_BINDINGS = {
+        # 应用管理关键字
+        "_application_keywords": (
+            "start_application",
+            "attach_to_application",
+            "close_application",
+            "kill_application",
+            "check_application_running",
+            "get_application_process_id",
+            "wait_for_application_main_window",
+        ),
+        # 窗口管理关键字
+        "_window_keywords": (
+            "get_main_window",
+            "locate_window",
+            "activate_window",
+            "close_window",
+            "maximize_window",
+            "minimize_window",
+            "restore_window",
+            "resize_window",
+            "move_window",
+            "get_window_title",
+            "get_window_rect",
+            "wait_for_window_close",
+            "is_window_active",
+            "is_window_visible",
+            "is_window_closed",
+        ),
+        # 控件操作关键字
+        "_control_keywords": (
+            "find_element",
+            "click_element",
+            "right_click_element",
+            "double_click_element",
+            "type_text",
+            "clear_element_text",
+            "get_element_text",
+            "set_element_text",
+            "select_element",
+            "deselect_element",
+            "is_element_selected",
+            "is_element_enabled",
+            "is_element_visible",
+            "get_element_attribute",
+            "set_element_attribute",
+            "hover_element",
+            "drag_element_to",
+        ),
+        # 鼠标键盘关键字
+        "_keyboard_mouse_keywords": (
+            "mouse_click",
+            "mouse_move",
+            "mouse_drag",
+            "mouse_wheel",
+            "mouse_hover",
+            "get_mouse_position",
+            "press_key",
+            "press_keys",
+            "key_down",
+            "key_up",
+            "type_text_with_keyboard",
+        ),
+        # 截图关键字
+        "_screenshot_keywords": (
+            "capture_screenshot",
+            "capture_screenshot_raw",
+            "capture_window_screenshot",
+            "capture_element_screenshot",
+            "set_screenshot_embed",
+            "flush_screenshots",
+        ),
+    }
+    
+    # 配置项转换表，由_config_converters首次调用时生成
+    _CONFIG_CONVERTERS: Optional[Dict[str, Tuple[type, Callable[[str], Any]]]] = None
+    
     def __init__(self, **kwargs: Any):
         """初始化库
         
@@ -48,6 +133,10 @@ class RFWinLibrary:
         self._applications: Dict[str, BaseApplication] = {}
         self._windows: Dict[str, BaseWindow] = {}
         self._controls: Dict[str, BaseControl] = {}
+        # 最近一次命中的(ID, 对象)，连续操作同一对象时跳过字典查找，注册表增删时清空
+        self._last_application: Tuple[Optional[str], Optional[BaseApplication]] = (None, None)
+        self._last_window: Tuple[Optional[str], Optional[BaseWindow]] = (None, None)
+        self._last_control: Tuple[Optional[str], Optional[BaseControl]] = (None, None)
         
         # 操作对象
         self._operation: Optional[BaseOperation] = None
@@ -73,9 +162,25 @@ class RFWinLibrary:
         from .services.window_service import WindowService
         from .services.control_service import ControlService
         
-        self._application_service = ApplicationService()
-        self._window_service = WindowService()
-        self._control_service = ControlService()
+        self._application_service = ApplicationService.instance()
+        self._window_service = WindowService.instance()
+        self._control_service = ControlService.instance()
+    
+    @classmethod
+    def _config_converters(cls) -> Dict[str, Tuple[type, Callable[[str], Any]]]:
+        """获取各配置项的类型和字符串转换函数
+        
+        转换表按默认配置的类型生成一次，之后直接复用
+        
+        Returns:
+            配置项名称到(预期类型, 转换函数)的映射
+        """
+        if cls._CONFIG_CONVERTERS is None:
+            cls._CONFIG_CONVERTERS = {}
+            for config_key in CONFIG_KEY_MAP.values():
+                expected_type = type(getattr(global_config, config_key))
+                cls._CONFIG_CONVERTERS[config_key] = (expected_type, _STR_CONVERTERS.get(expected_type, str))
+        return cls._CONFIG_CONVERTERS
     
     def _init_config(self, **kwargs: Any) -> None:
         """初始化配置
@@ -85,57 +190,45 @@ class RFWinLibrary:
         Args:
             **kwargs: 初始化参数
         """
-        builtin = BuiltIn()
+        converters = self._config_converters()
         
-        # 从环境变量加载配置
+        # 一次取出全部Robot Framework变量，之后按名称在快照中查找
+        try:
+            rf_variables = BuiltIn().get_variables(no_decoration=True)
+        except Exception as e:
+            logger.warn(f"Failed to load config from RF variables: {e}")
+            rf_variables = {}
+        
+        # 环境变量和Robot Framework变量在同一轮中合并，Robot Framework变量优先
+        merged: Dict[str, Any] = {}
         for env_key, config_key in CONFIG_KEY_MAP.items():
+            expected_type, convert = converters[config_key]
+            value = None
+            
             if env_key in os.environ:
                 try:
-                    value = os.environ[env_key]
-                    # 获取当前配置值的类型，用于正确转换
-                    current_value = getattr(global_config, config_key)
-                    expected_type = type(current_value)
-                    
-                    # 转换类型
-                    if expected_type is int:
-                        value = int(value)  # type: ignore[assignment]
-                    elif expected_type is float:
-                        value = float(value)  # type: ignore[assignment]
-                    elif expected_type is bool:
-                        value = value.lower() in ["true", "1", "yes"]  # type: ignore[assignment]
-                    global_config.update(**{config_key: value})
+                    value = convert(os.environ[env_key])
                 except Exception as e:
                     logger.warn(f"Failed to load config from env {env_key}: {e}")
-        
-        # 从Robot Framework变量加载配置
-        for env_key, config_key in CONFIG_KEY_MAP.items():
+            
             try:
-                value = builtin.get_variable_value(f"${{{env_key}}}")
-                if value is not None:
-                    # 获取当前配置值的类型，用于正确转换
-                    current_value = getattr(global_config, config_key)
-                    expected_type = type(current_value)
-                    
-                    # 转换类型
-                    if isinstance(value, str):
-                        if expected_type is int:
-                            value = int(value)  # type: ignore[assignment]
-                        elif expected_type is float:
-                            value = float(value)  # type: ignore[assignment]
-                        elif expected_type is bool:
-                            value = value.lower() in ["true", "1", "yes"]  # type: ignore[assignment]
-                    else:
-                        # 已经是其他类型，直接转换为预期类型
-                        value = expected_type(value)  # type: ignore[assignment]
-                    global_config.update(**{config_key: value})
+                rf_value = rf_variables.get(env_key)
+                if rf_value is not None:
+                    # 字符串按配置类型解析，其他类型直接转换为预期类型
+                    value = convert(rf_value) if isinstance(rf_value, str) else expected_type(rf_value)
             except Exception as e:
                 logger.warn(f"Failed to load config from RF variable {env_key}: {e}")
+            
+            if value is not None:
+                merged[config_key] = value
         
-        # 从初始化参数加载配置
-        global_config.update(**kwargs)
+        # 初始化参数优先级最高，合并后一次性更新配置
+        merged.update(kwargs)
+        global_config.update(**merged)
         
-        # 设置默认驱动
+        # 设置默认驱动，并缓存默认驱动对象供关键字直接使用
         driver_factory.set_default_driver(global_config.default_backend)
+        self._default_driver = driver_factory.get_driver()
         
         logger.info(f"RFWinLibrary initialized with config: {{'timeout': {global_config.timeout}, 'retry': {global_config.retry}, 'default_backend': '{global_config.default_backend}', 'pywinauto_backend': '{global_config.pywinauto_backend}', 'auto_screenshot_on_fail': {global_config.auto_screenshot_on_fail}, 'high_dpi_adapter': {global_config.high_dpi_adapter}}}")
     
@@ -170,69 +263,11 @@ class RFWinLibrary:
         self._keyboard_mouse_keywords = KeyboardMouseKeywords(self)
         self._screenshot_keywords = ScreenshotKeywords(self)
         
-        # 动态绑定关键字方法到主类
-        # 应用管理关键字
-        self.start_application = self._application_keywords.start_application
-        self.attach_to_application = self._application_keywords.attach_to_application
-        self.close_application = self._application_keywords.close_application
-        self.kill_application = self._application_keywords.kill_application
-        self.check_application_running = self._application_keywords.check_application_running
-        self.get_application_process_id = self._application_keywords.get_application_process_id
-        self.wait_for_application_main_window = self._application_keywords.wait_for_application_main_window
-        
-        # 窗口管理关键字
-        self.get_main_window = self._window_keywords.get_main_window
-        self.locate_window = self._window_keywords.locate_window
-        self.activate_window = self._window_keywords.activate_window
-        self.close_window = self._window_keywords.close_window
-        self.maximize_window = self._window_keywords.maximize_window
-        self.minimize_window = self._window_keywords.minimize_window
-        self.restore_window = self._window_keywords.restore_window
-        self.resize_window = self._window_keywords.resize_window
-        self.move_window = self._window_keywords.move_window
-        self.get_window_title = self._window_keywords.get_window_title
-        self.get_window_rect = self._window_keywords.get_window_rect
-        self.wait_for_window_close = self._window_keywords.wait_for_window_close
-        self.is_window_active = self._window_keywords.is_window_active
-        self.is_window_visible = self._window_keywords.is_window_visible
-        self.is_window_closed = self._window_keywords.is_window_closed
-        
-        # 控件操作关键字
-        self.find_element = self._control_keywords.find_element
-        self.click_element = self._control_keywords.click_element
-        self.right_click_element = self._control_keywords.right_click_element
-        self.double_click_element = self._control_keywords.double_click_element
-        self.type_text = self._control_keywords.type_text
-        self.clear_element_text = self._control_keywords.clear_element_text
-        self.get_element_text = self._control_keywords.get_element_text
-        self.set_element_text = self._control_keywords.set_element_text
-        self.select_element = self._control_keywords.select_element
-        self.deselect_element = self._control_keywords.deselect_element
-        self.is_element_selected = self._control_keywords.is_element_selected
-        self.is_element_enabled = self._control_keywords.is_element_enabled
-        self.is_element_visible = self._control_keywords.is_element_visible
-        self.get_element_attribute = self._control_keywords.get_element_attribute
-        self.set_element_attribute = self._control_keywords.set_element_attribute
-        self.hover_element = self._control_keywords.hover_element
-        self.drag_element_to = self._control_keywords.drag_element_to
-        
-        # 鼠标键盘关键字
-        self.mouse_click = self._keyboard_mouse_keywords.mouse_click
-        self.mouse_move = self._keyboard_mouse_keywords.mouse_move
-        self.mouse_drag = self._keyboard_mouse_keywords.mouse_drag
-        self.mouse_wheel = self._keyboard_mouse_keywords.mouse_wheel
-        self.mouse_hover = self._keyboard_mouse_keywords.mouse_hover
-        self.get_mouse_position = self._keyboard_mouse_keywords.get_mouse_position
-        self.press_key = self._keyboard_mouse_keywords.press_key
-        self.press_keys = self._keyboard_mouse_keywords.press_keys
-        self.key_down = self._keyboard_mouse_keywords.key_down
-        self.key_up = self._keyboard_mouse_keywords.key_up
-        self.type_text_with_keyboard = self._keyboard_mouse_keywords.type_text_with_keyboard
-        
-        # 截图关键字
-        self.capture_screenshot = self._screenshot_keywords.capture_screenshot
-        self.capture_window_screenshot = self._screenshot_keywords.capture_window_screenshot
-        self.capture_element_screenshot = self._screenshot_keywords.capture_element_screenshot
+        # 按绑定表把关键字方法绑定到主类
+        for attr, names in self._KEYWORD_BINDINGS.items():
+            keywords = getattr(self, attr)
+            for name in names:
+                setattr(self, name, getattr(keywords, name))
     
     def _get_application(self, app_id: str) -> Optional[BaseApplication]:
         """获取应用对象
@@ -243,7 +278,13 @@ class RFWinLibrary:
         Returns:
             应用对象，如果不存在则返回None
         """
-        return self._applications.get(app_id)
+        last_id, last = self._last_application
+        if app_id == last_id:
+            return last
+        app = self._applications.get(app_id)
+        if app is not None:
+            self._last_application = (app_id, app)
+        return app
     
     def _add_application(self, app_id: str, app: BaseApplication) -> None:
         """添加应用对象
@@ -253,6 +294,7 @@ class RFWinLibrary:
             app: 应用对象
         """
         self._applications[app_id] = app
+        self._last_application = (None, None)
     
     def _remove_application(self, app_id: str) -> None:
         """移除应用对象
@@ -262,6 +304,7 @@ class RFWinLibrary:
         """
         if app_id in self._applications:
             del self._applications[app_id]
+        self._last_application = (None, None)
     
     def _get_window(self, window_id: str) -> Optional[BaseWindow]:
         """获取窗口对象
@@ -272,7 +315,13 @@ class RFWinLibrary:
         Returns:
             窗口对象，如果不存在则返回None
         """
-        return self._windows.get(window_id)
+        last_id, last = self._last_window
+        if window_id == last_id:
+            return last
+        window = self._windows.get(window_id)
+        if window is not None:
+            self._last_window = (window_id, window)
+        return window
     
     def _add_window(self, window_id: str, window: BaseWindow) -> None:
         """添加窗口对象
@@ -282,6 +331,7 @@ class RFWinLibrary:
             window: 窗口对象
         """
         self._windows[window_id] = window
+        self._last_window = (None, None)
     
     def _remove_window(self, window_id: str) -> None:
         """移除窗口对象
@@ -291,6 +341,7 @@ class RFWinLibrary:
         """
         if window_id in self._windows:
             del self._windows[window_id]
+        self._last_window = (None, None)
     
     def _get_control(self, control_id: str) -> Optional[BaseControl]:
         """获取控件对象
@@ -301,7 +352,13 @@ class RFWinLibrary:
         Returns:
             控件对象，如果不存在则返回None
         """
-        return self._controls.get(control_id)
+        last_id, last = self._last_control
+        if control_id == last_id:
+            return last
+        control = self._controls.get(control_id)
+        if control is not None:
+            self._last_control = (control_id, control)
+        return control
     
     def _add_control(self, control_id: str, control: BaseControl) -> None:
         """添加控件对象
@@ -311,6 +368,7 @@ class RFWinLibrary:
             control: 控件对象
         """
         self._controls[control_id] = control
+        self._last_control = (None, None)
     
     def _remove_control(self, control_id: str) -> None:
         """移除控件对象
@@ -320,6 +378,7 @@ class RFWinLibrary:
         """
         if control_id in self._controls:
             del self._controls[control_id]
+        self._last_control = (None, None)
     
     def _get_backend(self, backend_name: Optional[str] = None) -> Any:
         """获取后端对象（兼容旧接口，实际返回驱动）
@@ -330,6 +389,8 @@ class RFWinLibrary:
         Returns:
             驱动对象
         """
+        if backend_name is None:
+            return self._default_driver
         return driver_factory.get_driver(backend_name)
     
     # ===================
@@ -346,8 +407,14 @@ class RFWinLibrary:
         Example:
             | Set Global Config | timeout | 20 |
             | Set Global Config | default_backend | pywinauto |
+            | Set Global Config | verbose_keyword_logs | False |
         """
         if hasattr(global_config, key):
+            if isinstance(value, str):
+                # 按配置项原有类型解析字符串，如 20、False
+                convert = _STR_CONVERTERS.get(type(getattr(global_config, key)))
+                if convert is not None:
+                    value = convert(value)
             setattr(global_config, key, value)
             logger.info(f"Set global config: {key} = {value}")
         else:
@@ -380,6 +447,7 @@ class RFWinLibrary:
             | Set Backend | pywinauto |
         """
         driver_factory.set_default_driver(backend_name)
+        self._default_driver = driver_factory.get_driver()
         logger.info(f"Set default backend to: {backend_name}")
     
     def get_available_backends(self) -> List[str]:
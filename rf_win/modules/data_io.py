@@ -1,10 +1,18 @@
 # 数据IO模块
 # 提供多种数据格式的读写功能，包括文本文件、Excel文件、JSON文件和CSV文件
 
-from typing import List, Dict, Any, Optional, Union
+from typing import Iterator, List, Dict, Any, Optional, Union
 import os
 import json
 import csv
+import atexit
+import codecs
+import ctypes
+import fnmatch
+import mmap
+import threading
+from collections import OrderedDict
+from itertools import chain, repeat, zip_longest
 from datetime import datetime
 
 # 尝试导入openpyxl用于Excel文件处理
@@ -15,9 +23,192 @@ try:
 except ImportError:
     OPENPYXL_AVAILABLE = False
 
+# 尝试导入python-calamine用于快速读取Excel文件
+try:
+    from python_calamine import CalamineWorkbook
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+# 尝试导入orjson用于快速解析和生成JSON
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 尝试导入numpy和pyarrow用于按列读取CSV数值数据
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# 尝试导入xlsxwriter用于大数据量Excel文件的流式写入
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+# Windows上通过CopyFileW由系统复制文件内容、属性和修改时间，其他平台为None
+try:
+    _CopyFileW = ctypes.windll.kernel32.CopyFileW
+except AttributeError:
+    _CopyFileW = None
+
+# 超过MAX_PATH的路径需加扩展长度前缀才能传给Win32文件API
+_MAX_PATH = 260
+
+# 超过此大小的文本文件通过内存映射读取
+MMAP_THRESHOLD = 64 * 1024
+# 统计行数时每次切片的字节数
+_COUNT_CHUNK = 1024 * 1024
+
+# 换行符为单字节0x0A且不会出现在多字节字符中的编码，可以直接在字节上统计行数
+_ASCII_NEWLINE_ENCODINGS = frozenset((
+    "utf-8", "utf-8-sig", "ascii", "latin-1", "iso8859-1", "cp1252", "gbk", "gb2312", "gb18030",
+))
+
+# append_to_excel(use_cache=True)缓存的工作簿数量上限
+EXCEL_CACHE_SIZE = 8
+# 缓存的工作簿累计追加多少次后写回磁盘
+EXCEL_CACHE_FLUSH_APPENDS = 100
+
+# 绝对路径 -> [文件修改时间(ns), 工作簿, 未写回的追加次数]
+_excel_cache: "OrderedDict[str, list]" = OrderedDict()
+_excel_cache_lock = threading.Lock()
+
+# 已确认存在的目录，写文件前命中时跳过makedirs；超过上限时整体清空
+KNOWN_DIRS_LIMIT = 1024
+_known_dirs: set = set()
+_known_dirs_lock = threading.Lock()
+
 class DataIO:
     """数据IO类"""
+
+    @staticmethod
+    def _stat_or_raise(file_path: str, kind: str = "File") -> os.stat_result:
+        """获取文件状态，文件不存在时抛出FileNotFoundError
+
+        Args:
+            file_path: 文件路径
+            kind: 错误信息中的文件描述
+
+        Returns:
+            文件状态
+        """
+        try:
+            return os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"{kind} not found: {file_path}") from None
+
+    @staticmethod
+    def _open_existing(file_path: str, mode: str = "r", **kwargs: Any):
+        """打开已存在的文件，不存在时抛出与_stat_or_raise相同的FileNotFoundError
+
+        直接打开文件，不预先检查文件是否存在
+
+        Args:
+            file_path: 文件路径
+            mode: 打开模式
+            **kwargs: 传给open的其他参数
+
+        Returns:
+            文件对象
+        """
+        try:
+            return open(file_path, mode, **kwargs)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
     
+    @staticmethod
+    def _ensure_dir(dir_path: str) -> None:
+        """确保目录存在，已确认存在的目录不再重复创建
+
+        Args:
+            dir_path: 目录路径，为空时表示当前目录
+        """
+        if not dir_path or dir_path in _known_dirs:
+            return
+        os.makedirs(dir_path, exist_ok=True)
+        with _known_dirs_lock:
+            if len(_known_dirs) >= KNOWN_DIRS_LIMIT:
+                _known_dirs.clear()
+            _known_dirs.add(dir_path)
+
+    @staticmethod
+    def _retry_missing_dir(dir_path: str, func: Any, *args: Any, **kwargs: Any) -> Any:
+        """调用func，目录在确认存在后被外部删除导致FileNotFoundError时重新创建目录并重试一次
+
+        Args:
+            dir_path: func写入的目标目录
+            func: 要调用的函数
+            *args: 传给func的位置参数
+            **kwargs: 传给func的关键字参数
+
+        Returns:
+            func的返回值
+        """
+        try:
+            return func(*args, **kwargs)
+        except FileNotFoundError:
+            if not dir_path or os.path.isdir(dir_path):
+                raise
+            DataIO._forget_dirs(dir_path)
+            DataIO._ensure_dir(dir_path)
+            return func(*args, **kwargs)
+
+    @staticmethod
+    def _open_for_write(file_path: str, mode: str = "w", **kwargs: Any):
+        """创建所在目录（如果不存在）后打开文件用于写入
+
+        Args:
+            file_path: 文件路径
+            mode: 打开模式
+            **kwargs: 传给open的其他参数
+
+        Returns:
+            文件对象
+        """
+        dir_path = os.path.dirname(file_path)
+        DataIO._ensure_dir(dir_path)
+        return DataIO._retry_missing_dir(dir_path, open, file_path, mode, **kwargs)
+
+    @staticmethod
+    def _forget_dirs(dir_path: str) -> None:
+        """从已知目录中移除指定目录及其子目录
+
+        Args:
+            dir_path: 目录路径
+        """
+        root = os.path.abspath(dir_path)
+        prefix = os.path.join(root, "")
+        with _known_dirs_lock:
+            for known in [d for d in _known_dirs if os.path.abspath(d) == root or os.path.abspath(d).startswith(prefix)]:
+                _known_dirs.discard(known)
+
+    @staticmethod
+    def _scandir(dir_path: str):
+        """打开目录迭代器，目录不存在时抛出FileNotFoundError
+
+        Args:
+            dir_path: 目录路径
+
+        Returns:
+            os.scandir迭代器
+        """
+        try:
+            return os.scandir(dir_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Directory not found: {dir_path}") from None
+
     @staticmethod
     def read_text_file(file_path: str, encoding: str = "utf-8") -> str:
         """读取文本文件
@@ -32,10 +223,16 @@ class DataIO:
         Example:
             | ${content} | Read Text File | C:/test.txt | encoding=utf-8 |
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
-
-        with open(file_path, "r", encoding=encoding) as f:
+        if DataIO._stat_or_raise(file_path).st_size > MMAP_THRESHOLD:
+            # 大文件映射到内存后直接解码，省去先读入bytes对象的一次拷贝
+            with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content = str(mm, encoding)
+            # 与文本模式读取一致，统一换行符为\n
+            if "\r" in content:
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
+            return content
+
+        with DataIO._open_existing(file_path, "r", encoding=encoding) as f:
             return f.read()
 
     @staticmethod
@@ -52,12 +249,7 @@ class DataIO:
             | Write Text File | C:/test.txt | Hello World | encoding=utf-8 | mode=w |
             | Write Text File | C:/test.txt | \nAppend Line | encoding=utf-8 | mode=a |
         """
-        # 创建目录（如果不存在）
-        dir_path = os.path.dirname(file_path)
-        if dir_path and not os.path.exists(dir_path):
-            os.makedirs(dir_path)
-
-        with open(file_path, mode, encoding=encoding) as f:
+        with DataIO._open_for_write(file_path, mode, encoding=encoding) as f:
             f.write(content)
 
     @staticmethod
@@ -75,10 +267,7 @@ class DataIO:
         Example:
             | ${lines} | Read Lines | C:/test.txt | encoding=utf-8 | strip=True |
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
-
-        with open(file_path, "r", encoding=encoding) as f:
+        with DataIO._open_existing(file_path, "r", encoding=encoding) as f:
             lines = f.readlines()
 
         if strip:
@@ -88,6 +277,53 @@ class DataIO:
 
         return lines
 
+    @staticmethod
+    def iter_lines(file_path: str, encoding: str = "utf-8", strip: bool = False) -> Iterator[str]:
+        """逐行迭代读取文件
+
+        与read_lines返回相同的行，但不把整个文件读入内存，适合超大文件。
+        换行符为单字节的编码通过内存映射按需分页读取，其余编码按文本模式逐行读取。
+
+        Args:
+            file_path: 文件路径
+            encoding: 文件编码
+            strip: 是否去除每行的前后空白字符
+
+        Returns:
+            行迭代器
+        """
+        size = DataIO._stat_or_raise(file_path).st_size
+        codec_name = codecs.lookup(encoding).name
+        if size == 0 or codec_name not in _ASCII_NEWLINE_ENCODINGS:
+            with open(file_path, "r", encoding=encoding) as f:
+                for line in f:
+                    yield line.strip() if strip else line.rstrip("\n")
+            return
+
+        with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            if codec_name == "utf-8-sig":
+                # BOM只出现在文件开头，跳过后按utf-8逐行解码
+                encoding = "utf-8"
+                if mm[:3] == codecs.BOM_UTF8:
+                    start = 3
+            find = mm.find
+            while start < size:
+                end = find(b"\n", start)
+                if end == -1:
+                    end = size
+                line = mm[start:end]
+                start = end + 1
+                # 与文本模式一致：\r\n视为一个换行，单独的\r也是换行
+                if line.endswith(b"\r"):
+                    line = line[:-1]
+                text = line.decode(encoding)
+                if "\r" in text:
+                    for part in text.split("\r"):
+                        yield part.strip() if strip else part
+                else:
+                    yield text.strip() if strip else text
+
     @staticmethod
     def write_lines(file_path: str, lines: List[str], encoding: str = "utf-8", mode: str = "w") -> None:
         """按行写入文件
@@ -102,14 +338,13 @@ class DataIO:
             | ${lines} | Create List | Line 1 | Line 2 | Line 3 |
             | Write Lines | C:/test.txt | ${lines} | encoding=utf-8 | mode=w |
         """
-        # 创建目录（如果不存在）
-        dir_path = os.path.dirname(file_path)
-        if dir_path and not os.path.exists(dir_path):
-            os.makedirs(dir_path)
-
-        with open(file_path, mode, encoding=encoding) as f:
-            for line in lines:
-                f.write(f"{line}\n")
+        # 拼接为一个字符串后一次写入，每行末尾保留换行符
+        if not lines:
+            content = ""
+        else:
+            content = "\n".join(map(str, lines)) + "\n"
+        with DataIO._open_for_write(file_path, mode, encoding=encoding) as f:
+            f.write(content)
 
     @staticmethod
     def read_json(file_path: str, encoding: str = "utf-8") -> Dict[str, Any]:
@@ -125,11 +360,18 @@ class DataIO:
         Example:
             | ${data} | Read Json | C:/test.json | encoding=utf-8 |
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
-
-        with open(file_path, "r", encoding=encoding) as f:
-            return json.load(f)
+        if not ORJSON_AVAILABLE or codecs.lookup(encoding).name != "utf-8":
+            with DataIO._open_existing(file_path, "r", encoding=encoding) as f:
+                return json.load(f)
+
+        # orjson直接解析UTF-8字节，省去解码为str的一次遍历
+        with DataIO._open_existing(file_path, "rb") as f:
+            data = f.read()
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson不接受NaN等标准库允许的扩展写法，交给标准库解析
+            return json.loads(data.decode(encoding))
 
     @staticmethod
     def write_json(file_path: str, data: Dict[str, Any], encoding: str = "utf-8", indent: int = 4) -> None:
@@ -145,12 +387,18 @@ class DataIO:
             | ${data} | Create Dictionary | name=test | value=123 |
             | Write Json | C:/test.json | ${data} | encoding=utf-8 | indent=4 |
         """
-        # 创建目录（如果不存在）
-        dir_path = os.path.dirname(file_path)
-        if dir_path and not os.path.exists(dir_path):
-            os.makedirs(dir_path)
+        # orjson只支持2空格缩进，其余情况使用标准库
+        if ORJSON_AVAILABLE and indent == 2 and codecs.lookup(encoding).name == "utf-8":
+            try:
+                content = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            except orjson.JSONEncodeError:
+                pass
+            else:
+                with DataIO._open_for_write(file_path, "wb") as f:
+                    f.write(content)
+                return
 
-        with open(file_path, "w", encoding=encoding) as f:
+        with DataIO._open_for_write(file_path, "w", encoding=encoding) as f:
             json.dump(data, f, ensure_ascii=False, indent=indent)
 
     @staticmethod
@@ -171,10 +419,7 @@ class DataIO:
         Example:
             | ${data} | Read Csv | C:/test.csv | encoding=utf-8 | delimiter=, | header=True |
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
-
-        with open(file_path, "r", encoding=encoding) as f:
+        with DataIO._open_existing(file_path, "r", encoding=encoding) as f:
             reader = csv.reader(f, delimiter=delimiter)
             rows: List[List[str]] = list(reader)
 
@@ -183,21 +428,99 @@ class DataIO:
 
         if header:
             # 第一行为表头
-            headers = rows[0]
-            data = []
-            for row in rows[1:]:
-                # 处理行长度与表头长度不匹配的情况
-                row_dict = {}
-                for i, col_header in enumerate(headers):
-                    if i < len(row):
-                        row_dict[col_header] = row[i]
-                    else:
-                        row_dict[col_header] = ""
-                data.append(row_dict)
-            return data
+            headers = tuple(rows[0])
+            # 短行由repeat补空字符串，长行多出的列由zip截断
+            return [dict(zip(headers, chain(row, repeat("")))) for row in rows[1:]]
         else:
             return rows
 
+    @staticmethod
+    def iter_csv_rows(file_path: str, encoding: str = "utf-8", delimiter: str = ",", header: bool = True) -> Iterator[Union[Dict[str, Any], List[str]]]:
+        """逐行迭代读取CSV文件
+
+        与read_csv返回相同的行，但每次只解析一行，内存占用与文件大小无关。
+
+        Args:
+            file_path: 文件路径
+            encoding: 文件编码
+            delimiter: 分隔符
+            header: 是否包含表头
+
+        Returns:
+            行迭代器
+            - 如果header=True，每行为字典 {"列1": "值1", "列2": "值2"}
+            - 如果header=False，每行为列表 ["值1", "值2"]
+        """
+        with DataIO._open_existing(file_path, "r", encoding=encoding) as f:
+            reader = csv.reader(f, delimiter=delimiter)
+            if not header:
+                yield from reader
+                return
+            headers = tuple(next(reader, ()))
+            for row in reader:
+                yield dict(zip(headers, chain(row, repeat(""))))
+
+    @staticmethod
+    def read_csv_columns(file_path: str, encoding: str = "utf-8", delimiter: str = ",") -> Dict[str, Any]:
+        """按列读取带表头的CSV文件，每列为numpy数组
+
+        面向统计、绘图等需要数值数据的调用方，列类型自动推断（整数、浮点数或字符串），
+        省去逐个单元格把字符串转换为数字。安装了pyarrow时使用其多线程CSV解析器，
+        空单元格视为缺失值；否则用csv模块解析后由numpy转换，含空单元格的列保留为字符串。
+        需要原样字符串时请使用read_csv。
+
+        Args:
+            file_path: 文件路径
+            encoding: 文件编码
+            delimiter: 分隔符
+
+        Returns:
+            列名到numpy数组的字典，按表头顺序排列
+
+        Example:
+            | ${columns} | Read Csv Columns | C:/data.csv | delimiter=, |
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy is not installed. Please install it with 'pip install numpy'")
+
+        if PYARROW_AVAILABLE:
+            DataIO._stat_or_raise(file_path)
+            table = pa_csv.read_csv(
+                file_path,
+                read_options=pa_csv.ReadOptions(encoding=encoding),
+                parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+            )
+            return {name: table.column(name).to_numpy() for name in table.column_names}
+
+        with DataIO._open_existing(file_path, "r", encoding=encoding, newline="") as f:
+            reader = csv.reader(f, delimiter=delimiter)
+            headers = next(reader, None)
+            if headers is None:
+                return {}
+            rows = list(reader)
+
+        # 转置为列，短行补空字符串；没有数据的列为空序列
+        columns = list(zip_longest(*rows, fillvalue=""))
+        columns.extend([("",) * len(rows)] * (len(headers) - len(columns)))
+        return {name: DataIO._column_array(column) for name, column in zip(headers, columns)}
+
+    @staticmethod
+    def _column_array(values: Any) -> Any:
+        """将一列字符串转换为numpy数组，依次尝试整数、浮点数和字符串类型
+
+        Args:
+            values: 列的字符串序列
+
+        Returns:
+            numpy数组
+        """
+        for dtype in (np.int64, np.float64):
+            try:
+                return np.array(values, dtype=dtype)
+            except (ValueError, OverflowError):
+                pass
+        return np.array(values, dtype=str)
+
     @staticmethod
     def write_csv(file_path: str, data: Union[List[Dict[str, Any]], List[List[str]]], encoding: str = "utf-8", delimiter: str = ",", header: Optional[List[str]] = None) -> None:
         """写入CSV文件
@@ -213,40 +536,17 @@ class DataIO:
             | ${data} | Create List | Create Dictionary | name=test1 | value=123 | Create Dictionary | name=test2 | value=456 |
             | Write Csv | C:/test.csv | ${data} | encoding=utf-8 | delimiter=, |
         """
-        # 创建目录（如果不存在）
-        dir_path = os.path.dirname(file_path)
-        if dir_path and not os.path.exists(dir_path):
-            os.makedirs(dir_path)
-
-        with open(file_path, "w", newline="", encoding=encoding) as f:
+        with DataIO._open_for_write(file_path, "w", newline="", encoding=encoding) as f:
             writer = csv.writer(f, delimiter=delimiter)
-
-            if isinstance(data, list) and data and isinstance(data[0], dict):
-                # 数据是字典列表
-                if header is None:
-                    # 自动提取表头
-                    header = list(data[0].keys())  # type: ignore[assignment]
-
-                # 写入表头
-                writer.writerow(header)  # type: ignore[arg-type]
-
-                # 写入数据
-                for row in data:
-                    # 明确断言row是字典类型，因为上面已经检查过data[0]是字典
-                    dict_row = row  # type: ignore[assignment]
-                    writer.writerow([dict_row.get(h, "") for h in header])  # type: ignore[arg-type]
-            else:
-                # 数据是列表列表
-                if header:
-                    writer.writerow(header)
-
-                for row in data:
-                    writer.writerow(row)
+            # writerows在C层循环写入，行由生成器逐行产生
+            writer.writerows(DataIO._table_rows(data, header))
 
     @staticmethod
     def read_excel(file_path: str, sheet_name: Optional[str] = None, header: bool = True, start_row: int = 1) -> Union[List[Dict[str, Any]], List[List[str]]]:
         """读取Excel文件
 
+        安装了python-calamine时使用其Rust实现的解析器读取，否则回退到openpyxl。
+
         Args:
             file_path: 文件路径
             sheet_name: 工作表名称，如果为None则读取第一个工作表
@@ -261,52 +561,70 @@ class DataIO:
         Example:
             | ${data} | Read Excel | C:/test.xlsx | sheet_name=Sheet1 | header=True | start_row=1 |
         """
-        if not OPENPYXL_AVAILABLE:
+        if not CALAMINE_AVAILABLE and not OPENPYXL_AVAILABLE:
             raise ImportError("openpyxl is not installed. Please install it with 'pip install openpyxl'")
 
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
+        DataIO._stat_or_raise(file_path)
+        # 读取前写回缓存中尚未保存的追加
+        DataIO.flush_excel_cache(file_path)
 
-        # 加载工作簿
-        wb = load_workbook(file_path, data_only=True)
-
-        # 选择工作表
-        if sheet_name:
-            ws = wb[sheet_name]
-        else:
-            ws = wb.active
-
-        # 读取数据
-        data = []
-        for row in ws.iter_rows(min_row=start_row, values_only=True):
-            # 过滤空行
-            if any(cell is not None and cell != "" for cell in row):
-                data.append(list(row))
+        # 读取数据并过滤空行，行保持读取库返回的序列，不再逐行复制
+        data = [
+            row for row in DataIO._iter_excel_rows(file_path, sheet_name, start_row)
+            if not all(cell is None or cell == "" for cell in row)
+        ]
 
         if not data:
             return []
 
         if header:
             # 第一行为表头
-            headers = data[0]
-            rows = []
-            for row in data[1:]:
-                # 处理行长度与表头长度不匹配的情况
-                row_dict = {}
-                for i, col_header in enumerate(headers):
-                    if i < len(row) and row[i] is not None:
-                        row_dict[col_header] = row[i]
-                    else:
-                        row_dict[col_header] = ""
-                rows.append(row_dict)
-            return rows
+            headers = tuple(data[0])
+            # 空单元格和缺少的列均为空字符串，多出的列由zip截断
+            return [
+                dict(zip(headers, chain(("" if cell is None else cell for cell in row), repeat(""))))
+                for row in data[1:]
+            ]
         else:
-            return data
+            return [list(row) for row in data]
+
+    @staticmethod
+    def _iter_excel_rows(file_path: str, sheet_name: Optional[str], start_row: int):
+        """从start_row开始逐行读取工作表的单元格值
+
+        Args:
+            file_path: 文件路径
+            sheet_name: 工作表名称，如果为None则读取默认工作表
+            start_row: 开始行号（从1开始）
+
+        Returns:
+            行迭代器，每行为单元格值序列
+        """
+        if CALAMINE_AVAILABLE:
+            wb = CalamineWorkbook.from_path(file_path)
+            sheet = wb.get_sheet_by_name(sheet_name) if sheet_name else wb.get_sheet_by_index(0)
+            # 保留开头的空行，使行号与openpyxl一致
+            rows = sheet.to_python(skip_empty_area=False)[start_row - 1:]
+            # calamine以""表示空单元格、以float表示所有数字，转换为与openpyxl相同的None和int
+            return (
+                [None if cell == "" else int(cell) if type(cell) is float and cell.is_integer() else cell for cell in row]
+                for row in rows
+            )
+
+        # 加载工作簿
+        wb = load_workbook(file_path, data_only=True)
+
+        # 选择工作表
+        ws = wb[sheet_name] if sheet_name else wb.active
+        return ws.iter_rows(min_row=start_row, values_only=True)
 
     @staticmethod
     def write_excel(file_path: str, data: Union[List[Dict[str, Any]], List[List[str]]], sheet_name: str = "Sheet1", header: Optional[List[str]] = None) -> None:
         """写入Excel文件
 
+        安装了xlsxwriter时使用其constant_memory模式逐行写入磁盘，内存占用只与列数相关；
+        否则回退到openpyxl的只写模式。
+
         Args:
             file_path: 文件路径
             data: Excel数据
@@ -317,22 +635,65 @@ class DataIO:
             | ${data} | Create List | Create Dictionary | name=test1 | value=123 | Create Dictionary | name=test2 | value=456 |
             | Write Excel | C:/test.xlsx | ${data} | sheet_name=Sheet1 |
         """
-        if not OPENPYXL_AVAILABLE:
+        if not XLSXWRITER_AVAILABLE and not OPENPYXL_AVAILABLE:
             raise ImportError("openpyxl is not installed. Please install it with 'pip install openpyxl'")
 
-        # 创建工作簿
-        wb = Workbook()
+        # 文件将被整体覆盖，缓存中尚未写回的追加一并作废
+        DataIO._release_cached_excel(file_path, save=False)
 
-        # 创建或选择工作表
-        if sheet_name in wb.sheetnames:
-            ws = wb[sheet_name]
-        else:
-            ws = wb.create_sheet(sheet_name)
-            # 删除默认工作表
-            if "Sheet" in wb.sheetnames:
-                del wb["Sheet"]
+        DataIO._write_excel_file(file_path, data, sheet_name, header)
+
+    @staticmethod
+    def _write_excel_file(file_path: str, data: Union[List[Dict[str, Any]], List[List[str]]], sheet_name: str, header: Optional[List[str]] = None) -> None:
+        """写入Excel文件，不访问追加缓存，持有_excel_cache_lock时也可调用
+
+        Args:
+            file_path: 文件路径
+            data: Excel数据
+            sheet_name: 工作表名称
+            header: 表头列表，如果为None则自动从数据中提取
+        """
+        # 整理需要写入的行
+        rows = DataIO._table_rows(data, header)
+
+        if XLSXWRITER_AVAILABLE:
+            # constant_memory模式下每行写完即刷新到磁盘；与openpyxl保持一致，
+            # URL形式的字符串按普通文本写入，日期时间写入为带日期格式的单元格
+            wb = xlsxwriter.Workbook(file_path, {
+                "constant_memory": True,
+                "use_zip64": True,
+                "strings_to_urls": False,
+                "default_date_format": "yyyy-mm-dd hh:mm:ss",
+            })
+            ws = wb.add_worksheet(sheet_name)
+            for r, row in enumerate(rows):
+                ws.write_row(r, 0, row)
+            wb.close()
+            return
+
+        # 只写模式逐行生成XML，不在内存中为每个单元格创建Cell对象；
+        # 只写工作簿没有默认工作表
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(sheet_name)
 
         # 写入数据
+        for row in rows:
+            ws.append(row)
+
+        # 保存工作簿
+        wb.save(file_path)
+
+    @staticmethod
+    def _table_rows(data: Union[List[Dict[str, Any]], List[List[str]]], header: Optional[List[str]] = None):
+        """按写入顺序生成表格行（含表头），供CSV和Excel写入共用
+
+        Args:
+            data: Excel数据
+            header: 表头列表，如果为None则自动从数据中提取
+
+        Returns:
+            行迭代器
+        """
         if isinstance(data, list) and data and isinstance(data[0], dict):
             # 数据是字典列表
             if header is None:
@@ -340,40 +701,52 @@ class DataIO:
                 header = list(data[0].keys())
 
             # 写入表头
-            ws.append(header)
+            yield header
 
             # 写入数据
             for row in data:
                 # 明确断言row是字典类型
                 dict_row = row  # type: ignore[assignment]
-                ws.append([dict_row.get(h, "") for h in header])
+                yield [dict_row.get(h, "") for h in header]
         else:
             # 数据是列表列表
             if header:
-                ws.append(header)
+                yield header
 
             for row in data:
-                ws.append(row)
-
-        # 保存工作簿
-        wb.save(file_path)
+                yield row
 
     @staticmethod
-    def append_to_excel(file_path: str, data: Union[List[Dict[str, Any]], List[List[str]]], sheet_name: str = "Sheet1") -> None:
+    def append_to_excel(file_path: str, data: Union[List[Dict[str, Any]], List[List[str]]], sheet_name: str = "Sheet1", use_cache: bool = False) -> None:
         """追加数据到Excel文件
 
+        默认每次调用都加载并保存整个工作簿。use_cache=True时工作簿保留在内存中，
+        累计追加EXCEL_CACHE_FLUSH_APPENDS次、被挤出缓存、调用flush_excel_cache
+        或进程退出时才写回磁盘，适合循环中频繁追加；写回前文件内容不包含新追加的数据，
+        read_excel、copy_file等DataIO文件操作会先写回或丢弃对应的缓存。
+
         Args:
             file_path: 文件路径
             data: Excel数据
             sheet_name: 工作表名称
+            use_cache: 是否缓存工作簿并批量写回
 
         Example:
             | ${data} | Create List | Create Dictionary | name=test3 | value=789 |
             | Append To Excel | C:/test.xlsx | ${data} | sheet_name=Sheet1 |
+            | Append To Excel | C:/test.xlsx | ${data} | use_cache=True |
         """
         if not OPENPYXL_AVAILABLE:
             raise ImportError("openpyxl is not installed. Please install it with 'pip install openpyxl'")
 
+        if use_cache:
+            with _excel_cache_lock:
+                DataIO._append_cached(file_path, data, sheet_name)
+            return
+
+        # 先写回并移出缓存的工作簿，否则之后写回缓存时会覆盖本次追加
+        DataIO._release_cached_excel(file_path, save=True)
+
         if not os.path.exists(file_path):
             # 文件不存在，直接创建
             DataIO.write_excel(file_path, data, sheet_name)
@@ -381,7 +754,115 @@ class DataIO:
 
         # 加载工作簿
         wb = load_workbook(file_path)
+        DataIO._append_rows(wb, data, sheet_name)
+
+        # 保存工作簿
+        wb.save(file_path)
+
+    @staticmethod
+    def _append_cached(file_path: str, data: Union[List[Dict[str, Any]], List[List[str]]], sheet_name: str) -> None:
+        """向缓存的工作簿追加数据，调用方需持有_excel_cache_lock
 
+        Args:
+            file_path: 文件路径
+            data: Excel数据
+            sheet_name: 工作表名称
+        """
+        key = os.path.abspath(file_path)
+        entry = _excel_cache.get(key)
+        if entry is not None and entry[2] == 0:
+            # 没有未写回的数据时，文件被外部修改过则重新加载
+            try:
+                if os.stat(key).st_mtime_ns != entry[0]:
+                    entry = None
+            except FileNotFoundError:
+                entry = None
+
+        if entry is None:
+            if not os.path.exists(key):
+                # 已持有_excel_cache_lock，不能再调用会获取该锁的write_excel
+                _excel_cache.pop(key, None)
+                DataIO._write_excel_file(key, data, sheet_name)
+                return
+            entry = [os.stat(key).st_mtime_ns, load_workbook(key), 0]
+            _excel_cache[key] = entry
+        _excel_cache.move_to_end(key)
+
+        DataIO._append_rows(entry[1], data, sheet_name)
+        entry[2] += 1
+        if entry[2] >= EXCEL_CACHE_FLUSH_APPENDS:
+            DataIO._save_cached(key, entry)
+
+        while len(_excel_cache) > EXCEL_CACHE_SIZE:
+            old_key, old_entry = _excel_cache.popitem(last=False)
+            DataIO._save_cached(old_key, old_entry)
+
+    @staticmethod
+    def _save_cached(key: str, entry: list) -> None:
+        """将缓存的工作簿写回磁盘
+
+        Args:
+            key: 文件绝对路径
+            entry: 缓存项
+        """
+        if entry[2]:
+            entry[1].save(key)
+            entry[0] = os.stat(key).st_mtime_ns
+            entry[2] = 0
+
+    @staticmethod
+    def flush_excel_cache(file_path: Optional[str] = None) -> None:
+        """将append_to_excel(use_cache=True)缓存的工作簿写回磁盘
+
+        Args:
+            file_path: 文件路径，如果为None则写回所有缓存的工作簿
+
+        Example:
+            | Flush Excel Cache | C:/test.xlsx |
+            | Flush Excel Cache |
+        """
+        if not _excel_cache:
+            return
+        with _excel_cache_lock:
+            if file_path is None:
+                for key, entry in _excel_cache.items():
+                    DataIO._save_cached(key, entry)
+            else:
+                key = os.path.abspath(file_path)
+                entry = _excel_cache.get(key)
+                if entry is not None:
+                    DataIO._save_cached(key, entry)
+
+    @staticmethod
+    def _release_cached_excel(path: str, save: bool, recursive: bool = False) -> None:
+        """将路径对应的缓存工作簿移出追加缓存
+
+        不经过缓存修改、移动或删除文件前调用，避免之后写回缓存时覆盖较新的文件内容或重新创建已删除的文件。
+
+        Args:
+            path: 文件路径，recursive=True时为目录路径
+            save: 移出前是否写回尚未保存的追加
+            recursive: 是否移出目录下所有文件的缓存
+        """
+        if not _excel_cache:
+            return
+        key = os.path.abspath(path)
+        prefix = os.path.join(key, "")
+        with _excel_cache_lock:
+            for cached in [k for k in _excel_cache if k == key or (recursive and k.startswith(prefix))]:
+                entry = _excel_cache.pop(cached)
+                if save:
+                    DataIO._save_cached(cached, entry)
+
+    @staticmethod
+    def _append_rows(wb: Any, data: Union[List[Dict[str, Any]], List[List[str]]], sheet_name: str) -> None:
+        """向工作簿的指定工作表追加数据
+
+        Args:
+            wb: openpyxl工作簿
+            data: Excel数据
+            sheet_name: 工作表名称
+        """
         # 选择工作表
         if sheet_name in wb.sheetnames:
             ws = wb[sheet_name]
@@ -392,23 +873,18 @@ class DataIO:
         if isinstance(data, list) and data and isinstance(data[0], dict):
             # 数据是字典列表
             # 获取现有表头
-            headers = []
-            for cell in ws[1]:
-                headers.append(cell.value)
+            headers = tuple(cell.value for cell in ws[1])
 
-            # 写入数据
+            # 写入数据，循环内使用局部绑定的方法
+            get = dict.get
+            append = ws.append
             for row in data:
-                # 明确断言row是字典类型
-                dict_row = row  # type: ignore[assignment]
-                ws.append([dict_row.get(h, "") for h in headers])
+                append([get(row, h, "") for h in headers])  # type: ignore[arg-type]
         else:
             # 数据是列表列表
             for row in data:
                 ws.append(row)
 
-        # 保存工作簿
-        wb.save(file_path)
-
     @staticmethod
     def get_file_lines_count(file_path: str, encoding: str = "utf-8") -> int:
         """获取文件行数
@@ -423,8 +899,13 @@ class DataIO:
         Example:
             | ${lines_count} | Get File Lines Count | C:/test.txt | encoding=utf-8 |
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
+        if DataIO._stat_or_raise(file_path).st_size > 0 and codecs.lookup(encoding).name in _ASCII_NEWLINE_ENCODINGS:
+            with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # 不含\r时换行只有\n一种，直接统计字节；含\r时按文本模式逐行统计
+                if mm.find(b"\r") == -1:
+                    size = len(mm)
+                    newlines = sum(mm[i:i + _COUNT_CHUNK].count(b"\n") for i in range(0, size, _COUNT_CHUNK))
+                    return newlines + (0 if mm[-1:] == b"\n" else 1)
 
         with open(file_path, "r", encoding=encoding) as f:
             return sum(1 for _ in f)
@@ -442,10 +923,7 @@ class DataIO:
         Example:
             | ${size} | Get File Size | C:/test.txt |
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
-
-        return os.path.getsize(file_path)
+        return DataIO._stat_or_raise(file_path).st_size
 
     @staticmethod
     def get_file_mtime(file_path: str) -> str:
@@ -460,16 +938,31 @@ class DataIO:
         Example:
             | ${mtime} | Get File Mtime | C:/test.txt |
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
-
-        mtime = os.path.getmtime(file_path)
+        mtime = DataIO._stat_or_raise(file_path).st_mtime
         return datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S")
 
+    @staticmethod
+    def _win32_path(path: str) -> str:
+        """转换为可传给Win32文件API的绝对路径，过长时加扩展长度前缀
+
+        Args:
+            path: 文件路径
+
+        Returns:
+            转换后的路径
+        """
+        path = os.path.abspath(path)
+        if len(path) >= _MAX_PATH and not path.startswith("\\\\?\\"):
+            path = "\\\\?\\UNC\\" + path[2:] if path.startswith("\\\\") else "\\\\?\\" + path
+        return path
+
     @staticmethod
     def copy_file(src: str, dst: str) -> None:
         """复制文件
 
+        Windows上使用系统的CopyFileW复制，其他平台使用shutil.copy2
+        （Linux上由内核通过sendfile/copy_file_range完成数据复制）。
+
         Args:
             src: 源文件路径
             dst: 目标文件路径
@@ -477,16 +970,21 @@ class DataIO:
         Example:
             | Copy File | C:/source.txt | C:/destination.txt |
         """
-        if not os.path.exists(src):
-            raise FileNotFoundError(f"Source file not found: {src}")
+        DataIO._stat_or_raise(src, "Source file")
+        # 复制前写回源文件缓存中的追加，目标文件将被覆盖，其缓存作废
+        DataIO.flush_excel_cache(src)
+        DataIO._release_cached_excel(dst, save=False)
 
         # 创建目标目录
         dst_dir = os.path.dirname(dst)
-        if dst_dir and not os.path.exists(dst_dir):
-            os.makedirs(dst_dir)
+        DataIO._ensure_dir(dst_dir)
 
+        if _CopyFileW is not None and _CopyFileW(DataIO._win32_path(src), DataIO._win32_path(dst), False):
+            return
+
+        # 非Windows平台，或CopyFileW失败（如目标为目录）时由shutil处理并给出对应异常
         import shutil
-        shutil.copy2(src, dst)
+        DataIO._retry_missing_dir(dst_dir, shutil.copy2, src, dst)
 
     @staticmethod
     def move_file(src: str, dst: str) -> None:
@@ -499,16 +997,17 @@ class DataIO:
         Example:
             | Move File | C:/source.txt | C:/destination.txt |
         """
-        if not os.path.exists(src):
-            raise FileNotFoundError(f"Source file not found: {src}")
+        DataIO._stat_or_raise(src, "Source file")
+        # 移动前写回源文件缓存中的追加，目标文件将被覆盖，其缓存作废
+        DataIO._release_cached_excel(src, save=True)
+        DataIO._release_cached_excel(dst, save=False)
 
         # 创建目标目录
         dst_dir = os.path.dirname(dst)
-        if dst_dir and not os.path.exists(dst_dir):
-            os.makedirs(dst_dir)
+        DataIO._ensure_dir(dst_dir)
 
         import shutil
-        shutil.move(src, dst)
+        DataIO._retry_missing_dir(dst_dir, shutil.move, src, dst)
 
     @staticmethod
     def delete_file(file_path: str) -> None:
@@ -520,6 +1019,8 @@ class DataIO:
         Example:
             | Delete File | C:/test.txt |
         """
+        # 丢弃缓存中尚未写回的追加，否则进程退出时会重新创建文件
+        DataIO._release_cached_excel(file_path, save=False)
         if os.path.exists(file_path):
             os.remove(file_path)
 
@@ -548,8 +1049,7 @@ class DataIO:
         Example:
             | Create Directory | C:/new_dir |
         """
-        if not os.path.exists(dir_path):
-            os.makedirs(dir_path)
+        os.makedirs(dir_path, exist_ok=True)
 
     @staticmethod
     def delete_directory(dir_path: str, recursive: bool = False) -> None:
@@ -564,6 +1064,8 @@ class DataIO:
             | Delete Directory | C:/non_empty_dir | recursive=True |
         """
         if os.path.exists(dir_path):
+            DataIO._forget_dirs(dir_path)
+            DataIO._release_cached_excel(dir_path, save=False, recursive=True)
             if recursive:
                 import shutil
                 shutil.rmtree(dir_path)
@@ -576,25 +1078,28 @@ class DataIO:
 
         Args:
             dir_path: 目录路径
-            pattern: 文件名称模式
+            pattern: 文件名称模式，可以是通配符模式（如*.txt）或文件名后缀（如.txt）
 
         Returns:
             文件路径列表
 
         Example:
             | ${files} | List Files | C:/test_dir | pattern=*.txt |
+            | ${files} | List Files | C:/test_dir | pattern=.log |
         """
-        if not os.path.exists(dir_path):
-            raise FileNotFoundError(f"Directory not found: {dir_path}")
-
-        files = []
-        for file in os.listdir(dir_path):
-            file_path = os.path.join(dir_path, file)
-            if os.path.isfile(file_path):
-                if pattern is None or file.endswith(pattern) or file == pattern:
-                    files.append(file_path)
+        if pattern is None:
+            match = None
+        elif any(char in pattern for char in "*?["):
+            match = lambda name: fnmatch.fnmatch(name, pattern)
+        else:
+            match = lambda name: name.endswith(pattern)
 
-        return files
+        # scandir返回的目录项自带文件类型信息，无需再逐个stat
+        with DataIO._scandir(dir_path) as entries:
+            return [
+                entry.path for entry in entries
+                if entry.is_file() and (match is None or match(entry.name))
+            ]
 
     @staticmethod
     def list_directories(dir_path: str) -> List[str]:
@@ -609,16 +1114,12 @@ class DataIO:
         Example:
             | ${dirs} | List Directories | C:/parent_dir |
         """
-        if not os.path.exists(dir_path):
-            raise FileNotFoundError(f"Directory not found: {dir_path}")
-
-        dirs = []
-        for dir_name in os.listdir(dir_path):
-            dir_path_full = os.path.join(dir_path, dir_name)
-            if os.path.isdir(dir_path_full):
-                dirs.append(dir_path_full)
-
-        return dirs
+        with DataIO._scandir(dir_path) as entries:
+            return [entry.path for entry in entries if entry.is_dir()]
 
 # 创建DataIO实例
 data_io = DataIO()
+
+
+# 进程退出时写回缓存中尚未保存的工作簿
+atexit.register(DataIO.flush_excel_cache)
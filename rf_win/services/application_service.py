@@ -1,20 +1,170 @@
 # 应用服务模块
 # 封装应用管理的核心业务逻辑
 
-from typing import Any, Optional, Dict
+import ctypes
+import threading
+from time import monotonic, sleep
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from ..backend.win_process import open_process_handle, is_process_alive, wait_for_processes, close_process_handle
 from ..drivers.automation_driver import driver_factory
 from ..utils.cache_manager import cache_manager
 from ..utils.logger import logger
 
+# 等待主窗口的初始轮询间隔和最大间隔（秒），间隔每次乘以MAIN_WINDOW_POLL_FACTOR
+MAIN_WINDOW_POLL_INITIAL_INTERVAL = 0.01
+MAIN_WINDOW_POLL_MAX_INTERVAL = 0.5
+MAIN_WINDOW_POLL_FACTOR = 1.5
+
+# 关闭单个应用的超时时间（秒）
+CLOSE_TIMEOUT = 10.0
+# 并行关闭应用的最大线程数
+CLOSE_MAX_WORKERS = 32
+COINIT_MULTITHREADED = 0x0
+
+# instance()返回的共享实例，各服务和关键字共用同一份缓存
+_INSTANCE = None
+_INSTANCE_LOCK = threading.Lock()
+
+
+def _init_close_worker() -> None:
+    """在关闭应用的工作线程中初始化COM，UIA后端关闭窗口时需要"""
+    ole32 = getattr(getattr(ctypes, "windll", None), "ole32", None)
+    if ole32 is not None:
+        ole32.CoInitializeEx(None, COINIT_MULTITHREADED)
+
+
+def _pid_from_process(app: Any) -> Optional[int]:
+    # pywinauto的Application.process直接是进程ID
+    process = app.process
+    return process if isinstance(process, int) or process is None else process.id
+
+
+# 按属性探测顺序排列的(属性名, 访问函数)，第一个存在的属性决定该应用类型使用的访问函数
+_PID_ACCESSORS: Tuple[Tuple[str, Callable[[Any], Any]], ...] = (
+    ('process_id', lambda app: app.process_id()),
+    ('_process_id', lambda app: app._process_id),
+    ('process', _pid_from_process),
+)
+_RUNNING_ACCESSORS: Tuple[Tuple[str, Callable[[Any], Any]], ...] = (
+    ('is_process_running', lambda app: app.is_process_running()),
+    ('process_id', lambda app: app.process_id() is not None),
+    ('process', lambda app: app.process is not None),
+)
+
+# 应用类型 -> 访问函数；同一会话中的应用类型通常只有一两种，
+# 探测结果按类型缓存，避免每次调用都对COM对象执行多次hasattr
+_PID_ACCESSOR_CACHE: Dict[type, Callable[[Any], Any]] = {}
+_RUNNING_ACCESSOR_CACHE: Dict[type, Callable[[Any], Any]] = {}
+
+
+def _accessor(cache: Dict[type, Callable[[Any], Any]], app: Any,
+              candidates: Tuple[Tuple[str, Callable[[Any], Any]], ...],
+              default: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """获取应用类型对应的访问函数，首次遇到该类型时探测属性并缓存
+
+    参数:
+        cache: 访问函数缓存
+        app: 应用对象
+        candidates: 按顺序探测的(属性名, 访问函数)
+        default: 所有属性都不存在时使用的访问函数
+
+    返回:
+        访问函数
+    """
+    app_type = type(app)
+    accessor = cache.get(app_type)
+    if accessor is None:
+        accessor = next((func for name, func in candidates if hasattr(app, name)), default)
+        cache[app_type] = accessor
+    return accessor
+
+
 class ApplicationService:
     """应用服务，负责应用管理的核心业务逻辑"""
     
+    __slots__ = ('_driver', '_find_window', '_connect', '_connect_dispatch', '_aliases', '_apps', '_handles', '_current_idx')
+    
+    @classmethod
+    def instance(cls) -> "ApplicationService":
+        """获取共享的应用服务实例，首次调用时创建
+        
+        返回:
+            应用服务实例
+        """
+        global _INSTANCE
+        if _INSTANCE is None:
+            with _INSTANCE_LOCK:
+                if _INSTANCE is None:
+                    _INSTANCE = cls()
+        return _INSTANCE
+    
     def __init__(self):
         self._driver = driver_factory.get_driver()
-        # 保存应用实例，key为别名，value为应用对象
-        self._applications: Dict[str, Any] = {}
-        # 当前活动的应用别名
-        self._current_app_alias: Optional[str] = None
+        # 等待主窗口时循环调用，预先绑定驱动方法
+        self._find_window = self._driver.find_window
+        # 连接应用时按标识符类型直接调用对应的驱动方法，驱动未提供时使用通用的连接方法
+        self._connect = self._driver.connect_to_application
+        self._connect_dispatch: Dict[type, Any] = {}
+        for identifier_type, method in ((int, 'connect_by_pid'), (str, 'connect_by_title')):
+            connect = getattr(self._driver, method, None)
+            if connect is not None:
+                self._connect_dispatch[identifier_type] = connect
+        # 已保存的应用按下标对应：别名、应用对象、进程句柄（用于快速判断进程是否存活，未打开时为None）；
+        # 同时管理的应用通常不超过几个，线性查找比字典哈希更快
+        self._aliases: List[str] = []
+        self._apps: List[Any] = []
+        self._handles: List[Optional[int]] = []
+        # 当前活动应用的下标，-1表示没有
+        self._current_idx = -1
+    
+    def _index(self, app_alias: str) -> int:
+        """查找应用别名的下标
+        
+        参数:
+            app_alias: 应用程序的别名
+        
+        返回:
+            下标，未找到时返回-1
+        """
+        try:
+            return self._aliases.index(app_alias)
+        except ValueError:
+            return -1
+    
+    def _register(self, alias: str, app: Any) -> None:
+        """保存应用实例并设为当前活动应用，别名已存在时替换
+        
+        参数:
+            alias: 应用程序的别名
+            app: 应用对象
+        """
+        index = self._index(alias)
+        if index < 0:
+            index = len(self._aliases)
+            self._aliases.append(alias)
+            self._apps.append(app)
+            self._handles.append(None)
+        else:
+            self._close_handle(index)
+            self._apps[index] = app
+        self._current_idx = index
+    
+    def _unregister(self, index: int) -> None:
+        """移除指定下标的应用实例并关闭其进程句柄
+        
+        参数:
+            index: 应用下标
+        """
+        self._close_handle(index)
+        del self._aliases[index]
+        del self._apps[index]
+        del self._handles[index]
+        # 如果移除的是当前活动的应用实例，重置当前应用；其后的下标前移一位
+        if self._current_idx == index:
+            self._current_idx = -1
+        elif self._current_idx > index:
+            self._current_idx -= 1
     
     def start_application(self, app_path: str, alias: Optional[str] = None, backend: Optional[str] = None, **kwargs) -> Any:
         """启动应用程序
@@ -30,15 +180,14 @@ class ApplicationService:
         返回:
             应用对象
         """
-        logger.info(f"启动应用: {app_path}, 别名: {alias}, 后端: {backend}")
+        logger.info("启动应用: %s, 别名: %s, 后端: %s", app_path, alias, backend)
         
         # 调用驱动的启动应用方法
         app = self._driver.start_application(app_path, None, backend or "pywinauto")
         
         # 如果提供了别名，保存应用实例
         if alias:
-            self._applications[alias] = app
-            self._current_app_alias = alias
+            self._register(alias, app)
         
         return app
     
@@ -57,21 +206,24 @@ class ApplicationService:
         返回:
             应用对象
         """
-        logger.info(f"连接应用: 进程ID={process_id}, 标题={title}, 别名={alias}, 后端={backend}")
+        logger.info("连接应用: 进程ID=%s, 标题=%s, 别名=%s, 后端=%s", process_id, title, alias, backend)
         
-        # 构建标识符
-        identifier = process_id or title
-        if not identifier:
+        # 构建标识符，进程ID优先；进程ID可能以字符串形式传入
+        if process_id is not None:
+            identifier: Any = int(process_id)
+        elif title:
+            identifier = title
+        else:
             logger.error("必须提供进程ID或窗口标题")
             return None
         
         # 调用驱动的连接应用方法
-        app = self._driver.attach_to_application(identifier, backend or "pywinauto")
+        connect = self._connect_dispatch.get(type(identifier), self._connect)
+        app = connect(identifier, backend or "pywinauto")
         
         # 如果提供了别名，保存应用实例
         if alias:
-            self._applications[alias] = app
-            self._current_app_alias = alias
+            self._register(alias, app)
         
         return app
     
@@ -86,14 +238,9 @@ class ApplicationService:
         返回:
             应用对象
         """
-        if app_alias:
-            # 获取指定别名的应用实例
-            return self._applications.get(app_alias)
-        else:
-            # 获取当前活动的应用实例
-            if self._current_app_alias:
-                return self._applications.get(self._current_app_alias)
-            return None
+        # 未指定别名时获取当前活动的应用实例
+        index = self._index(app_alias) if app_alias else self._current_idx
+        return self._apps[index] if index >= 0 else None
     
     def get_current_application(self) -> Any:
         """获取当前活动的应用实例
@@ -103,7 +250,8 @@ class ApplicationService:
         返回:
             应用对象
         """
-        return self.get_application()
+        index = self._current_idx
+        return self._apps[index] if index >= 0 else None
     
     def switch_application(self, app_alias: str) -> Any:
         """切换当前活动的应用实例
@@ -116,10 +264,11 @@ class ApplicationService:
         返回:
             应用对象
         """
-        if app_alias in self._applications:
-            self._current_app_alias = app_alias
-            return self._applications[app_alias]
-        logger.error(f"未找到应用实例: {app_alias}")
+        index = self._index(app_alias)
+        if index >= 0:
+            self._current_idx = index
+            return self._apps[index]
+        logger.error("未找到应用实例: %s", app_alias)
         return None
     
     def close_application(self, app_alias: Optional[str] = None) -> bool:
@@ -133,24 +282,40 @@ class ApplicationService:
         返回:
             是否成功
         """
-        # 获取应用实例
-        app = self.get_application(app_alias)
+        # 先确定要关闭的应用下标，未指定别名时为当前活动的应用
+        index = self._index(app_alias) if app_alias else self._current_idx
+        app = self._apps[index] if index >= 0 else None
         if not app:
-            logger.error(f"未找到应用实例: {app_alias}")
+            logger.error("未找到应用实例: %s", app_alias)
             return False
         
-        # 调用驱动的关闭应用方法
-        result = self._driver.close_application(app, 10.0)
+        result = self._close(app)
         
-        # 如果成功关闭，从应用实例字典中移除
-        if result and app_alias:
-            self._applications.pop(app_alias, None)
-            # 如果关闭的是当前活动的应用实例，重置当前应用别名
-            if self._current_app_alias == app_alias:
-                self._current_app_alias = None
+        # 如果成功关闭，移除应用实例；关闭的是当前应用时同时重置当前应用
+        if result:
+            self._unregister(index)
         
         return result
     
+    def _close(self, app: Any) -> bool:
+        """通过驱动关闭应用，驱动不支持时直接结束进程
+        
+        参数:
+            app: 应用对象
+        
+        返回:
+            是否成功
+        """
+        result = self._driver.close_application(app, CLOSE_TIMEOUT)
+        if result is NotImplemented:
+            try:
+                app.kill()
+                result = True
+            except Exception as e:
+                logger.error("结束应用进程时出错: %s", e)
+                result = False
+        return result
+    
     def close_all_applications(self) -> bool:
         """关闭所有已连接的应用程序
         
@@ -159,16 +324,42 @@ class ApplicationService:
         返回:
             是否成功
         """
-        success = True
-        # 复制应用实例字典的键，避免在迭代过程中修改字典
-        app_aliases = list(self._applications.keys())
+        # 复制应用列表，工作线程只负责关闭，移除在当前线程完成
+        app_aliases = list(self._aliases)
+        apps = list(self._apps)
+        if not apps:
+            self._current_idx = -1
+            return True
+        
+        # 关闭前打开各进程的句柄，关闭后由内核一次等待所有进程退出
+        handles = []
+        for app in apps:
+            handle = open_process_handle(self._process_id(app))
+            if handle is not None:
+                handles.append(handle)
         
-        for alias in app_aliases:
-            if not self.close_application(alias):
+        try:
+            # 各应用的关闭互不依赖，并行执行，总耗时取决于最慢的一个
+            with ThreadPoolExecutor(
+                max_workers=min(CLOSE_MAX_WORKERS, len(apps)),
+                thread_name_prefix="rf-win-close",
+                initializer=_init_close_worker,
+            ) as executor:
+                results = list(executor.map(self._close, apps))
+            success = all(results)
+            if handles and not wait_for_processes(handles, CLOSE_TIMEOUT):
+                logger.error("等待应用进程退出超时")
                 success = False
+        finally:
+            for handle in handles:
+                close_process_handle(handle)
+        
+        for alias, result in zip(app_aliases, results):
+            if result:
+                self._unregister(self._index(alias))
         
-        # 重置当前应用别名
-        self._current_app_alias = None
+        # 重置当前应用
+        self._current_idx = -1
         
         return success
     
@@ -184,24 +375,26 @@ class ApplicationService:
             True如果应用程序正在运行，否则返回False
         """
         # 获取应用实例
-        app = self._applications.get(app_alias)
-        if not app:
+        index = self._index(app_alias)
+        if index < 0 or not self._apps[index]:
             return False
+        app = self._apps[index]
+        
+        # Windows上通过进程句柄判断，只需一次系统调用
+        handle = self._handles[index]
+        if handle is None:
+            handle = self._handles[index] = open_process_handle(self._process_id(app))
+        if handle is not None:
+            alive = is_process_alive(handle)
+            if alive is not None:
+                return alive
         
         # 检查应用实例是否正在运行
         try:
-            # 这里简单检查app对象是否还能响应
-            # 实际实现可能需要根据驱动类型进行调整
-            if hasattr(app, 'is_process_running'):
-                return app.is_process_running()
-            elif hasattr(app, 'process_id'):
-                return app.process_id() is not None
-            elif hasattr(app, 'process'):
-                return app.process is not None
-            else:
-                return True
+            # 这里简单检查app对象是否还能响应，无法判断时视为正在运行
+            return _accessor(_RUNNING_ACCESSOR_CACHE, app, _RUNNING_ACCESSORS, lambda app: True)(app)
         except Exception as e:
-            logger.error(f"检查应用运行状态时出错: {e}")
+            logger.error("检查应用运行状态时出错: %s", e)
             return False
     
     def get_application_process_id(self, app: Any) -> Optional[int]:
@@ -215,24 +408,40 @@ class ApplicationService:
         返回:
             进程ID
         """
-        logger.info(f"获取应用进程ID: {app}")
+        logger.debug("获取应用进程ID: %s", app)
+        return self._process_id(app)
+    
+    def _process_id(self, app: Any) -> Optional[int]:
+        """获取应用进程ID，不记录info日志
+        
+        参数:
+            app: 应用对象
+        
+        返回:
+            进程ID
+        """
         try:
-            if hasattr(app, 'process_id'):
-                return app.process_id()
-            elif hasattr(app, '_process_id'):
-                return app._process_id
-            elif hasattr(app, 'process'):
-                return app.process.id
-            else:
-                return None
+            return _accessor(_PID_ACCESSOR_CACHE, app, _PID_ACCESSORS, lambda app: None)(app)
         except Exception as e:
-            logger.error(f"获取应用进程ID时出错: {e}")
+            logger.error("获取应用进程ID时出错: %s", e)
             return None
     
+    def _close_handle(self, index: int) -> None:
+        """关闭指定下标应用的进程句柄
+        
+        参数:
+            index: 应用下标
+        """
+        handle = self._handles[index]
+        if handle is not None:
+            self._handles[index] = None
+            close_process_handle(handle)
+    
     def wait_for_application_main_window(self, app: Any, timeout: float = 10.0) -> Any:
         """等待应用程序主窗口出现
         
-        等待指定应用实例的主窗口出现
+        等待指定应用实例的主窗口出现，轮询间隔从MAIN_WINDOW_POLL_INITIAL_INTERVAL
+        开始逐次增大，窗口已就绪时几乎无需等待
         
         参数:
             app: 应用对象
@@ -244,18 +453,26 @@ class ApplicationService:
         抛出:
             TimeoutError: 如果超时
         """
-        logger.info(f"等待应用主窗口: {app}")
-        import time
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
+        logger.info("等待应用主窗口: %s", app)
+        # 循环内使用局部变量，避免每次迭代的全局查找
+        find_window = self._find_window
+        _monotonic = monotonic
+        _sleep = sleep
+        deadline = _monotonic() + timeout
+        delay = MAIN_WINDOW_POLL_INITIAL_INTERVAL
+        
+        while True:
             try:
                 # 使用驱动的find_window方法查找主窗口
-                main_window = self._driver.find_window(app, {})
+                main_window = find_window(app, {})
                 if main_window:
                     return main_window
             except Exception:
                 pass
-            time.sleep(0.5)
+            remaining = deadline - _monotonic()
+            if remaining <= 0:
+                break
+            _sleep(min(delay, remaining))
+            delay = min(delay * MAIN_WINDOW_POLL_FACTOR, MAIN_WINDOW_POLL_MAX_INTERVAL)
         
         raise TimeoutError(f"超时未找到主窗口: {timeout}s")
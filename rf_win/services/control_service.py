@@ -1,25 +1,208 @@
 # 控件服务模块
 # 封装控件操作的核心业务逻辑
 
-from typing import Any, Dict, List, Optional
+import threading
+import time
+import weakref
+from collections import deque
+from itertools import count
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 from ..drivers.automation_driver import driver_factory
-from ..utils.cache_manager import cache_manager
-from ..utils.logger import logger
+from ..utils.cache_manager import cache_manager, control_cache
+from ..utils.locator_helper import PATH_SEPARATOR, LocatorHelper, ParsedLocator
+from ..utils.logger import DEBUG, logger
 from .application_service import ApplicationService
 from .window_service import WindowService
 
+# 缓存的控件在此间隔（秒）内已校验过有效性时直接返回，不再查询驱动
+ELEMENT_VALIDATE_INTERVAL = 0.5
+
+# 控件缓存每新增此数量的缓存项时，清理一次已失效的控件；
+# 大于控件缓存容量，每个缓存项在被淘汰前平均只校验约一次
+CONTROL_CACHE_SWEEP_INTERVAL = 256
+
+# 查找失败的定位器在此时间（秒）内再次查找时直接抛出上次的异常，不再查询驱动
+MISS_CACHE_TTL = 0.2
+# 未命中缓存的最大条目数，超出时整体清空
+MISS_CACHE_SIZE = 1024
+
+# 表示控件不存在的驱动异常，只有这些异常会进入未命中缓存
+try:
+    from pywinauto.findwindows import ElementNotFoundError
+    from pywinauto.timings import TimeoutError as PywinautoTimeoutError
+    MISS_ERRORS: tuple = (ElementNotFoundError, PywinautoTimeoutError, TimeoutError)
+except ImportError:
+    MISS_ERRORS = (TimeoutError,)
+
+# find_elements批量读取的UIA属性快照有效期（秒）
+SNAPSHOT_TTL = 1.0
+
+# get_control_state结果的有效期（秒），同一轮询周期内的连续检查共用一次查询
+STATE_TTL = 0.05
+# 控件状态缓存的最大条目数，超出时整体清空
+STATE_CACHE_SIZE = 1024
+
+# 快照中的属性名称与UIA属性ID
+UIA_NamePropertyId = 30005
+UIA_IsEnabledPropertyId = 30010
+UIA_IsOffscreenPropertyId = 30022
+UIA_SelectionItemIsSelectedPropertyId = 30079
+SNAPSHOT_PROPERTIES = (
+    ("name", UIA_NamePropertyId),
+    ("is_enabled", UIA_IsEnabledPropertyId),
+    ("is_offscreen", UIA_IsOffscreenPropertyId),
+    ("is_selected", UIA_SelectionItemIsSelectedPropertyId),
+)
+
+# 快照中没有对应属性时的返回值
+_MISSING = object()
+
+# find_elements_with_properties可按名称读取的UIA属性，也可直接传入属性ID
+UIA_PROPERTY_IDS = {
+    "bounding_rectangle": 30001,
+    "process_id": 30002,
+    "control_type": 30003,
+    "name": UIA_NamePropertyId,
+    "is_enabled": UIA_IsEnabledPropertyId,
+    "automation_id": 30011,
+    "class_name": 30012,
+    "help_text": 30013,
+    "is_offscreen": UIA_IsOffscreenPropertyId,
+    "framework_id": 30024,
+    "value": 30045,
+    "is_selected": UIA_SelectionItemIsSelectedPropertyId,
+}
+
+# 定位器前缀/字典键 -> 查找条件使用的UIA属性ID，与驱动的定位器语义一致
+_LOCATOR_PREFIXES = (("id=", 30011), ("name=", UIA_NamePropertyId), ("class=", 30012), ("xpath=", UIA_NamePropertyId))
+_LOCATOR_KEYS = {"auto_id": 30011, "title": UIA_NamePropertyId, "name": UIA_NamePropertyId, "class_name": 30012}
+TreeScope_Descendants = 4
+
+# 按定位器操作控件的方法表：操作名 -> (驱动方法名, 未找到控件时的返回值)
+_OPS = {
+    "click": ("click_element", False),
+    "type_text": ("type_text", False),
+    "get_text": ("get_element_text", None),
+    "clear_text": ("clear_element_text", False),
+    "select": ("select_element", False),
+    "get_attribute": ("get_element_attribute", None),
+}
+
+# 父控件令牌计数器，令牌在所有ControlService实例间唯一
+_parent_tokens = count()
+
+# instance()返回的共享实例，各服务和关键字共用同一份缓存
+_INSTANCE = None
+_INSTANCE_LOCK = threading.Lock()
+
+
+def _evict_parent(cache: Any, tokens: set) -> None:
+    """移除以指定父控件令牌开头的控件缓存项
+
+    参数:
+        cache: 控件缓存
+        tokens: 父控件令牌集合
+    """
+    for key in cache.get_keys():
+        if isinstance(key, tuple) and key[0] in tokens:
+            cache.remove(key)
+
+
+def _compile_locator(locator: Any) -> Any:
+    """将字符串定位器转换为缓存的ParsedLocator，驱动查找时无需再解析字符串
+
+    参数:
+        locator: 控件定位器
+
+    返回:
+        ParsedLocator，非字符串或无法识别类型的定位器原样返回
+    """
+    if isinstance(locator, str):
+        try:
+            return LocatorHelper.compile(locator)
+        except ValueError:
+            # 前缀不是已知类型的定位器（如标题中含有"="）交给驱动按原样处理
+            return locator
+    return locator
+
+
+def _locator_fingerprint(locator: Any) -> Hashable:
+    """生成定位器的可哈希标识，用作缓存键
+
+    字典定位器转为frozenset，其余可哈希的定位器原样使用，避免每次格式化为字符串
+
+    参数:
+        locator: 控件定位器
+
+    返回:
+        可哈希的定位器标识
+    """
+    try:
+        if isinstance(locator, dict):
+            return frozenset(locator.items())
+        hash(locator)
+        return locator
+    except TypeError:
+        # 含有不可哈希的值时退回字符串表示
+        return repr(locator)
+
+
 class ControlService:
     """控件服务，负责控件操作的核心业务逻辑"""
     
-    def __init__(self):
+    __slots__ = (
+        '_driver', 'app_service', 'window_service', '_cache', '_inserts',
+        '_ops', '_miss_cache', '_states', '_property_requests', 'use_cache_request', '_snapshots', '_cache_request', '_parent_ids',
+        '_dead_parents',
+    )
+    
+    @classmethod
+    def instance(cls) -> "ControlService":
+        """获取共享的控件服务实例，首次调用时创建
+        
+        返回:
+            控件服务实例
+        """
+        global _INSTANCE
+        if _INSTANCE is None:
+            with _INSTANCE_LOCK:
+                if _INSTANCE is None:
+                    _INSTANCE = cls()
+        return _INSTANCE
+    
+    def __init__(self, app_service: Optional[ApplicationService] = None, window_service: Optional[WindowService] = None) -> None:
         self._driver = driver_factory.get_driver()
-        # 创建应用服务和窗口服务实例
-        self.app_service = ApplicationService()
-        self.window_service = WindowService()
-        # 简单的控件缓存
-        self._control_cache: Dict[str, Any] = {}
+        # 应用服务和窗口服务默认使用共享实例，测试时可注入
+        self.app_service = app_service or ApplicationService.instance()
+        self.window_service = window_service or WindowService.instance()
+        # 预先绑定_OPS中的驱动方法
+        self._ops: Dict[str, tuple] = {op: (getattr(self._driver, method), default) for op, (method, default) in _OPS.items()}
+        # find_element的结果缓存，键为(父控件令牌, 定位器标识)，值为[控件对象, 上次校验有效性的时间, RuntimeId]；
+        # 容量有限，满时淘汰最久未使用的控件
+        self._cache = control_cache
+        # 自上次清理失效控件以来新增的缓存项数量
+        self._inserts = 0
+        # 查找失败的缓存，键同上，值为(过期时间, 异常, 查找时使用的超时时间)
+        self._miss_cache: Dict[tuple, tuple] = {}
+        # get_control_state的结果，键为(应用别名, 窗口标题, 定位器标识)，值为(读取时间, 状态字典, 查找超时时间)
+        self._states: Dict[tuple, tuple] = {}
+        # 存活的父控件 -> 令牌；不使用id()，避免父控件回收后id被新对象复用而命中错误的缓存
+        self._parent_ids: "weakref.WeakKeyDictionary[Any, int]" = weakref.WeakKeyDictionary()
+        # 已被回收的父控件令牌。weakref.finalize回调可能在任意线程持有缓存锁时触发，
+        # 回调只记录令牌，相关缓存项在下次插入缓存或invalidate时清理
+        self._dead_parents: "deque[int]" = deque()
+        # find_elements后是否通过UIA CacheRequest一次读取每个控件的常用属性
+        self.use_cache_request = True
+        # 最近一次find_elements的属性快照：id(控件) -> (控件, 读取时间, 属性字典)
+        self._snapshots: Dict[int, tuple] = {}
+        # 延迟创建的IUIAutomationCacheRequest，创建失败时为False
+        self._cache_request: Any = None
+        # get_control_properties按属性ID组合复用的CacheRequest
+        self._property_requests: Dict[tuple, Any] = {}
+        # 窗口关闭或失效时清理以其为父控件的缓存
+        self.window_service.add_invalidate_callback(self.invalidate)
     
-    def find_control(self, locator, window_title=None, app_alias=None, timeout=None):
+    def find_control(self, locator: Any, window_title: Optional[str] = None, app_alias: Optional[str] = None, timeout: Optional[float] = None) -> Any:
         """查找控件
         
         根据定位器查找指定窗口中的控件
@@ -33,18 +216,96 @@ class ControlService:
         返回:
             控件实例
         """
-        logger.info(f"查找控件: 定位器={locator}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}")
+        logger.info("查找控件: 定位器=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, window_title, app_alias, timeout)
+        return self._resolve(locator, window_title, app_alias, timeout)
+    
+    def _resolve(self, locator: Any, window_title: Optional[str] = None, app_alias: Optional[str] = None, timeout: Optional[float] = None) -> Any:
+        """解析窗口和控件，不记录info日志
         
-        # 获取窗口实例
-        window = self.window_service.switch_window(window_title, app_alias)
+        窗口由窗口服务的解析缓存复用，控件通过find_element的缓存复用，
+        同一窗口上的连续操作不必每次重新遍历UIA树
+        
+        参数:
+            locator: 控件定位器
+            window_title: 窗口标题，可以是完整标题或正则表达式
+            app_alias: 应用程序的别名
+            timeout: 查找超时时间，单位为秒
+        
+        返回:
+            控件实例，未找到窗口时返回None
+        """
+        window = self.window_service._resolve(window_title, app_alias)
         if not window:
-            logger.error(f"未找到窗口: {window_title}")
+            logger.error("未找到窗口: %s", window_title)
             return None
+        # 分层定位器逐层在上一层控件内查找，避免从窗口开始遍历整棵控件树
+        path = LocatorHelper.compile_path(locator) if isinstance(locator, str) and PATH_SEPARATOR in locator else ()
+        if path:
+            return self._find_path(window, path, timeout or 10.0)
+        return self.find_element(window, _compile_locator(locator), timeout or 10.0)
+    
+    def _find_path(self, parent: Any, path: Tuple[ParsedLocator, ...], timeout: float) -> Any:
+        """按分层定位器逐层查找控件
+        
+        每一层都通过find_element查找并缓存，同一容器下的后续查找直接复用已找到的容器
+        
+        参数:
+            parent: 窗口或父控件
+            path: 每一层的ParsedLocator
+            timeout: 整个查找的超时时间，单位为秒
         
-        # 调用驱动的查找控件方法
-        return self._driver.find_element(window, locator, timeout or 10.0)
+        返回:
+            最后一层的控件实例
+        """
+        deadline = time.monotonic() + timeout
+        node = parent
+        for segment in path:
+            node = self.find_element(node, segment, max(deadline - time.monotonic(), 0.1))
+            if not node:
+                return None
+        return node
     
-    def find_all_controls(self, locator, window_title=None, app_alias=None, timeout=None):
+    def _op(self, op: str, locator: Any, window_title: Optional[str], app_alias: Optional[str], timeout: Optional[float], *args: Any, **kwargs: Any) -> Any:
+        """查找控件并调用_OPS中对应的驱动方法
+        
+        参数:
+            op: _OPS中的操作名
+            locator: 控件定位器
+            window_title: 窗口标题，可以是完整标题或正则表达式
+            app_alias: 应用程序的别名
+            timeout: 查找超时时间，单位为秒
+            *args: 传给驱动方法的其余位置参数
+            **kwargs: 传给驱动方法的关键字参数
+        
+        返回:
+            驱动方法的返回值，未找到控件时返回该操作的默认值
+        """
+        method, default = self._ops[op]
+        control = self._resolve(locator, window_title, app_alias, timeout)
+        if not control:
+            return default
+        return method(control, *args, **kwargs)
+    
+    def invalidate(self, window: Any = None) -> None:
+        """清除控件缓存
+        
+        参数:
+            window: 只清除以该窗口为父控件的缓存，为None时清除本服务的全部缓存
+        """
+        if window is None:
+            tokens = set(self._parent_ids.values())
+        else:
+            try:
+                token = self._parent_ids.get(window)
+            except TypeError:
+                return
+            if token is None:
+                return
+            tokens = {token}
+        self._purge_dead_parents()
+        self._evict_tokens(tokens)
+    
+    def find_all_controls(self, locator: Any, window_title: Optional[str] = None, app_alias: Optional[str] = None, timeout: Optional[float] = None) -> List[Any]:
         """查找所有匹配的控件
         
         根据定位器查找指定窗口中的所有匹配控件
@@ -58,18 +319,18 @@ class ControlService:
         返回:
             控件实例列表
         """
-        logger.info(f"查找所有控件: 定位器={locator}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}")
+        logger.info("查找所有控件: 定位器=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, window_title, app_alias, timeout)
         
         # 获取窗口实例
-        window = self.window_service.switch_window(window_title, app_alias)
+        window = self.window_service._resolve(window_title, app_alias)
         if not window:
-            logger.error(f"未找到窗口: {window_title}")
+            logger.error("未找到窗口: %s", window_title)
             return []
         
         # 调用驱动的查找所有控件方法
-        return self._driver.find_elements(window, locator, timeout or 10.0)
+        return self._driver.find_elements(window, _compile_locator(locator), timeout or 10.0)
     
-    def click_control(self, locator, window_title=None, app_alias=None, button='left', double=False, timeout=None):
+    def click_control(self, locator: Any, window_title: Optional[str] = None, app_alias: Optional[str] = None, button: str = 'left', double: bool = False, timeout: Optional[float] = None) -> bool:
         """点击控件
         
         点击指定的控件
@@ -85,18 +346,11 @@ class ControlService:
         返回:
             是否成功
         """
-        logger.info(f"点击控件: 定位器={locator}, 窗口标题={window_title}, 应用别名={app_alias}, 按钮={button}, 双击={double}, 超时={timeout}")
-        
-        # 查找控件
-        control = self.find_control(locator, window_title, app_alias, timeout)
-        if not control:
-            return False
+        logger.info("点击控件: 定位器=%s, 窗口标题=%s, 应用别名=%s, 按钮=%s, 双击=%s, 超时=%s", locator, window_title, app_alias, button, double, timeout)
         
-        # 调用驱动的点击方法
-        clicks = 2 if double else 1
-        return self._driver.click_element(control, button, clicks, 0.1 if double else 0.0)
+        return self._op("click", locator, window_title, app_alias, timeout, button, 2 if double else 1, 0.1 if double else 0.0)
     
-    def set_control_text(self, locator, text, window_title=None, app_alias=None, timeout=None, clear_first=True):
+    def set_control_text(self, locator: Any, text: str, window_title: Optional[str] = None, app_alias: Optional[str] = None, timeout: Optional[float] = None, clear_first: bool = True) -> bool:
         """控件输入文本
         
         向指定控件输入文本
@@ -112,19 +366,14 @@ class ControlService:
         返回:
             是否成功
         """
-        logger.info(f"控件输入文本: 定位器={locator}, 文本={text}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}, 清空={clear_first}")
-        
-        # 查找控件
-        control = self.find_control(locator, window_title, app_alias, timeout)
-        if not control:
-            return False
+        # 文本可能很长，INFO未启用时连日志调用一起跳过
+        if logger.info_enabled:
+            logger.info("控件输入文本: 定位器=%s, 文本=%s, 窗口标题=%s, 应用别名=%s, 超时=%s, 清空=%s", locator, text, window_title, app_alias, timeout, clear_first)
         
-        # 调用驱动的输入文本方法
-        if clear_first:
-            self._driver.clear_element_text(control)
-        return self._driver.type_text(control, text, 0.0)
+        # 由驱动在同一次输入中完成清空
+        return self._op("type_text", locator, window_title, app_alias, timeout, text, clear_first)
     
-    def get_control_text(self, locator, window_title=None, app_alias=None, timeout=None):
+    def get_control_text(self, locator: Any, window_title: Optional[str] = None, app_alias: Optional[str] = None, timeout: Optional[float] = None) -> Optional[str]:
         """获取控件文本
         
         获取指定控件的文本内容
@@ -138,17 +387,11 @@ class ControlService:
         返回:
             控件的文本内容
         """
-        logger.info(f"获取控件文本: 定位器={locator}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}")
-        
-        # 查找控件
-        control = self.find_control(locator, window_title, app_alias, timeout)
-        if not control:
-            return None
+        logger.info("获取控件文本: 定位器=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, window_title, app_alias, timeout)
         
-        # 调用驱动的获取文本方法
-        return self._driver.get_element_text(control)
+        return self._op("get_text", locator, window_title, app_alias, timeout)
     
-    def clear_control_text(self, locator, window_title=None, app_alias=None, timeout=None):
+    def clear_control_text(self, locator: Any, window_title: Optional[str] = None, app_alias: Optional[str] = None, timeout: Optional[float] = None) -> bool:
         """清空控件文本
         
         清空指定控件的文本内容
@@ -162,17 +405,11 @@ class ControlService:
         返回:
             是否成功
         """
-        logger.info(f"清空控件文本: 定位器={locator}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}")
+        logger.info("清空控件文本: 定位器=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, window_title, app_alias, timeout)
         
-        # 查找控件
-        control = self.find_control(locator, window_title, app_alias, timeout)
-        if not control:
-            return False
-        
-        # 调用驱动的清空文本方法
-        return self._driver.clear_element_text(control)
+        return self._op("clear_text", locator, window_title, app_alias, timeout)
     
-    def select_control_item(self, locator, item, window_title=None, app_alias=None, timeout=None):
+    def select_control_item(self, locator: Any, item: Any, window_title: Optional[str] = None, app_alias: Optional[str] = None, timeout: Optional[float] = None) -> bool:
         """选择控件项
         
         选择下拉列表或列表框中的项
@@ -187,17 +424,18 @@ class ControlService:
         返回:
             是否成功
         """
-        logger.info(f"选择控件项: 定位器={locator}, 项={item}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}")
-        
-        # 查找控件
-        control = self.find_control(locator, window_title, app_alias, timeout)
-        if not control:
-            return False
-        
-        # 调用驱动的选择方法
-        return self._driver.select_element(control, text=item if isinstance(item, str) else None, index=int(item) if isinstance(item, (int, str)) and str(item).isdigit() else -1)
+        logger.info("选择控件项: 定位器=%s, 项=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, item, window_title, app_alias, timeout)
+        
+        # 整数按索引选择，字符串按文本选择（驱动优先使用文本，数字字符串同样按文本匹配）
+        if isinstance(item, int):
+            text, index = None, item
+        elif isinstance(item, str):
+            text, index = item, -1
+        else:
+            text, index = None, -1
+        return self._op("select", locator, window_title, app_alias, timeout, text=text, index=index)
     
-    def get_control_items(self, locator, window_title=None, app_alias=None, timeout=None):
+    def get_control_items(self, locator: Any, window_title: Optional[str] = None, app_alias: Optional[str] = None, timeout: Optional[float] = None) -> List[Any]:
         """获取控件项列表
         
         获取下拉列表或列表框中的所有项
@@ -211,10 +449,10 @@ class ControlService:
         返回:
             控件项列表
         """
-        logger.info(f"获取控件项: 定位器={locator}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}")
+        logger.info("获取控件项: 定位器=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, window_title, app_alias, timeout)
         
         # 查找控件
-        control = self.find_control(locator, window_title, app_alias, timeout)
+        control = self._resolve(locator, window_title, app_alias, timeout)
         if not control:
             return []
         
@@ -223,7 +461,7 @@ class ControlService:
         # 实际实现需要根据具体的驱动和控件类型进行调整
         return []
     
-    def is_control_exists(self, locator, window_title=None, app_alias=None, timeout=None):
+    def is_control_exists(self, locator: Any, window_title: Optional[str] = None, app_alias: Optional[str] = None, timeout: Optional[float] = None) -> bool:
         """检查控件是否存在
         
         检查指定的控件是否存在
@@ -237,13 +475,11 @@ class ControlService:
         返回:
             True如果控件存在，否则返回False
         """
-        logger.info(f"检查控件是否存在: 定位器={locator}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}")
-        
-        # 尝试查找控件，如果找到则返回True，否则返回False
-        control = self.find_control(locator, window_title, app_alias, timeout or 0.1)
-        return control is not None
+        logger.info("检查控件是否存在: 定位器=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, window_title, app_alias, timeout)
+        # 未指定超时时只查找一次，不等待控件出现
+        return self.get_control_state(locator, window_title, app_alias, timeout or 0)['exists']
     
-    def is_control_visible(self, locator, window_title=None, app_alias=None, timeout=None):
+    def is_control_visible(self, locator: Any, window_title: Optional[str] = None, app_alias: Optional[str] = None, timeout: Optional[float] = None) -> bool:
         """检查控件是否可见
         
         检查指定的控件是否可见
@@ -257,17 +493,10 @@ class ControlService:
         返回:
             True如果控件可见，否则返回False
         """
-        logger.info(f"检查控件是否可见: 定位器={locator}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}")
-        
-        # 查找控件
-        control = self.find_control(locator, window_title, app_alias, timeout)
-        if not control:
-            return False
-        
-        # 调用驱动的检查可见性方法
-        return self._driver.is_element_visible(control)
+        logger.info("检查控件是否可见: 定位器=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, window_title, app_alias, timeout)
+        return self.get_control_state(locator, window_title, app_alias, timeout)['visible']
     
-    def is_control_enabled(self, locator, window_title=None, app_alias=None, timeout=None):
+    def is_control_enabled(self, locator: Any, window_title: Optional[str] = None, app_alias: Optional[str] = None, timeout: Optional[float] = None) -> bool:
         """检查控件是否启用
         
         检查指定的控件是否启用
@@ -281,17 +510,113 @@ class ControlService:
         返回:
             True如果控件启用，否则返回False
         """
-        logger.info(f"检查控件是否启用: 定位器={locator}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}")
+        logger.info("检查控件是否启用: 定位器=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, window_title, app_alias, timeout)
+        return self.get_control_state(locator, window_title, app_alias, timeout)['enabled']
+    
+    def get_control_state(self, locator: Any, window_title: Optional[str] = None, app_alias: Optional[str] = None, timeout: Optional[float] = None) -> Dict[str, bool]:
+        """获取控件的存在、可见和启用状态
         
-        # 查找控件
-        control = self.find_control(locator, window_title, app_alias, timeout)
-        if not control:
-            return False
+        一次解析控件，并通过一次BuildUpdatedCache同时读取可见和启用状态；
+        STATE_TTL内对同一控件的重复查询直接返回上次结果，但上次未找到控件且本次超时时间更长时重新查找。
+        timeout为0时，能转换为UIA条件的定位器只执行一次FindFirstBuildCache，控件不存在时立即返回
+        
+        参数:
+            locator: 控件定位器，格式为"类型:属性=值"
+            window_title: 窗口标题，可以是完整标题或正则表达式
+            app_alias: 应用程序的别名
+            timeout: 查找超时时间，单位为秒，0表示不等待
+        
+        返回:
+            包含exists、visible、enabled的字典，每次调用返回新的字典
+        """
+        key = (app_alias, window_title, _locator_fingerprint(locator))
+        # 与_resolve一致，None表示默认的10秒
+        wait = 10.0 if timeout is None else timeout
+        now = time.monotonic()
+        cached = self._states.get(key)
+        if cached is not None and now - cached[0] < STATE_TTL and (cached[1]['exists'] or wait <= cached[2]):
+            return dict(cached[1])
+        
+        state = {'exists': False, 'visible': False, 'enabled': False}
+        try:
+            found = self._find_first_state(locator, window_title, app_alias) if timeout == 0 else _MISSING
+            if found is not _MISSING:
+                state = found
+            else:
+                # 无法只查找一次时退回最短的轮询查找
+                control = self._resolve(locator, window_title, app_alias, 0.1 if timeout == 0 else timeout)
+                if control:
+                    state = self._element_state(control)
+        except Exception as e:
+            logger.debug("Failed to get control state: %s", e)
+        
+        if len(self._states) >= STATE_CACHE_SIZE:
+            self._states.clear()
+        self._states[key] = (now, state, wait)
+        return dict(state)
+    
+    def _find_first_state(self, locator: Any, window_title: Optional[str], app_alias: Optional[str]) -> Any:
+        """通过一次FindFirstBuildCache查找控件并读取其状态，不等待、不重试
+        
+        参数:
+            locator: 控件定位器
+            window_title: 窗口标题，可以是完整标题或正则表达式
+            app_alias: 应用程序的别名
         
-        # 调用驱动的检查启用状态方法
-        return self._driver.is_element_enabled(control)
+        返回:
+            包含exists、visible、enabled的字典；定位器或窗口无法使用UIA查找时返回_MISSING
+        """
+        if isinstance(locator, str) and PATH_SEPARATOR in locator:
+            return _MISSING
+        window = self.window_service._resolve(window_title, app_alias)
+        raw = self.find_element_nowait(window, _compile_locator(locator)) if window else None
+        if raw is _MISSING:
+            return _MISSING
+        if raw is None:
+            return {'exists': False, 'visible': False, 'enabled': False}
+        return {
+            'exists': True,
+            'visible': not raw.GetCachedPropertyValue(UIA_IsOffscreenPropertyId),
+            'enabled': bool(raw.GetCachedPropertyValue(UIA_IsEnabledPropertyId)),
+        }
     
-    def get_control_property(self, locator, property_name, window_title=None, app_alias=None, timeout=None):
+    def _element_state(self, element: Any) -> Dict[str, bool]:
+        """读取控件的存在、可见和启用状态
+        
+        参数:
+            element: 控件对象
+        
+        返回:
+            包含exists、visible、enabled的字典
+        """
+        missing = {'exists': False, 'visible': False, 'enabled': False}
+        try:
+            # 延迟定位的控件在此时解析，控件不存在时抛出异常
+            raw = self._native_element(element)
+        except Exception:
+            return missing
+        request = self._get_cache_request() if raw is not None else None
+        if request is not None:
+            try:
+                cached = raw.BuildUpdatedCache(request)
+                return {
+                    'exists': True,
+                    'visible': not cached.GetCachedPropertyValue(UIA_IsOffscreenPropertyId),
+                    'enabled': bool(cached.GetCachedPropertyValue(UIA_IsEnabledPropertyId)),
+                }
+            except Exception:
+                return missing
+        
+        # 非UIA控件使用驱动逐项检查
+        if not self._driver.is_element_valid(element):
+            return missing
+        return {
+            'exists': True,
+            'visible': self._driver.is_element_visible(element),
+            'enabled': self._driver.is_element_enabled(element),
+        }
+    
+    def get_control_property(self, locator: Any, property_name: str, window_title: Optional[str] = None, app_alias: Optional[str] = None, timeout: Optional[float] = None) -> Any:
         """获取控件属性
         
         获取指定控件的指定属性值
@@ -306,17 +631,11 @@ class ControlService:
         返回:
             控件属性值
         """
-        logger.info(f"获取控件属性: 定位器={locator}, 属性名={property_name}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}")
-        
-        # 查找控件
-        control = self.find_control(locator, window_title, app_alias, timeout)
-        if not control:
-            return None
+        logger.info("获取控件属性: 定位器=%s, 属性名=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, property_name, window_title, app_alias, timeout)
         
-        # 调用驱动的获取属性方法
-        return self._driver.get_element_attribute(control, property_name)
+        return self._op("get_attribute", locator, window_title, app_alias, timeout, property_name)
     
-    def set_control_property(self, locator, property_name, value, window_title=None, app_alias=None, timeout=None):
+    def set_control_property(self, locator: Any, property_name: str, value: Any, window_title: Optional[str] = None, app_alias: Optional[str] = None, timeout: Optional[float] = None) -> bool:
         """设置控件属性
         
         设置指定控件的指定属性值
@@ -332,16 +651,69 @@ class ControlService:
         返回:
             是否成功
         """
-        logger.info(f"设置控件属性: 定位器={locator}, 属性名={property_name}, 值={value}, 窗口标题={window_title}, 应用别名={app_alias}, 超时={timeout}")
+        logger.info("设置控件属性: 定位器=%s, 属性名=%s, 值=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, property_name, value, window_title, app_alias, timeout)
+        
+        # 注意：不是所有控件都支持直接设置属性，目前只支持设置文本
+        if property_name.lower() not in ('text', 'value'):
+            return False
+        # 驱动没有set_element_text，文本通过清空后重新输入设置
+        return self._op("type_text", locator, window_title, app_alias, timeout, str(value), True)
+    
+    def get_control_properties(self, locator: Any, property_names: List[Any], window_title: Optional[str] = None, app_alias: Optional[str] = None, timeout: Optional[float] = None) -> Dict[Any, Any]:
+        """批量获取控件属性
+        
+        UIA_PROPERTY_IDS中的属性（或直接传入的UIA属性ID）通过一次BuildUpdatedCache跨进程调用全部读取，
+        其余属性名称按get_control_property的方式逐个读取
+        
+        参数:
+            locator: 控件定位器，格式为"类型:属性=值"
+            property_names: 属性名称或UIA属性ID列表
+            window_title: 窗口标题，可以是完整标题或正则表达式
+            app_alias: 应用程序的别名
+            timeout: 查找超时时间，单位为秒
+        
+        返回:
+            属性名称到属性值的字典，未找到控件时返回空字典
+        """
+        logger.info("批量获取控件属性: 定位器=%s, 属性名=%s, 窗口标题=%s, 应用别名=%s, 超时=%s", locator, property_names, window_title, app_alias, timeout)
         
         # 查找控件
-        control = self.find_control(locator, window_title, app_alias, timeout)
+        control = self._resolve(locator, window_title, app_alias, timeout)
         if not control:
-            return False
+            return {}
+        return self._element_properties(control, property_names)
+    
+    def _element_properties(self, element: Any, property_names: List[Any]) -> Dict[Any, Any]:
+        """批量读取控件属性
+        
+        参数:
+            element: 控件对象
+            property_names: 属性名称或UIA属性ID列表
         
-        # 调用驱动的设置属性方法
-        # 注意：不是所有控件都支持直接设置属性，这里可能需要根据具体情况调整
-        return self._driver.set_element_text(control, value) if property_name.lower() == 'text' or property_name.lower() == 'value' else False
+        返回:
+            属性名称到属性值的字典
+        """
+        values: Dict[Any, Any] = {}
+        pairs = [(name, name if isinstance(name, int) else UIA_PROPERTY_IDS.get(name)) for name in property_names]
+        uia_pairs = [(name, property_id) for name, property_id in pairs if property_id is not None]
+        if uia_pairs:
+            try:
+                raw = self._native_element(element)
+                if raw is not None:
+                    key = tuple(property_id for _, property_id in uia_pairs)
+                    request = self._property_requests.get(key)
+                    if request is None:
+                        request = self._property_requests[key] = self._create_cache_request(key)
+                    cached = raw.BuildUpdatedCache(request)
+                    for name, property_id in uia_pairs:
+                        values[name] = cached.GetCachedPropertyValue(property_id)
+            except Exception as e:
+                logger.debug("Failed to read cached properties: %s", e)
+        # UIA无法批量读取的属性交给驱动逐个读取
+        for name, _ in pairs:
+            if name not in values and isinstance(name, str):
+                values[name] = self._driver.get_element_attribute(element, name)
+        return values
     
     def find_element(self, parent: Any, locator: Any, timeout: float = 10.0) -> Any:
         """查找单个控件
@@ -357,24 +729,130 @@ class ControlService:
         Raises:
             TimeoutError: 如果超时
         """
-        logger.info(f"Finding element: parent={parent}, locator={locator}, timeout={timeout}")
-        
-        # 尝试从缓存中获取
-        cache_key = f"{id(parent)}:{str(locator)}:{timeout}"
-        cached_element = self._cache.get(cache_key)
-        if cached_element and self._driver.is_element_valid(cached_element):
-            logger.info(f"Found element from cache: {cached_element}")
-            return cached_element
+        logger.debug("Finding element: parent=%s, locator=%s, timeout=%s", parent, locator, timeout)
+        
+        # 尝试从缓存中获取，超时时间不影响查找结果，不参与缓存键
+        token = self._parent_token(parent)
+        if token is None:
+            # 父控件无法弱引用或不可哈希时不缓存
+            return self._driver.find_element(parent, locator, timeout)
+        cache_key = (token, _locator_fingerprint(locator))
+        cached = self._cache.get(cache_key)
+        if cached:
+            cached_element = cached[0]
+            now = time.monotonic()
+            # 最近校验过的控件直接返回，否则重新校验有效性并记录校验时间
+            recently_validated = now - cached[1] < ELEMENT_VALIDATE_INTERVAL
+            if recently_validated or self._is_cached_element_valid(cached_element, cached[2]):
+                if not recently_validated:
+                    cached[1] = now
+                logger.debug("Found element from cache: %s", cached_element)
+                return cached_element
+        
+        # 短时间内刚以不短于本次的超时时间查找失败过的定位器直接抛出上次的异常；
+        # 本次超时时间更长时仍需重新查找，控件可能在更长的等待内出现
+        miss = self._miss_cache.get(cache_key)
+        if miss is not None:
+            if miss[0] > time.monotonic():
+                if timeout <= miss[2]:
+                    raise miss[1].with_traceback(None)
+            else:
+                # 其他线程可能已删除同一项
+                self._miss_cache.pop(cache_key, None)
         
         # 缓存未命中，执行查找
-        element = self._driver.find_element(parent, locator, timeout)
+        try:
+            element = self._driver.find_element(parent, locator, timeout)
+        except MISS_ERRORS as e:
+            if len(self._miss_cache) >= MISS_CACHE_SIZE:
+                self._miss_cache.clear()
+            self._miss_cache[cache_key] = (time.monotonic() + MISS_CACHE_TTL, e, timeout)
+            raise
+        
+        # 驱动返回None表示未找到，不缓存，下次调用重新查找
+        if element is None:
+            return None
         
         # 缓存结果
-        self._cache.set(cache_key, element, ttl=300)  # 缓存5分钟
-        
-        logger.info(f"Found element: {element}")
+        self._cache.set(cache_key, [element, time.monotonic(), self._driver.get_runtime_id(element)], expire_time=300)  # 缓存5分钟
+        self._inserts += 1
+        if self._dead_parents:
+            self._purge_dead_parents()
+        if self._inserts >= CONTROL_CACHE_SWEEP_INTERVAL:
+            self._inserts = 0
+            self._sweep_cache()
+        
+        logger.debug("Found element: %s", element)
         return element
     
+    def _purge_dead_parents(self) -> None:
+        """清理已被回收的父控件留下的控件缓存和查找失败缓存"""
+        tokens = set()
+        while self._dead_parents:
+            try:
+                tokens.add(self._dead_parents.popleft())
+            except IndexError:
+                break
+        if tokens:
+            self._evict_tokens(tokens)
+    
+    def _evict_tokens(self, tokens: set) -> None:
+        """移除以指定父控件令牌开头的控件缓存和查找失败缓存
+        
+        Args:
+            tokens: 父控件令牌集合
+        """
+        _evict_parent(self._cache, tokens)
+        for key in [key for key in list(self._miss_cache) if key[0] in tokens]:
+            self._miss_cache.pop(key, None)
+    
+    def _sweep_cache(self) -> int:
+        """从控件缓存中移除已失效的控件，释放其持有的UIA对象
+        
+        Returns:
+            移除的缓存项数量
+        """
+        removed = self._cache.remove_if(lambda cached: not self._is_cached_element_valid(cached[0], cached[2]))
+        if removed:
+            logger.debug("Swept %s stale elements from control cache", removed)
+        return removed
+    
+    def _is_cached_element_valid(self, element: Any, runtime_id: Optional[tuple]) -> bool:
+        """校验缓存的控件是否仍然有效
+        
+        缓存时已记录RuntimeId的控件只需重新读取一次RuntimeId并比较，
+        否则使用驱动的完整有效性检查
+        
+        Args:
+            element: 缓存的控件对象
+            runtime_id: 缓存时读取的RuntimeId
+        
+        Returns:
+            是否有效
+        """
+        if runtime_id is None:
+            return self._driver.is_element_valid(element)
+        return self._driver.get_runtime_id(element) == runtime_id
+    
+    def _parent_token(self, parent: Any) -> Optional[int]:
+        """获取父控件的缓存令牌，首次出现时分配并在其被回收时清理相关缓存
+        
+        Args:
+            parent: 父控件或窗口对象
+        
+        Returns:
+            令牌，父控件无法弱引用或不可哈希时返回None
+        """
+        try:
+            token = self._parent_ids.get(parent)
+            if token is None:
+                token = next(_parent_tokens)
+                self._parent_ids[parent] = token
+                weakref.finalize(parent, self._dead_parents.append, token)
+            return token
+        except TypeError:
+            return None
+    
     def find_elements(self, parent: Any, locator: Any, timeout: float = 10.0) -> List[Any]:
         """查找多个控件
         
@@ -386,8 +864,217 @@ class ControlService:
         Returns:
             控件对象列表
         """
-        logger.info(f"Finding elements: parent={parent}, locator={locator}, timeout={timeout}")
-        return self._driver.find_elements(parent, locator, timeout)
+        logger.debug("Finding elements: parent=%s, locator=%s, timeout=%s", parent, locator, timeout)
+        elements = self._driver.find_elements(parent, locator, timeout)
+        if self.use_cache_request:
+            self._batch_snapshot(elements)
+        return elements
+    
+    def _get_cache_request(self) -> Any:
+        """获取包含SNAPSHOT_PROPERTIES的UIA CacheRequest
+        
+        Returns:
+            IUIAutomationCacheRequest，UIA不可用时返回None
+        """
+        if self._cache_request is None:
+            self._cache_request = False
+            try:
+                self._cache_request = self._create_cache_request(property_id for _, property_id in SNAPSHOT_PROPERTIES)
+            except Exception as e:
+                logger.warn("Failed to create UIA cache request: %s", e)
+        return self._cache_request or None
+    
+    @staticmethod
+    def _iuia() -> Any:
+        """获取IUIAutomation对象，优先使用uiautomation已创建的实例
+        
+        Returns:
+            IUIAutomation
+        """
+        try:
+            import uiautomation as auto
+            return auto._AutomationClient.instance().IUIAutomation
+        except ImportError:
+            from pywinauto.uia_defines import IUIA
+            return IUIA().iuia
+    
+    def _create_cache_request(self, property_ids: Any) -> Any:
+        """创建包含指定属性的IUIAutomationCacheRequest
+        
+        Args:
+            property_ids: UIA属性ID序列
+        
+        Returns:
+            IUIAutomationCacheRequest
+        """
+        request = self._iuia().CreateCacheRequest()
+        for property_id in property_ids:
+            request.AddProperty(property_id)
+        return request
+    
+    @staticmethod
+    def _native_element(element: Any) -> Any:
+        """获取控件对应的原生IUIAutomationElement
+        
+        Args:
+            element: uiautomation控件或pywinauto的UIA包装对象
+        
+        Returns:
+            IUIAutomationElement，控件尚未解析或无法获取时返回None
+        """
+        # 从实例属性读取，避免uiautomation的Control.Element或pywinauto的
+        # WindowSpecification.__getattr__在控件未解析时触发查找
+        try:
+            attrs = vars(element)
+        except TypeError:
+            return None
+        raw = attrs.get("_element")
+        if raw is None:
+            raw = getattr(attrs.get("element_info"), "element", None)
+        return raw
+    
+    def _batch_snapshot(self, elements: List[Any]) -> None:
+        """一次COM调用读取每个控件的SNAPSHOT_PROPERTIES并保存为快照
+        
+        只处理已解析出原生IUIAutomationElement的控件（uiautomation控件或pywinauto的UIA包装对象），
+        其余控件照常实时查询。新快照替换上一次find_elements的快照
+        
+        Args:
+            elements: 控件对象列表
+        """
+        self._snapshots = {}
+        if not elements:
+            return
+        request = self._get_cache_request()
+        if request is None:
+            return
+        now = time.monotonic()
+        for element in elements:
+            raw = self._native_element(element)
+            if raw is None:
+                continue
+            try:
+                updated = raw.BuildUpdatedCache(request)
+                values = {name: updated.GetCachedPropertyValue(property_id) for name, property_id in SNAPSHOT_PROPERTIES}
+            except Exception:
+                continue
+            self._snapshots[id(element)] = (element, now, values)
+    
+    def find_elements_with_properties(self, parent: Any, locator: Any, properties: Tuple[Any, ...], timeout: float = 10.0) -> List[Dict[Any, Any]]:
+        """查找多个控件并一次读取它们的属性
+        
+        通过FindAllBuildCache在一次COM调用中完成查找和属性读取，之后读取属性不再访问目标进程，
+        适合枚举表格行、列表项等大量控件。定位器无法转换为UIA条件时，退回find_elements后
+        逐个控件BuildUpdatedCache
+        
+        Args:
+            parent: 父控件或窗口对象
+            locator: 控件定位器，支持id=、name=、class=前缀、纯名称和auto_id/title/name/class_name字典
+            properties: 属性名称（见UIA_PROPERTY_IDS）或UIA属性ID
+            timeout: 超时时间，仅用于退回find_elements时
+        
+        Returns:
+            每个控件一个字典，键为properties中的项，值为属性值
+        
+        Example:
+            rows = service.find_elements_with_properties(window, "class=DataItem", ("name", "value"))
+        """
+        logger.debug("Finding elements with properties: parent=%s, locator=%s, properties=%s", parent, locator, properties)
+        property_ids = [UIA_PROPERTY_IDS[item] if isinstance(item, str) else item for item in properties]
+        request = self._create_cache_request(property_ids)
+        pairs = list(zip(properties, property_ids))
+        
+        raw_parent = self._native_element(parent)
+        conditions = self._locator_conditions(locator)
+        if raw_parent is not None and conditions is not None:
+            found = raw_parent.FindAllBuildCache(TreeScope_Descendants, self._uia_condition(conditions), request)
+            cached_elements = [found.GetElement(i) for i in range(found.Length)] if found else []
+        else:
+            cached_elements = []
+            for element in self._driver.find_elements(parent, locator, timeout):
+                raw = self._native_element(element)
+                if raw is not None:
+                    cached_elements.append(raw.BuildUpdatedCache(request))
+        
+        return [{name: cached.GetCachedPropertyValue(property_id) for name, property_id in pairs} for cached in cached_elements]
+    
+    def find_element_nowait(self, parent: Any, locator: Any) -> Any:
+        """只查找一次控件，不等待控件出现
+        
+        通过一次FindFirstBuildCache在父控件的后代中查找，同时缓存SNAPSHOT_PROPERTIES，
+        结果不写入find_element的缓存
+        
+        Args:
+            parent: 父控件或窗口对象
+            locator: 控件定位器，支持id=、name=、class=前缀、纯名称、ParsedLocator和auto_id/title/name/class_name字典
+        
+        Returns:
+            带属性缓存的IUIAutomationElement，控件不存在时返回None；
+            父控件不是UIA控件或定位器无法转换为UIA条件时返回_MISSING
+        """
+        raw_parent = self._native_element(parent)
+        conditions = self._locator_conditions(locator)
+        request = self._get_cache_request() if raw_parent is not None and conditions is not None else None
+        if request is None:
+            return _MISSING
+        try:
+            return raw_parent.FindFirstBuildCache(TreeScope_Descendants, self._uia_condition(conditions), request) or None
+        except Exception as e:
+            # 父控件已失效（UIA_E_ELEMENTNOTAVAILABLE）时视为控件不存在
+            logger.debug("FindFirstBuildCache failed: %s", e)
+            return None
+    
+    def _uia_condition(self, conditions: List[Tuple[int, Any]]) -> Any:
+        """将(UIA属性ID, 值)条件列表组合为一个IUIAutomationCondition
+        
+        Args:
+            conditions: _locator_conditions返回的条件列表
+        
+        Returns:
+            IUIAutomationCondition
+        """
+        iuia = self._iuia()
+        property_conditions = [iuia.CreatePropertyCondition(property_id, value) for property_id, value in conditions]
+        condition = property_conditions[0]
+        for property_condition in property_conditions[1:]:
+            condition = iuia.CreateAndCondition(condition, property_condition)
+        return condition
+    
+    @staticmethod
+    def _locator_conditions(locator: Any) -> Optional[List[Tuple[int, Any]]]:
+        """将定位器转换为(UIA属性ID, 值)条件列表
+        
+        Args:
+            locator: 控件定位器
+        
+        Returns:
+            条件列表，定位器包含无法转换的部分时返回None
+        """
+        if isinstance(locator, ParsedLocator):
+            return [(locator.property_id or UIA_NamePropertyId, locator.value)]
+        if isinstance(locator, str):
+            for prefix, property_id in _LOCATOR_PREFIXES:
+                if locator.startswith(prefix):
+                    return [(property_id, locator[len(prefix):])]
+            return [(UIA_NamePropertyId, locator)]
+        if isinstance(locator, dict) and locator and all(key in _LOCATOR_KEYS for key in locator):
+            return [(_LOCATOR_KEYS[key], value) for key, value in locator.items()]
+        return None
+    
+    def _snapshot_value(self, element: Any, name: str) -> Any:
+        """从属性快照中读取控件属性
+        
+        Args:
+            element: 控件对象
+            name: SNAPSHOT_PROPERTIES中的属性名称
+        
+        Returns:
+            属性值，没有有效快照时返回_MISSING
+        """
+        snapshot = self._snapshots.get(id(element))
+        if snapshot is None or snapshot[0] is not element or time.monotonic() - snapshot[1] > SNAPSHOT_TTL:
+            return _MISSING
+        return snapshot[2].get(name, _MISSING)
     
     def click_element(self, element: Any, button: str = "left", clicks: int = 1, interval: float = 0.0) -> bool:
         """点击控件
@@ -401,12 +1088,12 @@ class ControlService:
         Returns:
             是否成功
         """
-        logger.info(f"Clicking element: {element}, button={button}, clicks={clicks}, interval={interval}")
+        logger.debug("Clicking element: %s, button=%s, clicks=%s, interval=%s", element, button, clicks, interval)
         try:
             self._driver.click_element(element, button, clicks, interval)
             return True
         except Exception as e:
-            logger.error(f"Failed to click element: {e}")
+            logger.error("Failed to click element: %s", e)
             return False
     
     def right_click_element(self, element: Any) -> bool:
@@ -429,7 +1116,12 @@ class ControlService:
         Returns:
             是否成功
         """
-        return self.click_element(element, clicks=2, interval=0.1)
+        logger.debug("Double clicking element: %s", element)
+        try:
+            return self._driver.double_click_element(element)
+        except Exception as e:
+            logger.error("Failed to double click element: %s", e)
+            return False
     
     def type_text(self, element: Any, text: str, clear_first: bool = True, delay: float = 0.0) -> bool:
         """向控件输入文本
@@ -443,14 +1135,14 @@ class ControlService:
         Returns:
             是否成功
         """
-        logger.info(f"Typing text into element: {element}, text={text}, clear_first={clear_first}, delay={delay}")
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Typing text into element: %s, text=%s, clear_first=%s, delay=%s", element, text, clear_first, delay)
         try:
-            if clear_first:
-                self.clear_element_text(element)
-            self._driver.type_text(element, text, delay)
+            # 由驱动在同一次输入中完成清空，避免额外的清空调用
+            self._driver.type_text(element, text, clear_first, delay)
             return True
         except Exception as e:
-            logger.error(f"Failed to type text: {e}")
+            logger.error("Failed to type text: %s", e)
             return False
     
     def clear_element_text(self, element: Any) -> bool:
@@ -462,12 +1154,12 @@ class ControlService:
         Returns:
             是否成功
         """
-        logger.info(f"Clearing text from element: {element}")
+        logger.debug("Clearing text from element: %s", element)
         try:
             self._driver.clear_element_text(element)
             return True
         except Exception as e:
-            logger.error(f"Failed to clear text: {e}")
+            logger.error("Failed to clear text: %s", e)
             return False
     
     def get_element_text(self, element: Any) -> Optional[str]:
@@ -479,11 +1171,14 @@ class ControlService:
         Returns:
             控件文本
         """
-        logger.info(f"Getting text from element: {element}")
+        logger.debug("Getting text from element: %s", element)
+        name = self._snapshot_value(element, "name")
+        if name is not _MISSING:
+            return name
         try:
             return self._driver.get_element_text(element)
         except Exception as e:
-            logger.error(f"Failed to get element text: {e}")
+            logger.error("Failed to get element text: %s", e)
             return None
     
     def set_element_text(self, element: Any, text: str) -> bool:
@@ -496,12 +1191,12 @@ class ControlService:
         Returns:
             是否成功
         """
-        logger.info(f"Setting text for element: {element}, text={text}")
+        logger.debug("Setting text for element: %s, text=%s", element, text)
         try:
             self._driver.set_element_text(element, text)
             return True
         except Exception as e:
-            logger.error(f"Failed to set element text: {e}")
+            logger.error("Failed to set element text: %s", e)
             return False
     
     def get_element_attribute(self, element: Any, attribute: str) -> Optional[Any]:
@@ -514,11 +1209,11 @@ class ControlService:
         Returns:
             属性值
         """
-        logger.info(f"Getting attribute from element: {element}, attribute={attribute}")
+        logger.debug("Getting attribute from element: %s, attribute=%s", element, attribute)
         try:
             return self._driver.get_element_attribute(element, attribute)
         except Exception as e:
-            logger.error(f"Failed to get element attribute: {e}")
+            logger.error("Failed to get element attribute: %s", e)
             return None
     
     def is_element_enabled(self, element: Any) -> bool:
@@ -530,11 +1225,14 @@ class ControlService:
         Returns:
             是否可用
         """
-        logger.info(f"Checking if element is enabled: {element}")
+        logger.debug("Checking if element is enabled: %s", element)
+        enabled = self._snapshot_value(element, "is_enabled")
+        if enabled is not _MISSING:
+            return bool(enabled)
         try:
             return self._driver.is_element_enabled(element)
         except Exception as e:
-            logger.error(f"Failed to check if element is enabled: {e}")
+            logger.error("Failed to check if element is enabled: %s", e)
             return False
     
     def is_element_visible(self, element: Any) -> bool:
@@ -546,11 +1244,14 @@ class ControlService:
         Returns:
             是否可见
         """
-        logger.info(f"Checking if element is visible: {element}")
+        logger.debug("Checking if element is visible: %s", element)
+        offscreen = self._snapshot_value(element, "is_offscreen")
+        if offscreen is not _MISSING:
+            return not offscreen
         try:
             return self._driver.is_element_visible(element)
         except Exception as e:
-            logger.error(f"Failed to check if element is visible: {e}")
+            logger.error("Failed to check if element is visible: %s", e)
             return False
     
     def hover_element(self, element: Any) -> bool:
@@ -562,12 +1263,12 @@ class ControlService:
         Returns:
             是否成功
         """
-        logger.info(f"Hovering over element: {element}")
+        logger.debug("Hovering over element: %s", element)
         try:
             self._driver.hover_element(element)
             return True
         except Exception as e:
-            logger.error(f"Failed to hover over element: {e}")
+            logger.error("Failed to hover over element: %s", e)
             return False
     
     def drag_element_to(self, source_element: Any, target_element: Any) -> bool:
@@ -580,12 +1281,12 @@ class ControlService:
         Returns:
             是否成功
         """
-        logger.info(f"Dragging element: {source_element} to: {target_element}")
+        logger.debug("Dragging element: %s to: %s", source_element, target_element)
         try:
             self._driver.drag_element_to(source_element, target_element)
             return True
         except Exception as e:
-            logger.error(f"Failed to drag element: {e}")
+            logger.error("Failed to drag element: %s", e)
             return False
     
     def select_element(self, element: Any, value: Any = None, text: Optional[str] = None, index: int = -1) -> bool:
@@ -600,12 +1301,12 @@ class ControlService:
         Returns:
             是否成功
         """
-        logger.info(f"Selecting element: {element}, value={value}, text={text}, index={index}")
+        logger.debug("Selecting element: %s, value=%s, text=%s, index=%s", element, value, text, index)
         try:
             self._driver.select_element(element, value, text, index)
             return True
         except Exception as e:
-            logger.error(f"Failed to select element: {e}")
+            logger.error("Failed to select element: %s", e)
             return False
     
     def deselect_element(self, element: Any, value: Any = None, text: Optional[str] = None, index: int = -1) -> bool:
@@ -620,12 +1321,12 @@ class ControlService:
         Returns:
             是否成功
         """
-        logger.info(f"Deselecting element: {element}, value={value}, text={text}, index={index}")
+        logger.debug("Deselecting element: %s, value=%s, text=%s, index=%s", element, value, text, index)
         try:
             self._driver.deselect_element(element, value, text, index)
             return True
         except Exception as e:
-            logger.error(f"Failed to deselect element: {e}")
+            logger.error("Failed to deselect element: %s", e)
             return False
     
     def is_element_selected(self, element: Any) -> bool:
@@ -637,9 +1338,12 @@ class ControlService:
         Returns:
             是否被选中
         """
-        logger.info(f"Checking if element is selected: {element}")
+        logger.debug("Checking if element is selected: %s", element)
+        selected = self._snapshot_value(element, "is_selected")
+        if selected is not _MISSING:
+            return bool(selected)
         try:
             return self._driver.is_element_selected(element)
         except Exception as e:
-            logger.error(f"Failed to check if element is selected: {e}")
+            logger.error("Failed to check if element is selected: %s", e)
             return False
@@ -7,12 +7,26 @@
 
 import time
 import os
+import threading
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Hashable, Optional, Tuple
 from ..utils.logger import logger
+from ..config.local_config import local_config
+from ..backend.backend_factory import backend_factory
+from ..backend.win_events import WindowEventWatcher
 from ..services.control_service import ControlService
 from ..services.window_service import WindowService
 from ..utils.wait_strategy import WaitStrategy
-from ..utils.locator_helper import LocatorHelper
-from ..utils.dpi_adapter import DPIAdapter
+from ..utils.dpi_adapter import DPIAdapter, Point
+
+# 等待窗口事件时兜底的检查间隔（秒）
+POLL_MAX_INTERVAL = 0.25
+
+# 鼠标位置缓存有效期（秒），有效期内重复查询直接返回上次结果；设为0可关闭缓存
+MOUSE_POSITION_TTL = float(os.environ.get("RF_WIN_MOUSE_POSITION_TTL", "0.005"))
+
 
 class OperationService:
     """操作服务类
@@ -20,17 +34,73 @@ class OperationService:
     提供鼠标、键盘、等待和截图等操作的实现
     """
     
-    def __init__(self):
+    # 固定实例属性，属性访问不经过实例字典
+    __slots__ = (
+        'control_service', 'window_service', 'wait_strategy', 'dpi_adapter', '_backend',
+        '_pending_move', '_move_lock', '_mouse_position',
+        '_operation', '_inflight', '_inflight_lock',
+    )
+    
+    def __init__(self) -> None:
         """初始化操作服务实例
         
-        创建控件服务和窗口服务实例，用于控件和窗口操作
+        使用共享的控件服务和窗口服务实例，用于控件和窗口操作
         """
-        self.control_service = ControlService()
-        self.window_service = WindowService()
-        self.wait_strategy = WaitStrategy()
-        self.dpi_adapter = DPIAdapter()
+        self.control_service: ControlService = ControlService.instance()
+        self.window_service: WindowService = WindowService.instance()
+        self.wait_strategy: WaitStrategy = WaitStrategy()
+        self.dpi_adapter: DPIAdapter = DPIAdapter()
+        # 后端对象在实例生命周期内不变，只获取一次
+        self._backend: Any = backend_factory.get_backend()
+        # 待执行的鼠标移动，只保留最新的目标位置；其他线程正在移动鼠标时，
+        # 期间提交的移动合并为一次
+        self._pending_move: Deque[Tuple[int, int]] = deque(maxlen=1)
+        self._move_lock = threading.Lock()
+        # 最近一次查询到的鼠标位置，(查询时间, Point)
+        self._mouse_position: Optional[Tuple[float, Point]] = None
+        # 后端的操作对象，截图经由其capture_*方法和后台编码写盘流程完成
+        self._operation: Any = self._backend.create_operation()
+        # 正在进行的控件状态等待，键为(应用别名, 窗口标题, 定位器, 状态)，值为等待结果的Future
+        self._inflight: Dict[Hashable, "Future[bool]"] = {}
+        self._inflight_lock = threading.Lock()
     
-    def click_mouse(self, x, y, button='left', double=False):
+    def flush_pending_move(self) -> bool:
+        """执行尚未发送的鼠标移动
+        
+        点击、拖拽、按键等操作前都会先调用此方法，保证操作顺序与调用顺序一致
+        
+        返回:
+            是否成功，没有待执行的移动时返回True
+        """
+        with self._move_lock:
+            # 即将执行鼠标或键盘操作，缓存的鼠标位置不再可信
+            self._mouse_position = None
+            try:
+                physical_x, physical_y = self._pending_move.pop()
+            except IndexError:
+                return True
+            return self._backend.move_mouse(physical_x, physical_y, 0)
+    
+    def _poll(self, predicate: Callable[[], bool], timeout: float, error_message: str, *args: Any) -> bool:
+        """轮询等待条件满足
+        
+        使用等待策略的指数退避轮询，条件很快满足时无需等满固定间隔，长时间等待时也不会频繁查询
+        
+        参数:
+            predicate: 条件函数，返回True表示条件满足，抛出的异常视为未满足
+            timeout: 等待超时时间，单位为秒
+            error_message: 超时时记录的错误信息，可包含%s占位符
+            *args: 错误信息的占位符参数，只在超时记录日志时格式化
+        
+        返回:
+            条件是否在超时内满足
+        """
+        if self.wait_strategy.wait_until(predicate, timeout, None, policy="exp"):
+            return True
+        logger.error(error_message, *args)
+        return False
+    
+    def click_mouse(self, x: int, y: int, button: str = 'left', double: bool = False) -> bool:
         """点击鼠标
         
         在指定位置点击鼠标
@@ -44,12 +114,13 @@ class OperationService:
         # 转换为物理坐标
         physical_x, physical_y = self.dpi_adapter.logical_to_physical(x, y)
         
+        # 先执行待发送的鼠标移动
+        self.flush_pending_move()
+        
         # 调用底层操作
-        from ..backend.backend_factory import backend_factory
-        backend = backend_factory.get_backend()
-        return backend.click_mouse(physical_x, physical_y, button, double)
+        return self._backend.click_mouse(physical_x, physical_y, button, double)
     
-    def move_mouse(self, x, y, duration=0):
+    def move_mouse(self, x: int, y: int, duration: float = 0) -> bool:
         """移动鼠标
         
         将鼠标移动到指定位置
@@ -58,16 +129,25 @@ class OperationService:
             x: 目标位置的x坐标
             y: 目标位置的y坐标
             duration: 移动持续时间，单位为秒
+        
+        说明:
+            移动在返回前完成；多个线程同时移动鼠标时，等待期间提交的duration为0的移动
+            只执行最后一次，中间的移动路径点可能被丢弃
         """
         # 转换为物理坐标
         physical_x, physical_y = self.dpi_adapter.logical_to_physical(x, y)
         
-        # 调用底层操作
-        from ..backend.backend_factory import backend_factory
-        backend = backend_factory.get_backend()
-        return backend.move_mouse(physical_x, physical_y, duration)
+        if duration:
+            # 带持续时间的移动不合并
+            self.flush_pending_move()
+            return self._backend.move_mouse(physical_x, physical_y, duration)
+        
+        # 覆盖待执行的目标位置并立即发送；正在移动的线程释放锁后，
+        # 下一个获得锁的线程发送最新的目标位置，其余线程的目标已被覆盖，直接返回
+        self._pending_move.append((physical_x, physical_y))
+        return self.flush_pending_move()
     
-    def drag_mouse(self, start_x, start_y, end_x, end_y, duration=0):
+    def drag_mouse(self, start_x: int, start_y: int, end_x: int, end_y: int, duration: float = 0) -> bool:
         """拖拽鼠标
         
         从起始位置拖拽鼠标到结束位置
@@ -83,12 +163,13 @@ class OperationService:
         start_physical_x, start_physical_y = self.dpi_adapter.logical_to_physical(start_x, start_y)
         end_physical_x, end_physical_y = self.dpi_adapter.logical_to_physical(end_x, end_y)
         
+        # 先执行待发送的鼠标移动
+        self.flush_pending_move()
+        
         # 调用底层操作
-        from ..backend.backend_factory import backend_factory
-        backend = backend_factory.get_backend()
-        return backend.drag_mouse(start_physical_x, start_physical_y, end_physical_x, end_physical_y, duration)
+        return self._backend.drag_mouse(start_physical_x, start_physical_y, end_physical_x, end_physical_y, duration)
     
-    def scroll_mouse(self, x, y, clicks, horizontal=False):
+    def scroll_mouse(self, x: int, y: int, clicks: int, horizontal: bool = False) -> bool:
         """滚动鼠标
         
         在指定位置滚动鼠标
@@ -102,12 +183,13 @@ class OperationService:
         # 转换为物理坐标
         physical_x, physical_y = self.dpi_adapter.logical_to_physical(x, y)
         
+        # 先执行待发送的鼠标移动
+        self.flush_pending_move()
+        
         # 调用底层操作
-        from ..backend.backend_factory import backend_factory
-        backend = backend_factory.get_backend()
-        return backend.scroll_mouse(physical_x, physical_y, clicks, horizontal)
+        return self._backend.scroll_mouse(physical_x, physical_y, clicks, horizontal)
     
-    def press_mouse(self, x, y, button='left'):
+    def press_mouse(self, x: int, y: int, button: str = 'left') -> bool:
         """按下鼠标
         
         在指定位置按下鼠标按钮
@@ -120,12 +202,13 @@ class OperationService:
         # 转换为物理坐标
         physical_x, physical_y = self.dpi_adapter.logical_to_physical(x, y)
         
+        # 先执行待发送的鼠标移动
+        self.flush_pending_move()
+        
         # 调用底层操作
-        from ..backend.backend_factory import backend_factory
-        backend = backend_factory.get_backend()
-        return backend.press_mouse(physical_x, physical_y, button)
+        return self._backend.press_mouse(physical_x, physical_y, button)
     
-    def release_mouse(self, x, y, button='left'):
+    def release_mouse(self, x: int, y: int, button: str = 'left') -> bool:
         """释放鼠标
         
         在指定位置释放鼠标按钮
@@ -138,30 +221,40 @@ class OperationService:
         # 转换为物理坐标
         physical_x, physical_y = self.dpi_adapter.logical_to_physical(x, y)
         
+        # 先执行待发送的鼠标移动
+        self.flush_pending_move()
+        
         # 调用底层操作
-        from ..backend.backend_factory import backend_factory
-        backend = backend_factory.get_backend()
-        return backend.release_mouse(physical_x, physical_y, button)
+        return self._backend.release_mouse(physical_x, physical_y, button)
     
-    def get_mouse_position(self):
+    def get_mouse_position(self) -> Point:
         """获取鼠标位置
         
         获取当前鼠标的位置
         
         返回:
-            包含x和y坐标的字典
+            逻辑坐标Point(x, y)，也可按position['x']、position['y']访问
+        
+        说明:
+            MOUSE_POSITION_TTL内的重复查询返回缓存的位置，期间执行的鼠标、键盘操作会使缓存失效
         """
-        # 调用底层操作
-        from ..backend.backend_factory import backend_factory
-        backend = backend_factory.get_backend()
-        physical_x, physical_y = backend.get_mouse_position()
+        cached = self._mouse_position
+        if cached is not None and not self._pending_move and time.monotonic() - cached[0] < MOUSE_POSITION_TTL:
+            return cached[1]
+        
+        # 先执行待发送的鼠标移动
+        self.flush_pending_move()
         
-        # 转换为逻辑坐标
-        logical_x, logical_y = self.dpi_adapter.physical_to_logical(physical_x, physical_y)
+        # 调用底层操作
+        physical_x, physical_y = self._backend.get_mouse_position()
         
-        return {'x': logical_x, 'y': logical_y}
+        # 转换为逻辑坐标；Point不可变，缓存命中时可直接返回同一对象
+        position = self.dpi_adapter.physical_to_logical(physical_x, physical_y)
+        if MOUSE_POSITION_TTL > 0:
+            self._mouse_position = (time.monotonic(), position)
+        return position
     
-    def type_text(self, text, delay=0):
+    def type_text(self, text: str, delay: float = 0) -> bool:
         """输入文本
         
         输入指定的文本
@@ -170,12 +263,13 @@ class OperationService:
             text: 要输入的文本
             delay: 按键之间的延迟，单位为秒
         """
+        # 先执行待发送的鼠标移动
+        self.flush_pending_move()
+        
         # 调用底层操作
-        from ..backend.backend_factory import backend_factory
-        backend = backend_factory.get_backend()
-        return backend.type_text(text, delay)
+        return self._backend.type_text(text, delay)
     
-    def press_key(self, key, modifier=None):
+    def press_key(self, key: str, modifier: Optional[str] = None) -> bool:
         """按下按键
         
         按下指定的按键
@@ -184,12 +278,13 @@ class OperationService:
             key: 要按下的按键
             modifier: 修饰键，可选值为'Ctrl'、'Alt'、'Shift'、'Win'
         """
+        # 先执行待发送的鼠标移动
+        self.flush_pending_move()
+        
         # 调用底层操作
-        from ..backend.backend_factory import backend_factory
-        backend = backend_factory.get_backend()
-        return backend.press_key(key, modifier)
+        return self._backend.press_key(key, modifier)
     
-    def release_key(self, key, modifier=None):
+    def release_key(self, key: str, modifier: Optional[str] = None) -> bool:
         """释放按键
         
         释放指定的按键
@@ -198,12 +293,13 @@ class OperationService:
             key: 要释放的按键
             modifier: 修饰键，可选值为'Ctrl'、'Alt'、'Shift'、'Win'
         """
+        # 先执行待发送的鼠标移动
+        self.flush_pending_move()
+        
         # 调用底层操作
-        from ..backend.backend_factory import backend_factory
-        backend = backend_factory.get_backend()
-        return backend.release_key(key, modifier)
+        return self._backend.release_key(key, modifier)
     
-    def combo_keys(self, keys):
+    def combo_keys(self, keys: str) -> bool:
         """组合按键
         
         按下并释放指定的组合按键
@@ -211,12 +307,13 @@ class OperationService:
         参数:
             keys: 组合按键，格式为'Ctrl+C'、'Alt+F4'等
         """
-        # 调用底层操作
-        from ..backend.backend_factory import backend_factory
-        backend = backend_factory.get_backend()
-        return backend.combo_keys(keys)
+        # 先执行待发送的鼠标移动
+        self.flush_pending_move()
+        
+        # 由后端操作对象解析组合键并发送
+        return self._operation.press_keys(keys)
     
-    def wait(self, seconds):
+    def wait(self, seconds: float) -> bool:
         """等待
         
         等待指定的时间
@@ -227,7 +324,7 @@ class OperationService:
         time.sleep(seconds)
         return True
     
-    def wait_for_control_exists(self, locator, window_title=None, app_alias=None, timeout=30):
+    def wait_for_control_exists(self, locator: Any, window_title: Optional[str] = None, app_alias: Optional[str] = None, timeout: float = 30) -> bool:
         """等待控件存在
         
         等待指定的控件存在
@@ -238,12 +335,9 @@ class OperationService:
             app_alias: 应用程序的别名
             timeout: 等待超时时间，单位为秒
         """
-        def condition():
-            return self.control_service.is_control_exists(locator, window_title, app_alias)
-        
-        return self.wait_strategy.wait_until(condition, timeout, f"控件不存在: {locator}")
+        return self._wait_for_control_state('exists', locator, window_title, app_alias, timeout, "控件不存在: %s")
     
-    def wait_for_control_visible(self, locator, window_title=None, app_alias=None, timeout=30):
+    def wait_for_control_visible(self, locator: Any, window_title: Optional[str] = None, app_alias: Optional[str] = None, timeout: float = 30) -> bool:
         """等待控件可见
         
         等待指定的控件可见
@@ -254,12 +348,9 @@ class OperationService:
             app_alias: 应用程序的别名
             timeout: 等待超时时间，单位为秒
         """
-        def condition():
-            return self.control_service.is_control_visible(locator, window_title, app_alias)
-        
-        return self.wait_strategy.wait_until(condition, timeout, f"控件不可见: {locator}")
+        return self._wait_for_control_state('visible', locator, window_title, app_alias, timeout, "控件不可见: %s")
     
-    def wait_for_control_enabled(self, locator, window_title=None, app_alias=None, timeout=30):
+    def wait_for_control_enabled(self, locator: Any, window_title: Optional[str] = None, app_alias: Optional[str] = None, timeout: float = 30) -> bool:
         """等待控件启用
         
         等待指定的控件启用
@@ -270,12 +361,68 @@ class OperationService:
             app_alias: 应用程序的别名
             timeout: 等待超时时间，单位为秒
         """
-        def condition():
-            return self.control_service.is_control_enabled(locator, window_title, app_alias)
+        return self._wait_for_control_state('enabled', locator, window_title, app_alias, timeout, "控件未启用: %s")
+    
+    def _wait_for_control_state(self, state: str, locator: Any, window_title: Optional[str], app_alias: Optional[str], timeout: float, error_message: str) -> bool:
+        """等待控件状态满足，同一控件同一状态同时只有一个轮询
         
-        return self.wait_strategy.wait_until(condition, timeout, f"控件未启用: {locator}")
+        第一个调用方负责轮询并通过Future公布结果，其他线程中等待相同条件的调用方直接等待该Future；
+        轮询方先于自己超时放弃时，等待方在剩余时间内接着轮询
+        
+        参数:
+            state: get_control_state结果中的状态名，如'exists'
+            locator: 控件定位器，格式为"类型:属性=值"
+            window_title: 窗口标题，可以是完整标题或正则表达式
+            app_alias: 应用程序的别名
+            timeout: 等待超时时间，单位为秒
+            error_message: 超时时记录的错误信息，包含定位器的%s占位符
+        
+        返回:
+            状态是否在超时内满足
+        """
+        # 控件状态由控件服务统一解析并缓存，轮询时复用已找到的控件
+        get_state = self.control_service.get_control_state
+        
+        def condition() -> bool:
+            return get_state(locator, window_title, app_alias, 0)[state]
+        
+        key = (app_alias, window_title, locator, state)
+        try:
+            hash(key)
+        except TypeError:
+            # 字典定位器无法作为键，不合并等待
+            return self._poll(condition, timeout, error_message, locator)
+        
+        deadline = time.monotonic() + float(timeout)
+        while True:
+            with self._inflight_lock:
+                future = self._inflight.get(key)
+                polling = future is None
+                if polling:
+                    future = self._inflight[key] = Future()
+            
+            if polling:
+                satisfied = False
+                try:
+                    satisfied = self.wait_strategy.wait_until(condition, max(deadline - time.monotonic(), 0), None, policy="exp")
+                finally:
+                    with self._inflight_lock:
+                        del self._inflight[key]
+                    future.set_result(satisfied)
+                break
+            
+            try:
+                satisfied = future.result(max(deadline - time.monotonic(), 0))
+            except FutureTimeoutError:
+                satisfied = False
+            if satisfied or time.monotonic() >= deadline:
+                break
+        
+        if not satisfied:
+            logger.error(error_message, locator)
+        return satisfied
     
-    def wait_for_window_exists(self, window_title, app_alias=None, timeout=30):
+    def wait_for_window_exists(self, window_title: str, app_alias: Optional[str] = None, timeout: float = 30) -> bool:
         """等待窗口存在
         
         等待指定的窗口存在
@@ -285,12 +432,33 @@ class OperationService:
             app_alias: 应用程序的别名
             timeout: 等待超时时间，单位为秒
         """
-        def condition():
+        def condition() -> bool:
             return self.window_service.is_window_exists(window_title, app_alias)
         
-        return self.wait_strategy.wait_until(condition, timeout, f"窗口不存在: {window_title}")
+        watcher = WindowEventWatcher()
+        if not watcher.start():
+            # 无法注册窗口事件钩子时退回轮询
+            return self._poll(condition, timeout, "窗口不存在: %s", window_title)
+        
+        # 有窗口创建、显示或标题变化时才重新检查，POLL_MAX_INTERVAL作为兜底的检查间隔
+        deadline = time.monotonic() + float(timeout)
+        with watcher:
+            while True:
+                try:
+                    if condition():
+                        return True
+                except Exception:
+                    # 忽略异常，继续等待
+                    pass
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                watcher.wait(min(remaining, POLL_MAX_INTERVAL))
+        
+        logger.error("窗口不存在: %s", window_title)
+        return False
     
-    def take_screenshot(self, filename=None, folder=None, window_title=None, app_alias=None):
+    def take_screenshot(self, filename: Optional[str] = None, folder: Optional[str] = None, window_title: Optional[str] = None, app_alias: Optional[str] = None, wait: bool = True) -> str:
         """截图
         
         截取当前屏幕或指定窗口的截图
@@ -300,36 +468,37 @@ class OperationService:
             folder: 截图保存文件夹
             window_title: 窗口标题，可以是完整标题或正则表达式
             app_alias: 应用程序的别名
+            wait: 是否等待文件写入完成；为False时编码和写盘在后台完成，
+                读取文件前需调用后端操作对象的wait_for_screenshots
         
         返回:
             截图文件路径
+        
+        异常:
+            RuntimeError: 未找到窗口，或抓屏、编码、写入失败
         """
-        # 生成文件名
+        # 生成文件名，带微秒避免同一秒内的连续截图互相覆盖
         if not filename:
-            filename = f"screenshot_{time.strftime('%Y%m%d_%H%M%S')}"
+            filename = f"screenshot_{datetime.now():%Y%m%d_%H%M%S_%f}"
         
-        # 生成文件路径
+        # 生成文件路径，默认文件夹随当前工作目录变化
         if not folder:
             folder = os.path.join(os.getcwd(), 'screenshots')
         
-        # 确保文件夹存在
+        # 确保文件夹存在；每次都检查，文件夹可能在两次截图之间被删除
         os.makedirs(folder, exist_ok=True)
         
-        # 完整文件路径
-        file_path = os.path.join(folder, f"{filename}.png")
-        
-        # 调用底层操作
-        from ..backend.backend_factory import backend_factory
-        backend = backend_factory.get_backend()
+        # 完整文件路径，扩展名与后端编码使用的格式一致
+        file_path = os.path.join(folder, f"{filename}.{local_config.get('screenshot_format', 'png')}")
         
         if window_title:
             # 获取窗口实例
             window = self.window_service.switch_window(window_title, app_alias)
-            if window:
-                return backend.take_screenshot(file_path, window)
-            else:
-                logger.error(f"未找到窗口: {window_title}")
-                return None
+            if not window:
+                raise RuntimeError(f"未找到窗口: {window_title}")
+            result = self._operation.capture_window_screenshot(window, file_path, wait=wait)
         else:
-            # 截取整个屏幕
-            return backend.take_screenshot(file_path)
+            result = self._operation.capture_screenshot(file_path, wait=wait)
+        if not result:
+            raise RuntimeError(f"截图失败: {file_path}")
+        return result
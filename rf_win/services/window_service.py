@@ -5,23 +5,143 @@
 提供窗口管理相关的服务功能
 """
 
+import ctypes
+import threading
+from collections import OrderedDict
 from ..utils.logger import logger
 from ..utils.cache_manager import cache_manager
 from ..core.base_window import BaseWindow
 from .application_service import ApplicationService
 
+# 窗口解析缓存的最大条目数
+WINDOW_CACHE_SIZE = 64
+
+# 模块加载时取一次IsWindow，非Windows平台上为None
+try:
+    _IsWindow = ctypes.windll.user32.IsWindow
+except AttributeError:
+    _IsWindow = None
+
+# instance()返回的共享实例，各服务和关键字共用同一份缓存
+_INSTANCE = None
+_INSTANCE_LOCK = threading.Lock()
+
+def _window_handle(window):
+    """获取窗口实例的原生窗口句柄
+    
+    参数:
+        window: 窗口实例，可以是pywinauto包装对象或包含_window的窗口对象
+    
+    返回:
+        窗口句柄，无法获取时返回None
+    """
+    try:
+        handle = getattr(window, "handle", None) or getattr(getattr(window, "_window", None), "handle", None)
+    except Exception:
+        return None
+    return handle if isinstance(handle, int) and handle else None
+
 class WindowService:
     """窗口服务类
     
     提供窗口管理相关的服务功能，如获取窗口、切换窗口、窗口操作等
     """
     
-    def __init__(self):
+    @classmethod
+    def instance(cls) -> "WindowService":
+        """获取共享的窗口服务实例，首次调用时创建
+        
+        返回:
+            窗口服务实例
+        """
+        global _INSTANCE
+        if _INSTANCE is None:
+            with _INSTANCE_LOCK:
+                if _INSTANCE is None:
+                    _INSTANCE = cls()
+        return _INSTANCE
+    
+    def __init__(self, app_service=None):
         """初始化窗口服务实例
         
-        创建应用服务实例，用于获取应用程序实例
+        参数:
+            app_service: 用于获取应用程序实例的应用服务，默认使用共享实例
+        """
+        self.app_service = app_service or ApplicationService.instance()
+        # 已解析的窗口，键为(应用别名, 窗口标题, 索引)，按最近使用排序
+        self._windows = OrderedDict()
+        # 窗口关闭或失效时调用的回调，参数为窗口实例，用于清理基于该窗口的控件缓存
+        self._invalidate_callbacks = []
+        # 最近一次解析到的窗口，(缓存键, 窗口实例, 窗口句柄)；句柄仍有效时不再检查窗口状态
+        self._last_window = None
+    
+    def add_invalidate_callback(self, callback):
+        """注册窗口失效回调
+        
+        参数:
+            callback: 回调函数，参数为失效的窗口实例
+        """
+        self._invalidate_callbacks.append(callback)
+    
+    def _invalidate(self, window):
+        """通知已注册的回调窗口已失效
+        
+        参数:
+            window: 失效的窗口实例
+        """
+        self._last_window = None
+        for callback in self._invalidate_callbacks:
+            callback(window)
+    
+    def _resolve(self, window_title=None, app_alias=None, index=0):
+        """解析窗口并缓存结果
+        
+        同一窗口上的连续操作复用上次解析到的窗口，窗口已关闭时重新查找；
+        与上一次解析相同的窗口只需一次IsWindow调用确认句柄仍然有效
+        
+        参数:
+            window_title: 窗口标题，可以是完整标题或正则表达式
+            app_alias: 应用程序的别名
+            index: 窗口索引，默认为0
+        
+        返回:
+            窗口实例，未找到时返回None
+        """
+        key = (app_alias, window_title, index)
+        last = self._last_window
+        if last is not None and last[0] == key and _IsWindow(last[2]):
+            return last[1]
+        
+        window = self._windows.get(key)
+        if window is not None:
+            try:
+                closed = window.is_closed()
+            except Exception:
+                closed = True
+            if not closed:
+                self._windows.move_to_end(key)
+                self._remember(key, window)
+                return window
+            del self._windows[key]
+            self._invalidate(window)
+        
+        window = self.switch_window(window_title, app_alias, index)
+        if window:
+            self._windows[key] = window
+            if len(self._windows) > WINDOW_CACHE_SIZE:
+                self._windows.popitem(last=False)
+            self._remember(key, window)
+        return window
+    
+    def _remember(self, key, window):
+        """记录最近一次解析到的窗口，无法获取句柄或不在Windows上时不记录
+        
+        参数:
+            key: 缓存键(应用别名, 窗口标题, 索引)
+            window: 窗口实例
         """
-        self.app_service = ApplicationService()
+        handle = _window_handle(window) if _IsWindow is not None else None
+        self._last_window = (key, window, handle) if handle else None
     
     def get_current_window(self, app_alias=None):
         """获取当前活动窗口
@@ -37,7 +157,7 @@ class WindowService:
         # 获取应用实例
         app = self.app_service.get_application(app_alias)
         if not app:
-            logger.error(f"未找到应用实例: {app_alias}")
+            logger.error("未找到应用实例: %s", app_alias)
             return None
         
         # 获取当前窗口
@@ -62,7 +182,7 @@ class WindowService:
         # 获取应用实例
         app = self.app_service.get_application(app_alias)
         if not app:
-            logger.error(f"未找到应用实例: {app_alias}")
+            logger.error("未找到应用实例: %s", app_alias)
             return []
         
         # 获取所有窗口
@@ -84,10 +204,10 @@ class WindowService:
         # 获取应用实例
         app = self.app_service.get_application(app_alias)
         if not app:
-            logger.error(f"未找到应用实例: {app_alias}")
+            logger.error("未找到应用实例: %s", app_alias)
             return None
         
-        # 切换窗口
+        # 切换窗口（标题匹配由应用对象完成，服务层不编译正则表达式）
         window = app.switch_window(window_title, index)
         if window:
             # 缓存当前窗口
@@ -106,7 +226,7 @@ class WindowService:
             index: 窗口索引，默认为0
         """
         # 获取窗口实例
-        window = self.switch_window(window_title, app_alias, index)
+        window = self._resolve(window_title, app_alias, index)
         if window:
             window.activate()
         
@@ -125,10 +245,13 @@ class WindowService:
         # 获取应用实例
         app = self.app_service.get_application(app_alias)
         if not app:
-            logger.error(f"未找到应用实例: {app_alias}")
+            logger.error("未找到应用实例: %s", app_alias)
             return False
         
         # 关闭窗口
+        window = self._windows.pop((app_alias, window_title, index), None)
+        if window is not None:
+            self._invalidate(window)
         return app.close_window(window_title, index)
     
     def maximize_window(self, window_title=None, app_alias=None, index=0):
@@ -142,7 +265,7 @@ class WindowService:
             index: 窗口索引，默认为0
         """
         # 获取窗口实例
-        window = self.switch_window(window_title, app_alias, index)
+        window = self._resolve(window_title, app_alias, index)
         if window:
             window.maximize()
         
@@ -159,7 +282,7 @@ class WindowService:
             index: 窗口索引，默认为0
         """
         # 获取窗口实例
-        window = self.switch_window(window_title, app_alias, index)
+        window = self._resolve(window_title, app_alias, index)
         if window:
             window.minimize()
         
@@ -176,7 +299,7 @@ class WindowService:
             index: 窗口索引，默认为0
         """
         # 获取窗口实例
-        window = self.switch_window(window_title, app_alias, index)
+        window = self._resolve(window_title, app_alias, index)
         if window:
             window.restore()
         
@@ -195,7 +318,7 @@ class WindowService:
             index: 窗口索引，默认为0
         """
         # 获取窗口实例
-        window = self.switch_window(window_title, app_alias, index)
+        window = self._resolve(window_title, app_alias, index)
         if window:
             window.move(x, y)
         
@@ -214,7 +337,7 @@ class WindowService:
             index: 窗口索引，默认为0
         """
         # 获取窗口实例
-        window = self.switch_window(window_title, app_alias, index)
+        window = self._resolve(window_title, app_alias, index)
         if window:
             window.resize(width, height)
         
@@ -234,7 +357,7 @@ class WindowService:
             窗口标题
         """
         # 获取窗口实例
-        window = self.switch_window(window_title, app_alias, index)
+        window = self._resolve(window_title, app_alias, index)
         if window:
             return window.get_title()
         
@@ -254,7 +377,7 @@ class WindowService:
             包含x和y坐标的字典
         """
         # 获取窗口实例
-        window = self.switch_window(window_title, app_alias, index)
+        window = self._resolve(window_title, app_alias, index)
         if window:
             return window.get_position()
         
@@ -274,7 +397,7 @@ class WindowService:
             包含宽度和高度的字典
         """
         # 获取窗口实例
-        window = self.switch_window(window_title, app_alias, index)
+        window = self._resolve(window_title, app_alias, index)
         if window:
             return window.get_size()
         
@@ -295,7 +418,7 @@ class WindowService:
         # 获取应用实例
         app = self.app_service.get_application(app_alias)
         if not app:
-            logger.error(f"未找到应用实例: {app_alias}")
+            logger.error("未找到应用实例: %s", app_alias)
             return False
         
         # 检查窗口是否存在
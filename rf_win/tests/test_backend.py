@@ -6,10 +6,15 @@
 测试rf_win.backend模块中的后端工厂和具体后端实现，确保它们能够正确地创建和管理后端实例
 """
 
+import os
+import shutil
+import tempfile
+import threading
 import unittest
 from unittest.mock import Mock, patch
 from rf_win.backend.backend_factory import BackendFactory
-from rf_win.backend.pywinauto_backend import PywinautoBackend
+from rf_win.backend.pywinauto_backend import PywinautoBackend, PywinautoOperation
+from rf_win.backend.win_input import KEYEVENTF_KEYUP, _combo_events, parse_combo, send_vk_combo
 
 
 class TestBackendFactory(unittest.TestCase):
@@ -117,5 +122,114 @@ class TestPywinautoBackend(unittest.TestCase):
         mock_pywinauto_operation.assert_called_once()
 
 
+
+class TestComboKeys(unittest.TestCase):
+    """测试组合键解析和发送"""
+    
+    def test_parse_combo(self):
+        """测试组合键解析为按顺序排列的虚拟键码"""
+        self.assertEqual(parse_combo("Ctrl+Alt+F4"), (0x11, 0x12, 0x73))
+        self.assertEqual(parse_combo("ctrl + shift + a"), (0x11, 0x10, ord("A")))
+        self.assertEqual(parse_combo("Win+1"), (0x5B, ord("1")))
+    
+    def test_parse_combo_unknown_key(self):
+        """测试无法识别的按键名称抛出KeyError"""
+        with self.assertRaises(KeyError):
+            parse_combo("Ctrl+NoSuchKey")
+    
+    @patch('rf_win.backend.pywinauto_backend.send_vk_combo', return_value=True)
+    def test_press_keys_sends_vk_combo(self, mock_send_vk_combo):
+        """测试press_keys把可识别的组合键交给send_vk_combo"""
+        self.assertTrue(PywinautoOperation().press_keys("Ctrl+Alt+F4"))
+        mock_send_vk_combo.assert_called_once_with((0x11, 0x12, 0x73))
+    
+    @patch('rf_win.backend.pywinauto_backend.send_keys', create=True)
+    @patch('rf_win.backend.pywinauto_backend.send_vk_combo')
+    def test_press_keys_falls_back_to_send_keys(self, mock_send_vk_combo, mock_send_keys):
+        """测试包含无法识别按键名称时按send_keys格式发送"""
+        self.assertTrue(PywinautoOperation().press_keys("Ctrl+{F13}"))
+        mock_send_vk_combo.assert_not_called()
+        mock_send_keys.assert_called_once_with("^{F13}")
+    
+    @patch('rf_win.backend.pywinauto_backend.send_keys', create=True)
+    def test_type_text_fallback_keeps_whitespace(self, mock_send_keys):
+        """测试含send_keys特殊字符的文本经由send_keys输入时保留空格、制表符和换行"""
+        self.assertTrue(PywinautoOperation().type_text("a b\t(c)\n", interval=0))
+        mock_send_keys.assert_called_once_with(
+            "a b\t(c)\n", pause=0, with_spaces=True, with_tabs=True, with_newlines=True
+        )
+    
+    def test_combo_events_order(self):
+        """测试组合键事件先按顺序按下，再按相反顺序释放"""
+        events = _combo_events((0x11, 0x12, 0x73))
+        self.assertEqual(events, [
+            (0x11, 0, 0), (0x12, 0, 0), (0x73, 0, 0),
+            (0x73, 0, KEYEVENTF_KEYUP), (0x12, 0, KEYEVENTF_KEYUP), (0x11, 0, KEYEVENTF_KEYUP),
+        ])
+    
+    @patch('rf_win.backend.win_input._send', side_effect=len)
+    def test_send_vk_combo_submits_one_batch(self, mock_send):
+        """测试send_vk_combo把全部按下和释放事件一次提交"""
+        self.assertTrue(send_vk_combo((0x11, ord("C"))))
+        mock_send.assert_called_once_with(_combo_events((0x11, ord("C"))))
+
+
+class _Image:
+    """模拟截图图像，save按指定格式写入固定内容"""
+    
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+    
+    def save(self, buffer, image_format, **kwargs):
+        if self.fail:
+            raise OSError("encode failed")
+        buffer.write(image_format.encode())
+
+
+class TestScreenshotPipeline(unittest.TestCase):
+    """测试PywinautoOperation的后台截图编码和写盘"""
+    
+    def setUp(self):
+        """初始化测试环境"""
+        self.folder = tempfile.mkdtemp()
+        self.operation = PywinautoOperation()
+    
+    def tearDown(self):
+        """清理测试环境"""
+        shutil.rmtree(self.folder, ignore_errors=True)
+    
+    def test_save_waits_for_file(self):
+        """测试默认等待文件写入完成后才返回"""
+        path = os.path.join(self.folder, "shot.png")
+        self.assertEqual(self.operation._save_screenshot(_Image(), path, "screenshot"), path)
+        self.assertTrue(os.path.exists(path))
+    
+    def test_save_failure_raises(self):
+        """测试等待时编码失败抛出异常"""
+        with self.assertRaises(OSError):
+            self.operation._save_screenshot(_Image(fail=True), os.path.join(self.folder, "bad.png"), "screenshot")
+    
+    def test_async_save_reports_failure(self):
+        """测试不等待时由wait_for_screenshots报告失败"""
+        self.operation._save_screenshot(_Image(fail=True), os.path.join(self.folder, "bad.png"), "screenshot", wait=False)
+        self.assertFalse(self.operation.wait_for_screenshots(10))
+    
+    def test_async_saves_from_several_threads(self):
+        """测试多个线程并发提交不等待的截图时，登记和完成回调不互相干扰"""
+        def save(index):
+            for i in range(20):
+                path = os.path.join(self.folder, f"shot_{index}_{i}.png")
+                self.operation._save_screenshot(_Image(), path, "screenshot", wait=False)
+        
+        threads = [threading.Thread(target=save, args=(index,)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertTrue(self.operation.wait_for_screenshots(10))
+        self.assertEqual(self.operation._pending_screenshots, {})
+        self.assertEqual(len(os.listdir(self.folder)), 80)
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
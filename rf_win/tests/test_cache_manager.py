@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+缓存管理器测试
+
+测试rf_win.utils.cache_manager模块的分片、LRU淘汰和容量限制
+"""
+
+import threading
+import time
+import unittest
+import weakref
+from rf_win.utils.cache_manager import CacheManager
+
+
+class _Value:
+    """可弱引用的缓存值"""
+
+
+class TestCacheManager(unittest.TestCase):
+    """测试CacheManager"""
+
+    def setUp(self):
+        """初始化测试环境"""
+        self.cache = CacheManager(max_size=8, default_expire_time=60)
+
+    def _run_with_timeout(self, func, *args):
+        """在独立线程中执行，超时未返回视为死锁"""
+        thread = threading.Thread(target=func, args=args, daemon=True)
+        thread.start()
+        thread.join(10)
+        self.assertFalse(thread.is_alive(), "调用未返回，可能在分片锁上死锁")
+
+    def test_keys_are_spread_over_shards(self):
+        """测试缓存项分布到多个分片"""
+        cache = CacheManager(max_size=256)
+        for i in range(64):
+            cache.set(i, i)
+        used = [shard for shard in cache._shards if shard]
+        self.assertGreater(len(used), 1)
+        self.assertEqual(cache.get_size(), 64)
+        self.assertEqual(sorted(cache.get_keys()), list(range(64)))
+
+    def test_capacity_is_global(self):
+        """测试容量限制作用于整个缓存，未满时不淘汰"""
+        for i in range(8):
+            self.cache.set(i, i)
+        self.assertEqual(self.cache.get_size(), 8)
+        for i in range(8, 40):
+            self.cache.set(i, i)
+            self.assertLessEqual(self.cache.get_size(), 8)
+        self.assertEqual(self.cache.get_size(), 8)
+
+    def test_lru_keeps_recently_used(self):
+        """测试淘汰时保留分片中最近访问的缓存项"""
+        cache = CacheManager(max_size=2)
+        # 整数的哈希值即其本身，偶数键都位于同一分片
+        cache.set(0, "a")
+        cache.set(2, "b")
+        self.assertEqual(cache.get(0), "a")
+        cache.set(4, "c")
+        self.assertEqual(cache.get(0), "a")
+        self.assertIsNone(cache.get(2))
+        self.assertEqual(cache.get(4), "c")
+
+    def test_replace_does_not_grow_size(self):
+        """测试替换已有键不增加缓存项数量"""
+        for _ in range(3):
+            self.cache.set("key", _Value())
+        self.assertEqual(self.cache.get_size(), 1)
+        self.assertTrue(self.cache.remove("key"))
+        self.assertFalse(self.cache.remove("key"))
+        self.assertEqual(self.cache._size, 0)
+
+    def test_expired_items_are_removed(self):
+        """测试过期缓存不再返回"""
+        self.cache.set("key", 1, expire_time=0.01)
+        time.sleep(0.02)
+        self.assertIsNone(self.cache.get("key"))
+        self.assertFalse(self.cache.exists("key"))
+        self.assertEqual(self.cache._size, 0)
+
+    def test_remove_if(self):
+        """测试按值条件删除缓存项"""
+        for i in range(8):
+            self.cache.set(i, i)
+        removed = self.cache.remove_if(lambda value: value % 2 == 0)
+        self.assertEqual(removed, 4)
+        self.assertEqual(sorted(self.cache.get_keys()), [1, 3, 5, 7])
+        self.assertEqual(self.cache._size, 4)
+
+    def test_finalizer_reentering_cache_does_not_deadlock(self):
+        """测试缓存值被替换、淘汰或删除时，其finalize回调访问缓存不会死锁"""
+        cache = CacheManager(max_size=1)
+        calls = []
+
+        def store(key):
+            value = _Value()
+            weakref.finalize(value, lambda: calls.append(cache.get_keys()))
+            cache.set(key, value)
+
+        # 替换
+        self._run_with_timeout(store, "a")
+        self._run_with_timeout(store, "a")
+        # 淘汰
+        self._run_with_timeout(store, "b")
+        # 删除和清空
+        self._run_with_timeout(cache.remove, "b")
+        self._run_with_timeout(store, "c")
+        self._run_with_timeout(cache.clear)
+        self.assertEqual(len(calls), 4)
+        self.assertEqual(cache.get_size(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+数据IO测试
+
+测试rf_win.modules.data_io模块的文件读写功能
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+from rf_win.modules import data_io
+from rf_win.modules.data_io import DataIO, MMAP_THRESHOLD, CALAMINE_AVAILABLE, OPENPYXL_AVAILABLE, XLSXWRITER_AVAILABLE
+
+
+# 覆盖\n、\r\n、单独的\r、空行和无结尾换行等情况
+_TEXT_CASES = [
+    "",
+    "a",
+    "a\nb\n",
+    "a\n\nb",
+    "a\r\nb\r\n",
+    "a\rb\r",
+    "a\r\r\nb",
+    "  空白 \n第二行\n\n",
+]
+
+
+class TestTextFiles(unittest.TestCase):
+    """测试文本文件读取的内存映射和逐行迭代路径与文本模式结果一致"""
+    
+    def setUp(self):
+        """初始化测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.temp_dir, "text.txt")
+    
+    def tearDown(self):
+        """清理测试环境"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _write(self, content, encoding="utf-8"):
+        """按原样写入文件内容，不转换换行符"""
+        with open(self.file_path, "wb") as f:
+            f.write(content.encode(encoding))
+    
+    def _read_text_mode(self, encoding="utf-8"):
+        """以文本模式读取文件，作为比较基准"""
+        with open(self.file_path, "r", encoding=encoding) as f:
+            return f.read()
+    
+    def test_read_text_file_large(self):
+        """测试超过MMAP_THRESHOLD的文件通过内存映射读取，结果与文本模式一致"""
+        for case in _TEXT_CASES[1:]:
+            content = case * (MMAP_THRESHOLD // len(case) + 1)
+            self._write(content)
+            self.assertEqual(DataIO.read_text_file(self.file_path), self._read_text_mode(), repr(case))
+    
+    def test_read_text_file_bom(self):
+        """测试utf-8-sig编码的大文件去掉BOM"""
+        self._write("\ufeff" + "行\r\n" * MMAP_THRESHOLD)
+        self.assertEqual(DataIO.read_text_file(self.file_path, "utf-8-sig"), self._read_text_mode("utf-8-sig"))
+    
+    def test_get_file_lines_count(self):
+        """测试行数与文本模式逐行统计一致"""
+        for case in _TEXT_CASES:
+            self._write(case)
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                expected = sum(1 for _ in f)
+            self.assertEqual(DataIO.get_file_lines_count(self.file_path), expected, repr(case))
+    
+    def test_iter_lines_matches_read_lines(self):
+        """测试iter_lines与read_lines返回相同的行"""
+        for encoding in ("utf-8", "utf-8-sig", "utf-16"):
+            for case in _TEXT_CASES:
+                self._write(case, encoding)
+                for strip in (False, True):
+                    self.assertEqual(
+                        list(DataIO.iter_lines(self.file_path, encoding, strip)),
+                        DataIO.read_lines(self.file_path, encoding, strip),
+                        (encoding, case, strip),
+                    )
+    
+    def test_iter_csv_rows_matches_read_csv(self):
+        """测试iter_csv_rows与read_csv返回相同的行"""
+        with open(self.file_path, "w", encoding="utf-8", newline="") as f:
+            f.write('name,value\r\na,1\r\n"多行\r\n文本",2\r\nshort\r\nlong,3,extra\r\n')
+        for header in (True, False):
+            self.assertEqual(
+                list(DataIO.iter_csv_rows(self.file_path, header=header)),
+                DataIO.read_csv(self.file_path, header=header),
+            )
+    
+    def test_iter_csv_rows_empty_file(self):
+        """测试空文件没有行"""
+        self._write("")
+        self.assertEqual(list(DataIO.iter_csv_rows(self.file_path)), [])
+
+    
+    def test_write_recreates_externally_deleted_directory(self):
+        """测试已创建过的目录被外部删除后，写入和复制时重新创建目录"""
+        sub_dir = os.path.join(self.temp_dir, "sub")
+        target = os.path.join(sub_dir, "out.txt")
+        DataIO.write_text_file(target, "a")
+        shutil.rmtree(sub_dir)
+        DataIO.write_text_file(target, "b")
+        self.assertEqual(DataIO.read_text_file(target), "b")
+        
+        shutil.rmtree(sub_dir)
+        self._write("c")
+        DataIO.copy_file(self.file_path, target)
+        self.assertEqual(DataIO.read_text_file(target), "c")
+
+@unittest.skipUnless(OPENPYXL_AVAILABLE, "openpyxl is not installed")
+class TestExcelAppendCache(unittest.TestCase):
+    """测试append_to_excel(use_cache=True)的工作簿缓存"""
+    
+    def setUp(self):
+        """初始化测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.temp_dir, "cached.xlsx")
+    
+    def tearDown(self):
+        """清理测试环境"""
+        data_io._excel_cache.clear()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _run_with_timeout(self, func, *args, **kwargs):
+        """在独立线程中执行，超时未返回视为死锁"""
+        thread = threading.Thread(target=func, args=args, kwargs=kwargs, daemon=True)
+        thread.start()
+        thread.join(10)
+        self.assertFalse(thread.is_alive(), "调用未返回，可能在_excel_cache_lock上死锁")
+    
+    def _rows_on_disk(self):
+        """绕过追加缓存直接读取磁盘上的文件内容"""
+        wb = data_io.load_workbook(self.file_path, read_only=True)
+        try:
+            return [list(row) for row in wb.active.iter_rows(values_only=True)]
+        finally:
+            wb.close()
+    
+    def test_cached_append_creates_missing_file(self):
+        """测试缓存追加到不存在的文件时创建文件而不死锁"""
+        self._run_with_timeout(DataIO.append_to_excel, self.file_path, [["a", 1]], use_cache=True)
+        self.assertTrue(os.path.exists(self.file_path))
+        self.assertEqual(DataIO.read_excel(self.file_path, header=False), [["a", 1]])
+    
+    def test_cached_append_is_written_on_flush(self):
+        """测试缓存的追加在flush_excel_cache后写回磁盘"""
+        DataIO.write_excel(self.file_path, [["a", 1]])
+        DataIO.append_to_excel(self.file_path, [["b", 2]], use_cache=True)
+        self.assertEqual(self._rows_on_disk(), [["a", 1]])
+        
+        self._run_with_timeout(DataIO.flush_excel_cache)
+        self.assertEqual(self._rows_on_disk(), [["a", 1], ["b", 2]])
+    
+    def test_write_excel_discards_cached_appends(self):
+        """测试write_excel覆盖文件时丢弃未写回的缓存追加"""
+        DataIO.write_excel(self.file_path, [["a", 1]])
+        DataIO.append_to_excel(self.file_path, [["b", 2]], use_cache=True)
+        DataIO.write_excel(self.file_path, [["c", 3]])
+        DataIO.flush_excel_cache()
+        self.assertEqual(DataIO.read_excel(self.file_path, header=False), [["c", 3]])
+    
+    def test_read_excel_sees_cached_appends(self):
+        """测试read_excel读取前写回缓存的追加"""
+        DataIO.write_excel(self.file_path, [["a", 1]])
+        DataIO.append_to_excel(self.file_path, [["b", 2]], use_cache=True)
+        self.assertEqual(DataIO.read_excel(self.file_path, header=False), [["a", 1], ["b", 2]])
+    
+    def test_uncached_append_keeps_cached_appends(self):
+        """测试不使用缓存的追加保留之前缓存的追加，且之后写回缓存不覆盖"""
+        DataIO.write_excel(self.file_path, [["a", 1]])
+        DataIO.append_to_excel(self.file_path, [["b", 2]], use_cache=True)
+        DataIO.append_to_excel(self.file_path, [["c", 3]])
+        DataIO.flush_excel_cache()
+        self.assertEqual(DataIO.read_excel(self.file_path, header=False), [["a", 1], ["b", 2], ["c", 3]])
+    
+    def test_delete_file_discards_cached_appends(self):
+        """测试删除文件后写回缓存不会重新创建文件"""
+        DataIO.write_excel(self.file_path, [["a", 1]])
+        DataIO.append_to_excel(self.file_path, [["b", 2]], use_cache=True)
+        DataIO.delete_file(self.file_path)
+        DataIO.flush_excel_cache()
+        self.assertFalse(os.path.exists(self.file_path))
+    
+    def test_copy_and_move_include_cached_appends(self):
+        """测试复制和移动文件前写回缓存的追加"""
+        copy_path = os.path.join(self.temp_dir, "copy.xlsx")
+        move_path = os.path.join(self.temp_dir, "moved.xlsx")
+        DataIO.write_excel(self.file_path, [["a", 1]])
+        DataIO.append_to_excel(self.file_path, [["b", 2]], use_cache=True)
+        DataIO.copy_file(self.file_path, copy_path)
+        self.assertEqual(DataIO.read_excel(copy_path, header=False), [["a", 1], ["b", 2]])
+        
+        DataIO.append_to_excel(self.file_path, [["c", 3]], use_cache=True)
+        DataIO.move_file(self.file_path, move_path)
+        DataIO.flush_excel_cache()
+        self.assertFalse(os.path.exists(self.file_path))
+        self.assertEqual(DataIO.read_excel(move_path, header=False), [["a", 1], ["b", 2], ["c", 3]])
+
+
+
+@unittest.skipUnless(OPENPYXL_AVAILABLE and XLSXWRITER_AVAILABLE, "openpyxl or xlsxwriter is not installed")
+class TestExcelWriters(unittest.TestCase):
+    """测试xlsxwriter与openpyxl两种写入方式的结果一致"""
+    
+    def setUp(self):
+        """初始化测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        """清理测试环境"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _write_and_load(self, name, data, use_xlsxwriter):
+        """按指定方式写入后用openpyxl加载第一个工作表"""
+        file_path = os.path.join(self.temp_dir, name)
+        with patch.object(data_io, "XLSXWRITER_AVAILABLE", use_xlsxwriter):
+            DataIO.write_excel(file_path, data)
+        return data_io.load_workbook(file_path).active
+    
+    def test_xlsxwriter_round_trip_matches_openpyxl(self):
+        """测试URL字符串和日期时间的写入结果与openpyxl一致"""
+        data = [
+            {"name": "url", "value": "https://example.com/page"},
+            {"name": "time", "value": datetime(2024, 5, 6, 7, 8, 9)},
+        ]
+        expected = self._write_and_load("openpyxl.xlsx", data, False)
+        actual = self._write_and_load("xlsxwriter.xlsx", data, True)
+        
+        self.assertEqual(
+            [list(row) for row in actual.iter_rows(values_only=True)],
+            [list(row) for row in expected.iter_rows(values_only=True)],
+        )
+        self.assertEqual(actual["B2"].value, "https://example.com/page")
+        self.assertIsNone(actual["B2"].hyperlink)
+        self.assertTrue(actual["B3"].is_date)
+        self.assertEqual(actual["B3"].value, datetime(2024, 5, 6, 7, 8, 9))
+
+
+@unittest.skipUnless(OPENPYXL_AVAILABLE and CALAMINE_AVAILABLE, "openpyxl or python-calamine is not installed")
+class TestExcelReaders(unittest.TestCase):
+    """测试calamine与openpyxl两种读取方式的结果一致"""
+    
+    def setUp(self):
+        """初始化测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.temp_dir, "values.xlsx")
+        wb = data_io.Workbook()
+        wb.active.append(["name", "count", "ratio", "note"])
+        wb.active.append(["a", 1, 2.5, None])
+        wb.active.append(["b", 3.0, 4, "x"])
+        wb.save(self.file_path)
+    
+    def tearDown(self):
+        """清理测试环境"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _read(self, use_calamine, **kwargs):
+        """按指定方式读取Excel文件"""
+        with patch.object(data_io, "CALAMINE_AVAILABLE", use_calamine):
+            return DataIO.read_excel(self.file_path, **kwargs)
+    
+    def test_integral_numbers_and_empty_cells(self):
+        """测试整数值返回int，空单元格返回None"""
+        expected = [["a", 1, 2.5, None], ["b", 3, 4, "x"]]
+        for use_calamine in (False, True):
+            with self.subTest(use_calamine=use_calamine):
+                rows = self._read(use_calamine, header=False, start_row=2)
+                self.assertEqual(rows, expected)
+                self.assertEqual([type(row[1]) for row in rows], [int, int])
+    
+    def test_header_rows_match(self):
+        """测试按表头读取时两种方式结果相同"""
+        self.assertEqual(self._read(True), self._read(False))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -172,6 +172,15 @@ class TestPywinautoDriver(unittest.TestCase):
         self.assertTrue(hasattr(driver, 'release_key'))
         self.assertTrue(hasattr(driver, 'capture_screenshot'))
         self.assertTrue(hasattr(driver, 'wait_for_condition'))
+    
+    def test_type_text_fallback_keeps_whitespace(self):
+        """测试含send_keys特殊字符的文本经由type_keys输入时保留空格、制表符和换行"""
+        driver = PywinautoDriver.__new__(PywinautoDriver)
+        element = Mock()
+        self.assertTrue(driver.type_text(element, "a b\t(c)", clear_first=False))
+        element.type_keys.assert_called_once_with(
+            "a b\t(c)", with_spaces=True, with_tabs=True, with_newlines=True
+        )
 
 
 class TestDriverFactory(unittest.TestCase):
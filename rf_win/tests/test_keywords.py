@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+关键字生成测试
+
+测试rf_win.keywords.shim按关键字表生成的转发方法
+"""
+
+import inspect
+import unittest
+from unittest.mock import Mock
+from rf_win.keywords.keyboard_mouse import KeyboardMouseKeywords
+from rf_win.keywords.shim import keyword_table
+
+
+class _Service:
+    """测试用服务类"""
+
+    def move_mouse(self, x, y, duration=0, extra=None):
+        """移动鼠标"""
+
+
+_SPEC = [
+    ('移动鼠标', 'move_mouse', ('x', 'y', 'duration'), {'duration': 0}, ['鼠标操作'], (
+        '| 移动鼠标 | 100 | 200 |',
+    )),
+]
+
+
+@keyword_table(_Service, _SPEC)
+class _Keywords:
+    """测试用关键字类"""
+
+
+class TestKeywordTable(unittest.TestCase):
+    """测试keyword_table生成的关键字方法"""
+
+    def setUp(self):
+        """初始化测试环境"""
+        self.keywords = _Keywords()
+        self.keywords._move_mouse = Mock(return_value=True)
+
+    def test_signature_follows_spec(self):
+        """测试方法签名按关键字表构造，不包含服务方法的其他参数"""
+        signature = inspect.signature(_Keywords.move_mouse)
+        self.assertEqual(list(signature.parameters), ['self', 'x', 'y', 'duration'])
+        self.assertEqual(signature.parameters['duration'].default, 0)
+        self.assertEqual(list(inspect.signature(self.keywords.move_mouse).parameters), ['x', 'y', 'duration'])
+
+    def test_metadata(self):
+        """测试方法名称、文档和关键字名称"""
+        method = _Keywords.move_mouse
+        self.assertEqual(method.__name__, 'move_mouse')
+        self.assertEqual(method.__qualname__, '_Keywords.move_mouse')
+        self.assertIn('| 移动鼠标 | 100 | 200 |', method.__doc__)
+        self.assertEqual(_Keywords._service_methods, ('move_mouse',))
+
+    def test_call_forwards_arguments(self):
+        """测试位置参数、关键字参数和默认值都按顺序转发给服务方法"""
+        self.assertTrue(self.keywords.move_mouse(1, 2, 3))
+        self.keywords._move_mouse.assert_called_with(1, 2, 3)
+        self.keywords.move_mouse(1, y=2)
+        self.keywords._move_mouse.assert_called_with(1, 2, 0)
+        with self.assertRaises(TypeError):
+            self.keywords.move_mouse(1)
+
+
+
+class _Key(str):
+    """str子类，sys.intern不接受"""
+
+
+class TestKeywordArgumentIntern(unittest.TestCase):
+    """测试关键字入口驻留字符串参数时不拒绝非字符串参数"""
+
+    def setUp(self):
+        """初始化测试环境"""
+        self.operation = Mock()
+        self.keywords = KeyboardMouseKeywords(Mock(_operation=self.operation))
+
+    def test_non_str_arguments_are_passed_through(self):
+        """测试数字和str子类参数原样传给操作对象"""
+        for key in (5, _Key("Enter")):
+            with self.subTest(key=key):
+                self.keywords.press_key(key)
+                self.assertIs(self.operation.press_key.call_args[0][0], key)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,11 +6,20 @@
 测试rf_win.services模块中的服务类，确保它们能够正确地处理业务逻辑
 """
 
+import os
+import shutil
+import tempfile
+import threading
+import time
 import unittest
+import weakref
+from collections import deque
 from unittest.mock import Mock, patch
 from rf_win.services.application_service import ApplicationService
 from rf_win.services.window_service import WindowService
 from rf_win.services.control_service import ControlService
+from rf_win.utils.cache_manager import CacheManager
+from rf_win.utils.wait_strategy import WaitStrategy
 from rf_win.services.operation_service import OperationService
 
 
@@ -279,6 +288,115 @@ class TestControlService(unittest.TestCase):
         mock_driver.clear_element_text.assert_called_once_with(mock_control)
 
 
+class _Window:
+    """可弱引用的父窗口"""
+
+
+class TestControlServiceMissCache(unittest.TestCase):
+    """测试ControlService.find_element的查找失败缓存"""
+    
+    def setUp(self):
+        """初始化测试环境"""
+        self.driver = Mock()
+        self.driver.find_element.side_effect = TimeoutError("not found")
+        self.control_service = ControlService.__new__(ControlService)
+        self.control_service._driver = self.driver
+        self.control_service._cache = CacheManager(max_size=10)
+        self.control_service._inserts = 0
+        self.control_service._miss_cache = {}
+        self.control_service._parent_ids = weakref.WeakKeyDictionary()
+        self.control_service._dead_parents = deque()
+        self.window = _Window()
+    
+    def test_repeated_miss_is_cached(self):
+        """测试相同超时时间的重复查找直接抛出缓存的异常"""
+        for _ in range(2):
+            with self.assertRaises(TimeoutError):
+                self.control_service.find_element(self.window, "name=OK", 0)
+        self.assertEqual(self.driver.find_element.call_count, 1)
+    
+    def test_longer_timeout_searches_again(self):
+        """测试超时时间更长的查找不使用缓存的失败结果"""
+        with self.assertRaises(TimeoutError):
+            self.control_service.find_element(self.window, "name=OK", 0)
+        self.driver.find_element.side_effect = None
+        self.driver.find_element.return_value = "element"
+        self.assertEqual(self.control_service.find_element(self.window, "name=OK", 5), "element")
+        self.assertEqual(self.driver.find_element.call_count, 2)
+    
+    def test_none_result_is_not_cached(self):
+        """测试驱动返回None时不缓存，下次调用重新查找"""
+        self.driver.find_element.side_effect = [None, "element"]
+        self.assertIsNone(self.control_service.find_element(self.window, "name=OK", 0))
+        self.assertEqual(self.control_service.find_element(self.window, "name=OK", 0), "element")
+        self.assertEqual(self.driver.find_element.call_count, 2)
+
+
+
+class _Specification:
+    """模拟pywinauto的WindowSpecification，访问未定义的属性时触发查找"""
+    
+    def __init__(self):
+        self.lookups = []
+    
+    def __getattr__(self, name):
+        self.lookups.append(name)
+        return Mock()
+
+
+class TestControlServiceNativeElement(unittest.TestCase):
+    """测试ControlService._native_element"""
+    
+    def test_unresolved_specification_is_not_looked_up(self):
+        """测试未解析的控件返回None且不触发查找"""
+        spec = _Specification()
+        self.assertIsNone(ControlService._native_element(spec))
+        self.assertEqual(spec.lookups, [])
+    
+    def test_resolved_elements(self):
+        """测试从uiautomation控件和pywinauto包装对象获取原生控件"""
+        control = _Specification()
+        control._element = "uia"
+        wrapper = _Specification()
+        wrapper.element_info = Mock(element="pywinauto")
+        self.assertEqual(ControlService._native_element(control), "uia")
+        self.assertEqual(ControlService._native_element(wrapper), "pywinauto")
+        self.assertEqual(control.lookups + wrapper.lookups, [])
+
+class TestControlServiceStateCache(unittest.TestCase):
+    """测试ControlService.get_control_state的短期状态缓存"""
+    
+    def setUp(self):
+        """初始化测试环境"""
+        self.control_service = ControlService.__new__(ControlService)
+        self.control_service._states = {}
+        self.missing = {'exists': False, 'visible': False, 'enabled': False}
+        self.present = {'exists': True, 'visible': True, 'enabled': True}
+    
+    @patch.object(ControlService, '_element_state')
+    @patch.object(ControlService, '_resolve')
+    @patch.object(ControlService, '_find_first_state')
+    def test_longer_timeout_after_zero_timeout_miss(self, mock_find_first, mock_resolve, mock_element_state):
+        """测试零超时未找到后，更长超时的查询重新查找而不返回缓存的结果"""
+        mock_find_first.return_value = dict(self.missing)
+        mock_resolve.return_value = "element"
+        mock_element_state.return_value = dict(self.present)
+        self.assertFalse(self.control_service.get_control_state("name=OK", "w", timeout=0)['exists'])
+        self.assertFalse(self.control_service.get_control_state("name=OK", "w", timeout=0)['exists'])
+        self.assertEqual(mock_find_first.call_count, 1)
+        self.assertTrue(self.control_service.get_control_state("name=OK", "w", timeout=5)['exists'])
+        mock_resolve.assert_called_once_with("name=OK", "w", None, 5)
+    
+    @patch.object(ControlService, '_find_first_state')
+    def test_cached_state_is_copied(self, mock_find_first):
+        """测试调用方修改返回的字典不影响缓存"""
+        mock_find_first.return_value = dict(self.present)
+        state = self.control_service.get_control_state("name=OK", "w", timeout=0)
+        state['visible'] = False
+        self.assertTrue(self.control_service.get_control_state("name=OK", "w", timeout=0)['visible'])
+        self.assertEqual(mock_find_first.call_count, 1)
+
+
 class TestOperationService(unittest.TestCase):
     """测试OperationService类"""
     
@@ -368,5 +486,185 @@ class TestOperationService(unittest.TestCase):
         mock_driver.wait_for_condition.assert_called_once_with("visible", timeout=5)
 
 
+class TestOperationServiceMouseMove(unittest.TestCase):
+    """测试OperationService.move_mouse的同步执行和并发合并"""
+    
+    def setUp(self):
+        """初始化测试环境"""
+        self.backend = Mock()
+        self.backend.move_mouse.return_value = True
+        self.operation_service = OperationService.__new__(OperationService)
+        self.operation_service._backend = self.backend
+        self.operation_service.dpi_adapter = Mock()
+        self.operation_service.dpi_adapter.logical_to_physical.side_effect = lambda x, y: (x, y)
+        self.operation_service._pending_move = deque(maxlen=1)
+        self.operation_service._move_lock = threading.Lock()
+        self.operation_service._mouse_position = None
+    
+    def test_move_is_synchronous(self):
+        """测试duration为0的移动在返回前执行"""
+        self.assertTrue(self.operation_service.move_mouse(10, 20))
+        self.backend.move_mouse.assert_called_once_with(10, 20, 0)
+        self.assertFalse(self.operation_service._pending_move)
+    
+    def test_move_failure_is_reported(self):
+        """测试移动失败时返回False"""
+        self.backend.move_mouse.return_value = False
+        self.assertFalse(self.operation_service.move_mouse(10, 20))
+    
+    def test_concurrent_moves_are_coalesced(self):
+        """测试其他线程移动期间提交的移动只执行最后一次"""
+        started = threading.Event()
+        release = threading.Event()
+        
+        def move_mouse(x, y, duration):
+            if (x, y) == (1, 1):
+                started.set()
+                release.wait(10)
+            return True
+        
+        self.backend.move_mouse.side_effect = move_mouse
+        first = threading.Thread(target=self.operation_service.move_mouse, args=(1, 1))
+        first.start()
+        self.assertTrue(started.wait(10))
+        # 第一次移动尚未完成时提交的两个目标，只保留最后一个
+        self.operation_service._pending_move.append((2, 2))
+        self.operation_service._pending_move.append((3, 3))
+        release.set()
+        first.join(10)
+        self.assertTrue(self.operation_service.move_mouse(4, 4))
+        calls = [call[0] for call in self.backend.move_mouse.call_args_list]
+        self.assertEqual(calls, [(1, 1, 0), (4, 4, 0)])
+
+
+class TestOperationServiceScreenshot(unittest.TestCase):
+    """测试OperationService.take_screenshot经由后端操作对象截图"""
+    
+    def setUp(self):
+        """初始化测试环境"""
+        self.folder = tempfile.mkdtemp()
+        self.operation = Mock()
+        self.operation.capture_screenshot.side_effect = lambda filename, wait: filename
+        self.operation.capture_window_screenshot.side_effect = lambda window, filename, wait: filename
+        self.window_service = Mock()
+        self.operation_service = OperationService.__new__(OperationService)
+        self.operation_service._operation = self.operation
+        self.operation_service.window_service = self.window_service
+    
+    def tearDown(self):
+        """清理测试环境"""
+        shutil.rmtree(self.folder, ignore_errors=True)
+    
+    def test_screen_screenshot(self):
+        """测试全屏截图调用capture_screenshot并默认等待写入完成"""
+        path = self.operation_service.take_screenshot("shot", self.folder)
+        self.assertEqual(os.path.dirname(path), self.folder)
+        self.assertTrue(os.path.basename(path).startswith("shot."))
+        self.operation.capture_screenshot.assert_called_once_with(path, wait=True)
+    
+    def test_window_screenshot_without_wait(self):
+        """测试窗口截图调用capture_window_screenshot，可选择不等待写入"""
+        window = Mock()
+        self.window_service.switch_window.return_value = window
+        path = self.operation_service.take_screenshot("shot", self.folder, "Notepad", wait=False)
+        self.operation.capture_window_screenshot.assert_called_once_with(window, path, wait=False)
+    
+    def test_capture_failure_raises(self):
+        """测试截图失败时抛出异常而不是返回空路径"""
+        self.operation.capture_screenshot.side_effect = None
+        self.operation.capture_screenshot.return_value = None
+        with self.assertRaises(RuntimeError):
+            self.operation_service.take_screenshot("shot", self.folder)
+    
+    def test_missing_window_raises(self):
+        """测试窗口不存在时抛出异常"""
+        self.window_service.switch_window.return_value = None
+        with self.assertRaises(RuntimeError):
+            self.operation_service.take_screenshot("shot", self.folder, "Missing")
+        self.operation.capture_window_screenshot.assert_not_called()
+    
+    def test_deleted_folder_is_recreated(self):
+        """测试截图文件夹在两次截图之间被删除时重新创建"""
+        folder = os.path.join(self.folder, "shots")
+        self.operation_service.take_screenshot("first", folder)
+        shutil.rmtree(folder)
+        self.operation_service.take_screenshot("second", folder)
+        self.assertTrue(os.path.isdir(folder))
+    
+    def test_default_folder_follows_cwd(self):
+        """测试默认截图文件夹随当前工作目录变化"""
+        cwd = os.getcwd()
+        paths = []
+        try:
+            for name in ("a", "b"):
+                work_dir = os.path.join(self.folder, name)
+                os.makedirs(work_dir)
+                os.chdir(work_dir)
+                paths.append(self.operation_service.take_screenshot("shot"))
+        finally:
+            os.chdir(cwd)
+        self.assertEqual(
+            [os.path.dirname(path) for path in paths],
+            [os.path.join(self.folder, name, "screenshots") for name in ("a", "b")],
+        )
+
+
+class TestOperationServiceWaitDedup(unittest.TestCase):
+    """测试OperationService对同一控件状态的并发等待只轮询一次"""
+    
+    def setUp(self):
+        """初始化测试环境"""
+        self.control_service = Mock()
+        self.operation_service = OperationService.__new__(OperationService)
+        self.operation_service.control_service = self.control_service
+        self.operation_service.wait_strategy = WaitStrategy()
+        self.operation_service._inflight = {}
+        self.operation_service._inflight_lock = threading.Lock()
+    
+    def _start(self, results, timeout, label=None):
+        """在新线程中等待控件可见，结果追加到results"""
+        thread = threading.Thread(target=lambda: results.append(
+            (label, self.operation_service.wait_for_control_visible("name=OK", "w", timeout=timeout))))
+        thread.start()
+        return thread
+    
+    def test_concurrent_waits_share_one_poll(self):
+        """测试等待相同状态的线程共用第一个线程的轮询结果"""
+        entered = threading.Event()
+        release = threading.Event()
+        
+        def get_control_state(*args):
+            entered.set()
+            release.wait(10)
+            return {'exists': True, 'visible': True, 'enabled': True}
+        
+        self.control_service.get_control_state.side_effect = get_control_state
+        results = []
+        threads = [self._start(results, 10)]
+        self.assertTrue(entered.wait(10))
+        threads += [self._start(results, 10) for _ in range(4)]
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join(10)
+        self.assertEqual([result for _, result in results], [True] * 5)
+        self.assertEqual(self.control_service.get_control_state.call_count, 1)
+        self.assertEqual(self.operation_service._inflight, {})
+    
+    def test_waiter_continues_after_poller_times_out(self):
+        """测试轮询方先超时后，超时更长的等待方接着轮询"""
+        start = time.monotonic()
+        self.control_service.get_control_state.side_effect = lambda *args: {
+            'exists': True, 'visible': time.monotonic() - start > 0.4, 'enabled': True,
+        }
+        results = []
+        short = self._start(results, 0.2, 'short')
+        time.sleep(0.05)
+        long = self._start(results, 5, 'long')
+        short.join(10)
+        long.join(10)
+        self.assertEqual(sorted(results), [('long', True), ('short', False)])
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+工具模块测试
+
+测试rf_win.utils模块中的定位器解析、等待策略和关键字日志开关
+"""
+
+import unittest
+from unittest.mock import patch
+from rf_win.config.global_config import global_config
+from rf_win.utils.locator_helper import LocatorHelper
+from rf_win.utils.logger import keyword_info_enabled
+from rf_win.utils.wait_strategy import BACKOFF_FACTOR, BACKOFF_INITIAL_INTERVAL, BACKOFF_MAX_INTERVAL, WaitStrategy
+
+
+class TestLocatorHelperCompilePath(unittest.TestCase):
+    """测试LocatorHelper.compile_path分层定位器解析"""
+
+    def test_split_segments(self):
+        """测试按'|'拆分为每层的ParsedLocator"""
+        path = LocatorHelper.compile_path("id=grid|name=第3行")
+        self.assertEqual([(item.type, item.value) for item in path], [("id", "grid"), ("name", "第3行")])
+        self.assertEqual(path[0].backend_key, "automation_id")
+
+    def test_segments_are_stripped(self):
+        """测试每段的类型和值两侧的空白被忽略"""
+        path = LocatorHelper.compile_path(" ID = x | Name=y")
+        self.assertEqual([(item.type, item.value) for item in path], [("id", "x"), ("name", "y")])
+
+    def test_not_a_path(self):
+        """测试不是分层定位器时返回空元组"""
+        self.assertEqual(LocatorHelper.compile_path("id=btn_login"), ())
+        # 标题中的'|'不是分隔符
+        self.assertEqual(LocatorHelper.compile_path("title=a|b"), ())
+        self.assertEqual(LocatorHelper.compile_path("id=a|name= "), ())
+        self.assertEqual(LocatorHelper.compile_path("id=a|unknown=b"), ())
+
+
+class TestWaitStrategyBackoff(unittest.TestCase):
+    """测试WaitStrategy.wait_until的指数退避策略"""
+
+    def setUp(self):
+        """初始化测试环境"""
+        self.calls = 0
+
+    def _after(self, count):
+        """返回第count次调用时才满足的条件"""
+        def condition():
+            self.calls += 1
+            return self.calls >= count
+        return condition
+
+    def test_immediate_success_does_not_sleep(self):
+        """测试条件立即满足时不等待"""
+        with patch("time.sleep") as mock_sleep:
+            self.assertTrue(WaitStrategy.wait_until(self._after(1), 5, None, policy="exp"))
+        mock_sleep.assert_not_called()
+
+    def test_intervals_grow_to_maximum(self):
+        """测试检查间隔按BACKOFF_FACTOR增长且不超过BACKOFF_MAX_INTERVAL"""
+        with patch("time.sleep") as mock_sleep:
+            self.assertTrue(WaitStrategy.wait_until(self._after(15), 60, None, policy="exp"))
+        intervals = [call[0][0] for call in mock_sleep.call_args_list]
+        self.assertEqual(len(intervals), 14)
+        self.assertAlmostEqual(intervals[0], BACKOFF_INITIAL_INTERVAL)
+        self.assertAlmostEqual(intervals[1], BACKOFF_INITIAL_INTERVAL * BACKOFF_FACTOR)
+        self.assertEqual(intervals, sorted(intervals))
+        self.assertAlmostEqual(intervals[-1], BACKOFF_MAX_INTERVAL)
+
+    def test_timeout(self):
+        """测试超时返回False，条件中的异常视为未满足"""
+        def condition():
+            raise RuntimeError("not ready")
+        self.assertFalse(WaitStrategy.wait_until(condition, 0.05, None, policy="exp"))
+
+    def test_unknown_policy(self):
+        """测试未知的策略抛出ValueError"""
+        with self.assertRaises(ValueError):
+            WaitStrategy.wait_until(self._after(1), 1, None, policy="linear")
+
+
+
+class TestKeywordInfoEnabled(unittest.TestCase):
+    """测试keyword_info_enabled按全局配置决定关键字是否输出INFO日志"""
+
+    def test_follows_global_config(self):
+        """测试verbose_keyword_logs和log_level修改后立即生效"""
+        cases = [
+            (True, "info", True),
+            (True, "DEBUG", True),
+            (True, "warn", False),
+            (False, "info", False),
+        ]
+        for verbose, level, expected in cases:
+            with self.subTest(verbose=verbose, level=level):
+                with patch.object(global_config, "verbose_keyword_logs", verbose), \
+                        patch.object(global_config, "log_level", level):
+                    self.assertEqual(keyword_info_enabled(), expected)
+
+if __name__ == "__main__":
+    unittest.main()
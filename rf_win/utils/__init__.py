@@ -1,14 +1,15 @@
 # 工具模块初始化文件
 
-from .locator_helper import LocatorHelper, locator_helper
+from .locator_helper import LocatorHelper, ParsedLocator, locator_helper
 from .wait_strategy import WaitStrategy, wait_strategy
 from .cache_manager import CacheManager, application_cache, window_cache, control_cache, locator_cache
-from .dpi_adapter import DPIAdapter, dpi_adapter
-from .logger import Logger, logger
+from .dpi_adapter import DPIAdapter, Point, dpi_adapter
+from .logger import Logger, keyword_info_enabled, logger
 
 __all__ = [
     # 定位器助手
     "LocatorHelper",
+    "ParsedLocator",
     "locator_helper",
     # 智能等待策略
     "WaitStrategy",
@@ -21,8 +22,10 @@ __all__ = [
     "locator_cache",
     # 高DPI适配器
     "DPIAdapter",
+    "Point",
     "dpi_adapter",
     # 日志工具
     "Logger",
+    "keyword_info_enabled",
     "logger"
 ]
@@ -1,9 +1,13 @@
 # 缓存管理器模块
 # 管理窗口和控件对象的缓存，提高自动化执行效率
 
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Hashable, Optional, List
+import threading
 import time
 
+# 每个缓存管理器的最大分片数
+CACHE_SHARDS = 16
+
 class CacheItem:
     """缓存项类"""
     
@@ -36,7 +40,15 @@ class CacheItem:
         return max(0, remaining)
 
 class CacheManager:
-    """缓存管理器类"""
+    """缓存管理器类
+    
+    缓存项按键的哈希值分布到多个分片中，每个分片使用独立的锁，
+    并行执行的线程访问不同的键时不会互相阻塞；
+    分片字典按最近使用顺序排列，缓存项总数超过max_size时淘汰分片中最久未使用的缓存项。
+    
+    被删除的缓存项在释放分片锁之后才释放引用，缓存值的析构函数或weakref.finalize
+    回调再次访问缓存时不会在同一把锁上死锁
+    """
     
     def __init__(self, max_size: int = 100, default_expire_time: float = 10.0):
         """初始化缓存管理器
@@ -45,9 +57,44 @@ class CacheManager:
             max_size: 最大缓存数量
             default_expire_time: 默认过期时间（秒）
         """
-        self._cache: Dict[str, CacheItem] = {}
         self.max_size = max_size
         self.default_expire_time = default_expire_time
+        # 分片数为2的幂，按hash(key) & _mask选择分片
+        shards = 1
+        while shards < min(CACHE_SHARDS, max(1, max_size)):
+            shards <<= 1
+        self._mask = shards - 1
+        self._shards: List[Dict[Hashable, CacheItem]] = [{} for _ in range(shards)]
+        self._locks: List[threading.Lock] = [threading.Lock() for _ in range(shards)]
+        # 所有分片的缓存项总数，容量限制作用于整个缓存而不是单个分片
+        self._size = 0
+        self._size_lock = threading.Lock()
+    
+    def _shard(self, key: Hashable) -> int:
+        """获取键所在的分片下标
+        
+        Args:
+            key: 缓存键
+            
+        Returns:
+            分片下标
+        """
+        return hash(key) & self._mask
+    
+    def _add_size(self, delta: int) -> int:
+        """调整缓存项总数
+        
+        Args:
+            delta: 增加的数量，删除时为负数
+            
+        Returns:
+            调整后的总数
+        """
+        if not delta:
+            return self._size
+        with self._size_lock:
+            self._size += delta
+            return self._size
     
     def set(self, key: str, value: Any, expire_time: Optional[float] = None) -> None:
         """设置缓存
@@ -60,11 +107,37 @@ class CacheManager:
         if expire_time is None:
             expire_time = self.default_expire_time
         
-        # 检查缓存大小，超过则删除最旧的缓存项
-        if len(self._cache) >= self.max_size:
-            self._remove_oldest()
+        index = self._shard(key)
+        shard = self._shards[index]
+        with self._locks[index]:
+            # 被替换的旧值在释放锁之后才释放
+            replaced = shard.pop(key, None)
+            shard[key] = CacheItem(value, expire_time)
+        if replaced is None and self._add_size(1) > self.max_size:
+            self._evict(index)
+    
+    def _evict(self, start: int) -> None:
+        """缓存项总数超过max_size时，从start开始依次在各分片中淘汰过期和最久未使用的缓存项
         
-        self._cache[key] = CacheItem(value, expire_time)
+        每次只持有一个分片的锁
+        
+        Args:
+            start: 首先淘汰的分片下标，通常为刚插入缓存项的分片
+        """
+        shard_count = len(self._shards)
+        for offset in range(shard_count):
+            if self._size <= self.max_size:
+                return
+            index = (start + offset) & self._mask
+            shard = self._shards[index]
+            with self._locks[index]:
+                removed = self._clean_expired(shard)
+                # 刚插入的缓存项位于分片末尾，分片中只剩它时不淘汰
+                if len(shard) > 1 or (offset and shard):
+                    oldest_key = next(iter(shard))
+                    removed.append(shard.pop(oldest_key))
+            self._add_size(-len(removed))
+            del removed
     
     def get(self, key: str) -> Optional[Any]:
         """获取缓存
@@ -75,15 +148,20 @@ class CacheManager:
         Returns:
             缓存值，如果缓存不存在或已过期则返回None
         """
-        if key not in self._cache:
-            return None
-        
-        cache_item = self._cache[key]
-        if cache_item.is_expired():
-            # 删除过期缓存
-            del self._cache[key]
+        index = self._shard(key)
+        shard = self._shards[index]
+        with self._locks[index]:
+            cache_item = shard.get(key)
+            if cache_item is None:
+                return None
+            # 删除过期缓存，或移到分片末尾记录为最近使用
+            del shard[key]
+            expired = cache_item.is_expired()
+            if not expired:
+                shard[key] = cache_item
+        if expired:
+            self._add_size(-1)
             return None
-        
         return cache_item.value
     
     def exists(self, key: str) -> bool:
@@ -95,14 +173,19 @@ class CacheManager:
         Returns:
             缓存是否存在且未过期
         """
-        if key not in self._cache:
-            return False
-        
-        if self._cache[key].is_expired():
-            # 删除过期缓存
-            del self._cache[key]
+        index = self._shard(key)
+        shard = self._shards[index]
+        with self._locks[index]:
+            cache_item = shard.get(key)
+            if cache_item is None:
+                return False
+            expired = cache_item.is_expired()
+            if expired:
+                # 删除过期缓存
+                del shard[key]
+        if expired:
+            self._add_size(-1)
             return False
-        
         return True
     
     def remove(self, key: str) -> bool:
@@ -114,14 +197,22 @@ class CacheManager:
         Returns:
             是否删除成功
         """
-        if key in self._cache:
-            del self._cache[key]
-            return True
-        return False
+        index = self._shard(key)
+        with self._locks[index]:
+            cache_item = self._shards[index].pop(key, None)
+        if cache_item is None:
+            return False
+        self._add_size(-1)
+        return True
     
     def clear(self) -> None:
         """清空所有缓存"""
-        self._cache.clear()
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                removed = list(shard.values())
+                shard.clear()
+            self._add_size(-len(removed))
+            del removed
     
     def get_size(self) -> int:
         """获取当前缓存大小
@@ -129,9 +220,15 @@ class CacheManager:
         Returns:
             当前缓存大小
         """
-        # 先清理过期缓存
-        self._clean_expired()
-        return len(self._cache)
+        size = 0
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                # 先清理过期缓存
+                removed = self._clean_expired(shard)
+                size += len(shard)
+            self._add_size(-len(removed))
+            del removed
+        return size
     
     def get_keys(self) -> List[str]:
         """获取所有缓存键
@@ -139,30 +236,60 @@ class CacheManager:
         Returns:
             缓存键列表
         """
-        # 先清理过期缓存
-        self._clean_expired()
-        return list(self._cache.keys())
-    
-    def _clean_expired(self) -> None:
-        """清理过期缓存"""
-        expired_keys = [key for key, item in self._cache.items() if item.is_expired()]
-        for key in expired_keys:
-            del self._cache[key]
+        keys: List[str] = []
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                # 先清理过期缓存
+                removed = self._clean_expired(shard)
+                keys.extend(shard)
+            self._add_size(-len(removed))
+            del removed
+        return keys
     
-    def _remove_oldest(self) -> None:
-        """删除最旧的缓存项"""
-        if not self._cache:
-            return
+    def remove_if(self, predicate: Callable[[Any], bool]) -> int:
+        """删除值满足条件的缓存项
         
-        # 清理过期缓存
-        self._clean_expired()
+        条件在分片锁之外求值，求值期间被替换的缓存项不会被删除
         
-        if not self._cache:
-            return
+        Args:
+            predicate: 接收缓存值，返回True表示删除
+            
+        Returns:
+            删除的缓存项数量
+        """
+        removed_count = 0
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                removed = self._clean_expired(shard)
+                items = list(shard.items())
+            self._add_size(-len(removed))
+            del removed
+            stale = [(key, item) for key, item in items if predicate(item.value)]
+            if not stale:
+                continue
+            count = 0
+            with lock:
+                for key, item in stale:
+                    if shard.get(key) is item:
+                        del shard[key]
+                        count += 1
+            self._add_size(-count)
+            removed_count += count
+            del stale
+        return removed_count
+    
+    @staticmethod
+    def _clean_expired(shard: Dict[Hashable, CacheItem]) -> List[CacheItem]:
+        """清理分片中的过期缓存，调用方需持有分片的锁
         
-        # 找到最旧的缓存项
-        oldest_key = min(self._cache.items(), key=lambda x: x[1].created_time)[0]
-        del self._cache[oldest_key]
+        Args:
+            shard: 缓存分片
+            
+        Returns:
+            删除的缓存项，调用方在释放锁之后再释放它们并调整缓存项总数
+        """
+        expired_keys = [key for key, item in shard.items() if item.is_expired()]
+        return [shard.pop(key) for key in expired_keys]
     
     def update_expire_time(self, key: str, expire_time: float) -> bool:
         """更新缓存过期时间
@@ -174,11 +301,13 @@ class CacheManager:
         Returns:
             是否更新成功
         """
-        if key not in self._cache:
-            return False
-        
-        self._cache[key].expire_time = expire_time
-        return True
+        index = self._shard(key)
+        with self._locks[index]:
+            cache_item = self._shards[index].get(key)
+            if cache_item is None:
+                return False
+            cache_item.expire_time = expire_time
+            return True
 
 # 创建缓存管理器实例
 # 应用缓存：保存应用对象，过期时间30秒
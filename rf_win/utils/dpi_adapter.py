@@ -1,9 +1,29 @@
 # 高DPI适配器模块
 # 处理不同DPI缩放比例下的坐标和尺寸适配
 
-from typing import Tuple, Optional
+from typing import Any, NamedTuple, Sequence, Tuple, Optional, Union
 import ctypes
 
+# 尝试导入numpy用于批量转换坐标
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+class Point(NamedTuple):
+    """屏幕坐标点
+    
+    不可变的(x, y)元组，可按下标、属性或"x"/"y"键访问，与返回坐标字典的旧接口兼容
+    """
+    x: int
+    y: int
+    
+    def __getitem__(self, key: Union[int, slice, str]) -> Any:
+        if isinstance(key, str):
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
 class DPIAdapter:
     """高DPI适配器类"""
     
@@ -30,6 +50,15 @@ class DPIAdapter:
             # 默认返回1.0
             return 1.0
     
+    def refresh(self) -> float:
+        """重新读取系统DPI缩放比例，DPI变化后调用
+        
+        Returns:
+            新的DPI缩放比例
+        """
+        self._dpi_scale = self._get_system_dpi_scale()
+        return self._dpi_scale
+    
     def get_dpi_scale(self) -> float:
         """获取当前DPI缩放比例
         
@@ -50,6 +79,42 @@ class DPIAdapter:
         """
         return (int(x * self._dpi_scale), int(y * self._dpi_scale))
     
+    def logical_to_physical(self, x: int, y: int) -> Tuple[int, int]:
+        """将逻辑坐标转换为物理坐标，同adapt_coordinate
+        
+        Args:
+            x: 逻辑X坐标
+            y: 逻辑Y坐标
+            
+        Returns:
+            物理坐标 (x, y)
+        """
+        scale = self._dpi_scale
+        return (int(x * scale), int(y * scale))
+    
+    def logical_to_physical_many(self, xs: Sequence[float], ys: Sequence[float]) -> Tuple[Any, Any]:
+        """批量将逻辑坐标转换为物理坐标
+        
+        numpy可用时将所有坐标放入一个数组一次相乘，适合鼠标轨迹等大量坐标点
+        
+        Args:
+            xs: 逻辑X坐标序列
+            ys: 逻辑Y坐标序列
+            
+        Returns:
+            物理坐标 (xs, ys)，numpy可用时为int32数组，否则为列表
+        
+        Example:
+            xs, ys = dpi_adapter.logical_to_physical_many([0, 50, 100], [0, 25, 50])
+        """
+        scale = self._dpi_scale
+        if NUMPY_AVAILABLE:
+            points = np.array((xs, ys), dtype=np.float64)
+            points *= scale
+            physical = points.astype(np.int32)
+            return physical[0], physical[1]
+        return [int(x * scale) for x in xs], [int(y * scale) for y in ys]
+    
     def adapt_size(self, width: int, height: int) -> Tuple[int, int]:
         """将逻辑尺寸适配到当前DPI
         
@@ -74,6 +139,19 @@ class DPIAdapter:
         """
         return (int(x / self._dpi_scale), int(y / self._dpi_scale))
     
+    def physical_to_logical(self, x: int, y: int) -> Point:
+        """将物理坐标转换为逻辑坐标，同reverse_coordinate
+        
+        Args:
+            x: 物理X坐标
+            y: 物理Y坐标
+            
+        Returns:
+            逻辑坐标 Point(x, y)
+        """
+        scale = self._dpi_scale
+        return Point(int(x / scale), int(y / scale))
+    
     def reverse_size(self, width: int, height: int) -> Tuple[int, int]:
         """将物理尺寸转换为逻辑尺寸
         
@@ -1,9 +1,31 @@
 # 定位器助手模块
 # 提供定位器解析、生成和图形化拾取功能
 
-from typing import Dict, Any, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Any, NamedTuple, Optional, Tuple
 import re
 
+# 定位器类型对应的UIA属性ID，xpath没有对应的单一属性
+LOCATOR_PROPERTY_IDS = {
+    "id": 30011,
+    "name": 30005,
+    "class": 30012,
+    "title": 30005,
+}
+
+# 分层定位器的分隔符，如"id=grid|name=第3行|class=Edit"
+PATH_SEPARATOR = "|"
+
+class ParsedLocator(NamedTuple):
+    """预先解析的定位器
+    
+    由LocatorHelper.compile生成并缓存，可哈希，驱动直接使用其中的字段而无需再次解析字符串
+    """
+    type: str
+    value: str
+    backend_key: str
+    property_id: Optional[int]
+
 class LocatorHelper:
     """定位器助手类"""
     
@@ -60,6 +82,55 @@ class LocatorHelper:
                 "backend_key": "title"
             }
     
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def compile(locator: str) -> ParsedLocator:
+        """解析定位器字符串为ParsedLocator并缓存结果
+        
+        同一定位器反复使用时只解析一次，同时预先查好对应的UIA属性ID
+        
+        Args:
+            locator: 定位器字符串
+            
+        Returns:
+            解析后的定位器
+        
+        Raises:
+            ValueError: 定位器为空或类型未知
+        
+        Examples:
+            >>> LocatorHelper.compile("id=btn_login")
+            ParsedLocator(type='id', value='btn_login', backend_key='automation_id', property_id=30011)
+        """
+        parsed = LocatorHelper.parse_locator(locator)
+        return ParsedLocator(parsed["type"], parsed["value"], parsed["backend_key"], LOCATOR_PROPERTY_IDS.get(parsed["type"]))
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def compile_path(locator: str) -> Tuple[ParsedLocator, ...]:
+        """解析以PATH_SEPARATOR分隔的分层定位器并缓存结果
+        
+        每一段都必须带有已知的类型前缀，否则视为普通定位器（标题中可能含有"|"）
+        
+        Args:
+            locator: 定位器字符串
+            
+        Returns:
+            每一层的ParsedLocator，不是分层定位器时返回空元组
+        
+        Examples:
+            >>> LocatorHelper.compile_path("id=grid|name=第3行")
+            (ParsedLocator(type='id', value='grid', ...), ParsedLocator(type='name', value='第3行', ...))
+        """
+        segments = locator.split(PATH_SEPARATOR)
+        if len(segments) < 2:
+            return ()
+        for segment in segments:
+            locator_type, separator, value = segment.partition("=")
+            if not separator or not value.strip() or locator_type.strip().lower() not in LocatorHelper.LOCATOR_TYPES:
+                return ()
+        return tuple(LocatorHelper.compile(segment) for segment in segments)
+    
     @staticmethod
     def generate_locator(locator_type: str, value: str) -> str:
         """生成定位器字符串
@@ -6,6 +6,24 @@ import os
 from datetime import datetime
 from typing import Optional, Dict, Any
 
+from ..config.global_config import global_config
+
+# 日志级别常量，便于调用方在格式化参数前先检查级别
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+ERROR = logging.ERROR
+
+# 输出INFO日志的日志级别
+_INFO_LEVELS = frozenset(("TRACE", "DEBUG", "INFO"))
+
+def keyword_info_enabled() -> bool:
+    """关键字是否输出INFO日志，不输出时关键字跳过日志消息的格式化
+    
+    由global_config的verbose_keyword_logs和log_level决定，通过Set Global Config修改后立即生效
+    """
+    return global_config.verbose_keyword_logs and global_config.log_level.upper() in _INFO_LEVELS
+
 class Logger:
     """日志工具类"""
     
@@ -25,6 +43,8 @@ class Logger:
         self.logger = logging.getLogger(name)
         self.logger.setLevel(self.level)
         self.logger.handlers.clear()
+        # 缓存INFO级别是否启用，关键字可直接读取此属性跳过日志调用
+        self.info_enabled = self.logger.isEnabledFor(logging.INFO)
         
         # 创建日志格式
         formatter = logging.Formatter(
@@ -49,59 +69,82 @@ class Logger:
             file_handler.setFormatter(formatter)
             self.logger.addHandler(file_handler)
     
-    def debug(self, message: str, **context: Any) -> None:
+    def debug(self, message: str, *args: Any, **context: Any) -> None:
         """记录调试日志
         
         Args:
-            message: 日志消息
+            message: 日志消息，可包含%风格的占位符
+            *args: 占位符参数，仅在日志级别启用时才参与格式化
             **context: 上下文信息
         """
-        self._log(logging.DEBUG, message, **context)
+        self._log(logging.DEBUG, message, *args, **context)
     
-    def info(self, message: str, **context: Any) -> None:
+    def info(self, message: str, *args: Any, **context: Any) -> None:
         """记录信息日志
         
         Args:
-            message: 日志消息
+            message: 日志消息，可包含%风格的占位符
+            *args: 占位符参数，仅在日志级别启用时才参与格式化
             **context: 上下文信息
         """
-        self._log(logging.INFO, message, **context)
+        self._log(logging.INFO, message, *args, **context)
     
-    def warn(self, message: str, **context: Any) -> None:
+    def warn(self, message: str, *args: Any, **context: Any) -> None:
         """记录警告日志
         
         Args:
-            message: 日志消息
+            message: 日志消息，可包含%风格的占位符
+            *args: 占位符参数，仅在日志级别启用时才参与格式化
             **context: 上下文信息
         """
-        self._log(logging.WARNING, message, **context)
+        self._log(logging.WARNING, message, *args, **context)
     
-    def error(self, message: str, **context: Any) -> None:
+    def error(self, message: str, *args: Any, **context: Any) -> None:
         """记录错误日志
         
         Args:
-            message: 日志消息
+            message: 日志消息，可包含%风格的占位符
+            *args: 占位符参数，仅在日志级别启用时才参与格式化
             **context: 上下文信息
         """
-        self._log(logging.ERROR, message, **context)
+        self._log(logging.ERROR, message, *args, **context)
     
-    def exception(self, message: str, **context: Any) -> None:
+    def exception(self, message: str, *args: Any, **context: Any) -> None:
         """记录异常日志
         
         Args:
-            message: 日志消息
+            message: 日志消息，可包含%风格的占位符
+            *args: 占位符参数
             **context: 上下文信息
         """
+        if args:
+            message = message % args
         self.logger.exception(self._format_message(message, **context))
     
-    def _log(self, level: int, message: str, **context: Any) -> None:
+    def isEnabledFor(self, level: int) -> bool:
+        """检查指定日志级别是否启用
+        
+        Args:
+            level: 日志级别（如logging.INFO）
+            
+        Returns:
+            是否会输出该级别的日志
+        """
+        return self.logger.isEnabledFor(level)
+    
+    def _log(self, level: int, message: str, *args: Any, **context: Any) -> None:
         """记录日志
         
         Args:
             level: 日志级别
             message: 日志消息
+            *args: 占位符参数
             **context: 上下文信息
         """
+        if not self.logger.isEnabledFor(level):
+            return
+        if args:
+            message = message % args
         formatted_message = self._format_message(message, **context)
         self.logger.log(level, formatted_message)
     
@@ -130,6 +173,7 @@ class Logger:
         """
         self.level = level.upper()
         self.logger.setLevel(self.level)
+        self.info_enabled = self.logger.isEnabledFor(logging.INFO)
         
         # 更新所有处理器的日志级别
         for handler in self.logger.handlers:
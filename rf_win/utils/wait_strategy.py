@@ -4,6 +4,11 @@
 from typing import Callable, Any, Optional
 import time
 
+# policy='exp'时的初始检查间隔和最大间隔（秒），间隔每次乘以BACKOFF_FACTOR
+BACKOFF_INITIAL_INTERVAL = 0.01
+BACKOFF_MAX_INTERVAL = 0.2
+BACKOFF_FACTOR = 1.5
+
 class WaitStrategy:
     """智能等待策略类"""
     
@@ -180,19 +185,54 @@ class WaitStrategy:
         return False
     
     @staticmethod
-    def wait_until(condition_func: Callable[[], bool], timeout: float = 30.0, error_message: str = "条件未满足") -> bool:
+    def _wait_backoff(condition_func: Callable[[], bool], timeout: float) -> bool:
+        """以指数增长的间隔等待直到条件满足或超时
+        
+        第一次检查后只等待BACKOFF_INITIAL_INTERVAL，条件很快满足时几乎没有延迟；
+        间隔逐次增大到BACKOFF_MAX_INTERVAL，长时间等待时检查次数也较少
+        
+        Args:
+            condition_func: 条件函数，返回True表示条件满足
+            timeout: 超时时间（秒）
+        
+        Returns:
+            条件是否在超时内满足
+        """
+        deadline = time.monotonic() + timeout
+        interval = BACKOFF_INITIAL_INTERVAL
+        while True:
+            try:
+                if condition_func():
+                    return True
+            except Exception:
+                # 忽略异常，继续等待
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(interval, remaining))
+            interval = min(interval * BACKOFF_FACTOR, BACKOFF_MAX_INTERVAL)
+    
+    @staticmethod
+    def wait_until(condition_func: Callable[[], bool], timeout: float = 30.0, error_message: Optional[str] = "条件未满足", policy: str = "fixed") -> bool:
         """等待直到条件满足或超时
         
         Args:
             condition_func: 条件函数，返回True表示条件满足
             timeout: 超时时间（秒）
-            error_message: 超时错误信息
+            error_message: 超时错误信息，为None时不记录日志
+            policy: 检查间隔策略，fixed为固定0.5秒，exp为指数退避
         
         Returns:
             条件是否在超时内满足
         """
-        result = WaitStrategy._wait_until(condition_func, timeout, 0.5)
-        if not result:
+        if policy == "exp":
+            result = WaitStrategy._wait_backoff(condition_func, float(timeout))
+        elif policy == "fixed":
+            result = WaitStrategy._wait_until(condition_func, timeout, 0.5)
+        else:
+            raise ValueError(f"Unknown wait policy: {policy}")
+        if not result and error_message is not None:
             from ..utils.logger import logger
             logger.error(error_message)
         return result
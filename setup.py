@@ -23,7 +23,9 @@ install_requires = [
 
 # 定义项目可选依赖项
 extras_require = {
-    'excel': ['openpyxl>=3.0.0'],
+    'excel': ['openpyxl>=3.0.0', 'xlsxwriter>=3.0.0', 'python-calamine>=0.2.0'],
+    'json': ['orjson>=3.0.0'],
+    'csv': ['pyarrow>=8.0.0'],
     'dev': [
         'pytest>=7.0.0',
         'pytest-cov>=3.0.0',